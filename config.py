@@ -3,16 +3,29 @@
 from datetime import datetime
 from os import getenv
 from uuid import uuid4, UUID
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet
 from lib.utils.constants.users import DateFormat
+from lib.utils.constants.validations import ValidationMode
 from lib.validators.config import (
+    validate_block_interval,
+    validate_block_size,
+    validate_cache_size,
+    validate_cache_ttl,
+    validate_card_hash_key,
     validate_card_length,
     validate_cvv_length,
     validate_end_date,
     validate_fernet_key,
+    validate_fernet_keys,
+    validate_kdf_cost,
+    validate_kdf_costs,
+    validate_kdf_max_pending,
+    validate_kdf_workers,
     validate_salt_value,
     validate_session_id,
     validate_start_date,
+    validate_validation_mode,
+    validate_validation_sample_rate,
 )
 
 
@@ -24,8 +37,20 @@ class AppConfig:
     __end_date__ = datetime.now()
     __SALT_VALUE__ = UUID("0c923c48-aea7-48ce-a609-17fb120bf667")
     __FERNET_KEY__ = getenv("FERNET_KEY")
+    __FERNET_PREVIOUS_KEYS__ = getenv("FERNET_PREVIOUS_KEYS", "")
+    __CARD_HASH_KEY__ = getenv("CARD_HASH_KEY")
     __CARD_LENGTH__ = 13
     __CVV_LENGTH__ = 3
+    __BLOCK_SIZE__ = 100
+    __BLOCK_INTERVAL__ = 1000
+    __VALIDATION_MODE__ = getenv("VALIDATION_MODE", ValidationMode.FULL.value)
+    __VALIDATION_SAMPLE_RATE__ = getenv("VALIDATION_SAMPLE_RATE", "0.1")
+    __CACHE_SIZE__ = getenv("CACHE_SIZE", "1024")
+    __CACHE_TTL__ = getenv("CACHE_TTL", "300")
+    __KDF_COST__ = getenv("KDF_COST", "14")
+    __KDF_PREVIOUS_COSTS__ = getenv("KDF_PREVIOUS_COSTS", "")
+    __KDF_WORKERS__ = getenv("KDF_WORKERS", "2")
+    __KDF_MAX_PENDING__ = getenv("KDF_MAX_PENDING", "32")
     __TCP_PORT__ = 42424
     __HTTP_PORT__ = 10443
 
@@ -83,3 +108,100 @@ class AppConfig:
         """Getter: Fernet Key."""
 
         return Fernet(validate_fernet_key(str(self.__FERNET_KEY__)))
+
+    @property
+    def fernet_keys(self) -> list[str]:
+        """Getter: Fernet Keys, the Current Key First, then Retired Keys."""
+
+        previous_keys = [
+            key.strip()
+            for key in str(self.__FERNET_PREVIOUS_KEYS__).split(",")
+            if key.strip()
+        ]
+        return validate_fernet_keys([str(self.__FERNET_KEY__), *previous_keys])
+
+    @property
+    def multi_fernet(self) -> MultiFernet:
+        """Getter: Rotatable Fernet, Encrypting with the Current Key."""
+
+        return MultiFernet([Fernet(key) for key in self.fernet_keys])
+
+    @property
+    def card_hash_key(self) -> str:
+        """Getter: Card Number Hash Key (CARD_HASH_KEY), Required.
+
+        It keys the card number hashes, so it must be kept secret, and must not
+        change once cards are issued.
+        """
+
+        return validate_card_hash_key(self.__CARD_HASH_KEY__)
+
+    @property
+    def block_size(self) -> int:
+        """Getter: Maximum Items per Block."""
+
+        return validate_block_size(self.__BLOCK_SIZE__)
+
+    @property
+    def block_interval(self) -> int:
+        """Getter: Maximum Milliseconds an Item Waits to be Blocked."""
+
+        return validate_block_interval(self.__BLOCK_INTERVAL__)
+
+    @property
+    def validation_mode(self) -> ValidationMode:
+        """Getter: Function Signature Validation Mode."""
+
+        return validate_validation_mode(str(self.__VALIDATION_MODE__))
+
+    @property
+    def validation_sample_rate(self) -> float:
+        """Getter: Share of Calls Validated in Sampled Mode."""
+
+        return validate_validation_sample_rate(self.__VALIDATION_SAMPLE_RATE__)
+
+    @property
+    def cache_size(self) -> int:
+        """Getter: Maximum Entries per In-Process Cache."""
+
+        return validate_cache_size(self.__CACHE_SIZE__)
+
+    @property
+    def cache_ttl(self) -> float:
+        """Getter: Seconds a Cached Entry Lives, Unless Immutable."""
+
+        return validate_cache_ttl(self.__CACHE_TTL__)
+
+    @property
+    def kdf_cost(self) -> int:
+        """Getter: Password KDF Cost (scrypt N = 2**cost)."""
+
+        return validate_kdf_cost(self.__KDF_COST__)
+
+    @property
+    def kdf_previous_costs(self) -> list[int]:
+        """Getter: Previous Password KDF Costs, still Accepted on Login.
+
+        Only legacy user IDs are re-hashed, so a cost users were created at must
+        stay.
+        """
+
+        return validate_kdf_costs(
+            [
+                cost.strip()
+                for cost in str(self.__KDF_PREVIOUS_COSTS__).split(",")
+                if cost.strip()
+            ]
+        )
+
+    @property
+    def kdf_workers(self) -> int:
+        """Getter: Password KDF Processes (0 Derives in the Calling Thread)."""
+
+        return validate_kdf_workers(self.__KDF_WORKERS__)
+
+    @property
+    def kdf_max_pending(self) -> int:
+        """Getter: Maximum Callers Waiting on the Password KDF Processes."""
+
+        return validate_kdf_max_pending(self.__KDF_MAX_PENDING__)
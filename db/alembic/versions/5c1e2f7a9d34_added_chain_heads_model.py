@@ -0,0 +1,47 @@
+"""Added Chain Heads Model
+
+Revision ID: 5c1e2f7a9d34
+Revises: 83a5ef5c0629
+Create Date: 2024-06-18 19:02:41.118245
+
+"""
+
+from typing import Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e2f7a9d34"
+down_revision: Union[str, None] = "83a5ef5c0629"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    chain_heads = op.create_table(
+        "chain_heads",
+        sa.Column("id", sa.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("chain_id", sa.String(256), unique=True, nullable=False),
+        sa.Column("block_id", sa.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            "created_date",
+            sa.DateTime,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_date",
+            sa.DateTime,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            onupdate=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        schema="blockchain",
+    )
+    op.bulk_insert(chain_heads, [{"id": uuid4(), "chain_id": "main"}])
+
+
+def downgrade() -> None:
+    op.drop_table("chain_heads", schema="blockchain")
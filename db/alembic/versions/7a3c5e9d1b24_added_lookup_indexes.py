@@ -0,0 +1,60 @@
+"""Added Public ID and Foreign Key Lookup Indexes
+
+Revision ID: 7a3c5e9d1b24
+Revises: f2c7a9e4b180
+Create Date: 2024-07-02 09:26:41.518730
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3c5e9d1b24"
+down_revision: Union[str, None] = "f2c7a9e4b180"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (schema, table, column): public IDs, read by the serialisers' get operations.
+unique_indexes = [
+    ("blockchain", "blocks", "block_id"),
+    ("blockchain", "transactions", "transaction_id"),
+    ("blockchain", "contracts", "contract_id"),
+    ("users", "payment_profiles", "payment_id"),
+    ("users", "user_profiles", "profile_id"),
+    ("users", "settings_profiles", "settings_id"),
+    ("warehouse", "login_history", "login_id"),
+    ("warehouse", "cards", "card_id"),
+]
+
+# (schema, table, column): foreign keys and block links, read by joins and
+# relationship loads.
+indexes = [
+    ("blockchain", "blocks", "previous_block_id"),
+    ("blockchain", "blocks", "next_block_id"),
+    ("blockchain", "transactions", "sender"),
+    ("blockchain", "transactions", "receiver"),
+    ("blockchain", "contracts", "contractor"),
+    ("blockchain", "contracts", "contractee"),
+    ("users", "accounts", "user_id"),
+    ("users", "payment_profiles", "account_id"),
+    ("users", "payment_profiles", "card_id"),
+    ("users", "user_profiles", "account_id"),
+    ("users", "settings_profiles", "account_id"),
+    ("warehouse", "login_history", "user_id"),
+]
+
+
+def upgrade() -> None:
+    for schema, table, column in unique_indexes:
+        op.create_index(
+            f"ix_{table}_{column}", table, [column], unique=True, schema=schema
+        )
+    for schema, table, column in indexes:
+        op.create_index(f"ix_{table}_{column}", table, [column], schema=schema)
+
+
+def downgrade() -> None:
+    for schema, table, column in reversed(indexes + unique_indexes):
+        op.drop_index(f"ix_{table}_{column}", table, schema=schema)
@@ -0,0 +1,42 @@
+"""Added Block Hashes
+
+Revision ID: 9e4b7d21c6a8
+Revises: 5c1e2f7a9d34
+Create Date: 2024-06-20 21:14:03.552106
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b7d21c6a8"
+down_revision: Union[str, None] = "5c1e2f7a9d34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "blocks",
+        sa.Column("merkle_root", sa.String(256), nullable=True),
+        schema="blockchain",
+    )
+    op.add_column(
+        "blocks",
+        sa.Column("previous_block_hash", sa.String(256), nullable=True),
+        schema="blockchain",
+    )
+    op.add_column(
+        "blocks",
+        sa.Column("block_hash", sa.String(256), nullable=True),
+        schema="blockchain",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("blocks", "block_hash", schema="blockchain")
+    op.drop_column("blocks", "previous_block_hash", schema="blockchain")
+    op.drop_column("blocks", "merkle_root", schema="blockchain")
@@ -0,0 +1,156 @@
+"""Backfilled Block Merkle Roots
+
+Revision ID: a4d2c8e6f913
+Revises: e5b09a7c3f18
+Create Date: 2024-07-10 09:26:41.318077
+
+"""
+
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from lib.utils.encryption.encoders import get_merkle_root
+from models.blockchain.contracts import Contract
+from models.blockchain.items import BlockItem
+from models.blockchain.transactions import Transaction
+from models.model import as_column
+from serialisers.blockchain.blocks import BlockSerialiser
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d2c8e6f913"
+down_revision: Union[str, None] = "e5b09a7c3f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+blocks = sa.table(
+    "blocks",
+    sa.column("id", sa.UUID(as_uuid=True)),
+    sa.column("block_id", sa.UUID(as_uuid=True)),
+    sa.column("merkle_root", sa.String),
+    sa.column("previous_block_hash", sa.String),
+    sa.column("block_hash", sa.String),
+    sa.column("block_height", sa.BigInteger),
+    schema="blockchain",
+)
+block_items = sa.table(
+    "block_items",
+    sa.column("block_id", sa.UUID(as_uuid=True)),
+    schema="blockchain",
+)
+
+
+# Blocks sealed before the block items were backfilled have no merkle root, so
+# their roots are computed from their items' payload hashes (as verify_chain
+# does), a batch at a time in primary key order. Returns the lowest height
+# whose root was set, from which the chain's hashes must be recomputed.
+def backfill_merkle_roots(connection: Connection) -> Optional[int]:
+    update_query = (
+        sa.update(blocks)
+        .where(blocks.c.id == sa.bindparam("row_id"))
+        .values(merkle_root=sa.bindparam("root"))
+    )
+    first_height: Optional[int] = None
+    last_id = None
+    with Session(bind=connection) as session:
+        while True:
+            query = (
+                sa.select(blocks.c.id, blocks.c.block_height)
+                .where(blocks.c.merkle_root.is_(None))
+                .where(sa.exists().where(block_items.c.block_id == blocks.c.id))
+                .order_by(blocks.c.id)
+                .limit(BACKFILL_BATCH_SIZE)
+            )
+            if last_id is not None:
+                query = query.where(blocks.c.id > last_id)
+            rows = connection.execute(query).all()
+            if not rows:
+                return first_height
+
+            item_query = (
+                sa.select(as_column(BlockItem.block_id), Transaction, Contract)
+                .select_from(BlockItem)
+                .outerjoin(
+                    Transaction, as_column(Transaction.id) == BlockItem.transaction_id
+                )
+                .outerjoin(Contract, as_column(Contract.id) == BlockItem.contract_id)
+                .filter(as_column(BlockItem.block_id).in_([row.id for row in rows]))
+                .order_by(as_column(BlockItem.block_id), as_column(BlockItem.position))
+            )
+            item_hashes: dict = {row.id: [] for row in rows}
+            for block_id, transaction, contract in session.execute(item_query):
+                item_hashes[block_id].append((transaction or contract).to_hash())
+            session.expunge_all()
+
+            connection.execute(
+                update_query,
+                [
+                    {"row_id": row.id, "root": get_merkle_root(item_hashes[row.id])}
+                    for row in rows
+                ],
+            )
+            heights = [row.block_height for row in rows if row.block_height]
+            if first_height is not None:
+                heights.append(first_height)
+            first_height = min(heights, default=None)
+            last_id = rows[-1].id
+
+
+# Rehashes every block from the given height on, in height order, the same way
+# BlockSerialiser.append_blocks does, onto the hash of the block before it.
+def backfill_block_hashes(connection: Connection, first_height: int) -> None:
+    update_query = (
+        sa.update(blocks)
+        .where(blocks.c.id == sa.bindparam("row_id"))
+        .values(
+            previous_block_hash=sa.bindparam("previous_hash"),
+            block_hash=sa.bindparam("hash"),
+        )
+    )
+    previous_hash = connection.execute(
+        sa.select(blocks.c.block_hash).where(blocks.c.block_height == first_height - 1)
+    ).scalar_one_or_none()
+    block_height = first_height - 1
+    while True:
+        rows = connection.execute(
+            sa.select(
+                blocks.c.id,
+                blocks.c.block_id,
+                blocks.c.merkle_root,
+                blocks.c.block_height,
+            )
+            .where(blocks.c.block_height > block_height)
+            .order_by(blocks.c.block_height)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+
+        parameters = []
+        for row in rows:
+            block_hash = BlockSerialiser.get_block_hash(
+                row.block_id, row.merkle_root, previous_hash
+            )
+            parameters.append(
+                {"row_id": row.id, "previous_hash": previous_hash, "hash": block_hash}
+            )
+            previous_hash = block_hash
+        connection.execute(update_query, parameters)
+        block_height = rows[-1].block_height
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    first_height = backfill_merkle_roots(connection)
+    if first_height is not None:
+        backfill_block_hashes(connection, first_height)
+
+
+def downgrade() -> None:
+    pass
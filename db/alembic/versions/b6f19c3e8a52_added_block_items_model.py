@@ -0,0 +1,75 @@
+"""Added Block Items Model
+
+Revision ID: b6f19c3e8a52
+Revises: d3a8f0b5e217
+Create Date: 2024-06-27 20:11:36.704519
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b6f19c3e8a52"
+down_revision: Union[str, None] = "d3a8f0b5e217"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing single-payload blocks become one-item blocks.
+backfill_block_items_sql = """
+    INSERT INTO blockchain.block_items
+        (id, block_id, transaction_id, contract_id, position, created_date)
+    SELECT gen_random_uuid(), id, transaction_id, contract_id, 0, created_date
+    FROM blockchain.blocks
+    WHERE transaction_id IS NOT NULL OR contract_id IS NOT NULL;
+    """
+
+
+def upgrade() -> None:
+    op.create_table(
+        "block_items",
+        sa.Column("id", sa.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column(
+            "block_id",
+            sa.UUID(as_uuid=True),
+            sa.ForeignKey("blockchain.blocks.id"),
+            nullable=False,
+        ),
+        sa.Column(
+            "transaction_id",
+            sa.UUID(as_uuid=True),
+            sa.ForeignKey("blockchain.transactions.id"),
+            unique=True,
+            nullable=True,
+        ),
+        sa.Column(
+            "contract_id",
+            sa.UUID(as_uuid=True),
+            sa.ForeignKey("blockchain.contracts.id"),
+            unique=True,
+            nullable=True,
+        ),
+        sa.Column("position", sa.Integer, nullable=False),
+        sa.Column(
+            "created_date",
+            sa.DateTime,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "(transaction_id IS NULL) <> (contract_id IS NULL)",
+            name="block_items_payload_check",
+        ),
+        schema="blockchain",
+    )
+    op.create_index(
+        "ix_block_items_block_id", "block_items", ["block_id"], schema="blockchain"
+    )
+    op.execute(backfill_block_items_sql)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_block_items_block_id", "block_items", schema="blockchain")
+    op.drop_table("block_items", schema="blockchain")
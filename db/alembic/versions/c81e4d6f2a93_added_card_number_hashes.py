@@ -0,0 +1,86 @@
+"""Added Card Number Hashes
+
+Revision ID: c81e4d6f2a93
+Revises: 7a3c5e9d1b24
+Create Date: 2024-07-04 14:52:08.663190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from lib.utils.cards.numbers import get_card_number_hash
+from lib.utils.encryption.cryptography import CryptoProvider
+
+# revision identifiers, used by Alembic.
+revision: str = "c81e4d6f2a93"
+down_revision: Union[str, None] = "7a3c5e9d1b24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+cards = sa.table(
+    "cards",
+    sa.column("id", sa.UUID(as_uuid=True)),
+    sa.column("card_number", sa.String),
+    sa.column("card_number_hash", sa.String),
+    schema="warehouse",
+)
+
+
+# Card numbers are encrypted, so existing cards cannot be hashed in SQL; they
+# are decrypted and hashed here, a batch at a time in primary key order.
+def backfill_card_number_hashes() -> None:
+    connection = op.get_bind()
+    update_query = (
+        sa.update(cards)
+        .where(cards.c.id == sa.bindparam("card_id"))
+        .values(card_number_hash=sa.bindparam("card_number_hash"))
+    )
+    last_id = None
+    while True:
+        query = (
+            sa.select(cards.c.id, cards.c.card_number)
+            .order_by(cards.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(cards.c.id > last_id)
+        rows = connection.execute(query).all()
+        if not rows:
+            return
+
+        card_numbers = CryptoProvider().decrypt_many([row.card_number for row in rows])
+        connection.execute(
+            update_query,
+            [
+                {"card_id": row.id, "card_number_hash": get_card_number_hash(card_number)}
+                for row, card_number in zip(rows, card_numbers)
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.add_column(
+        "cards",
+        sa.Column("card_number_hash", sa.String(256), nullable=True),
+        schema="warehouse",
+    )
+    backfill_card_number_hashes()
+    op.create_index(
+        "ix_cards_card_number_hash",
+        "cards",
+        ["card_number_hash"],
+        unique=True,
+        schema="warehouse",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cards_card_number_hash", "cards", schema="warehouse")
+    op.drop_column("cards", "card_number_hash", schema="warehouse")
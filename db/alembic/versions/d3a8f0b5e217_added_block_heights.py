@@ -0,0 +1,88 @@
+"""Added Block Heights and Verification Checkpoints
+
+Revision ID: d3a8f0b5e217
+Revises: 9e4b7d21c6a8
+Create Date: 2024-06-23 17:40:12.908351
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a8f0b5e217"
+down_revision: Union[str, None] = "9e4b7d21c6a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Walks the existing links from the genesis block, numbering and (re)hashing
+# every linked block the same way BlockSerialiser.append_blocks does.
+backfill_chain_sql = """
+    WITH RECURSIVE chain AS (
+        SELECT
+            blocks.id,
+            1::BIGINT AS block_height,
+            NULL::VARCHAR AS previous_block_hash,
+            encode(sha256(convert_to(
+                blocks.block_id::TEXT || COALESCE(blocks.merkle_root, ''), 'UTF8'
+            )), 'hex') AS block_hash
+        FROM blockchain.blocks AS blocks
+        WHERE blocks.previous_block_id IS NULL
+        AND (
+            blocks.next_block_id IS NOT NULL
+            OR blocks.id IN (SELECT block_id FROM blockchain.chain_heads)
+        )
+        UNION ALL
+        SELECT
+            blocks.id,
+            chain.block_height + 1,
+            chain.block_hash,
+            encode(sha256(convert_to(
+                chain.block_hash
+                || blocks.block_id::TEXT
+                || COALESCE(blocks.merkle_root, ''),
+                'UTF8'
+            )), 'hex')
+        FROM blockchain.blocks AS blocks
+        JOIN chain ON blocks.previous_block_id = chain.id
+    )
+    UPDATE blockchain.blocks AS blocks
+    SET
+        block_height = chain.block_height,
+        previous_block_hash = chain.previous_block_hash,
+        block_hash = chain.block_hash
+    FROM chain
+    WHERE blocks.id = chain.id;
+    """
+
+
+def upgrade() -> None:
+    op.add_column(
+        "blocks",
+        sa.Column("block_height", sa.BigInteger, unique=True, nullable=True),
+        schema="blockchain",
+    )
+    op.add_column(
+        "chain_heads",
+        sa.Column("verified_block_id", sa.UUID(as_uuid=True), nullable=True),
+        schema="blockchain",
+    )
+    op.add_column(
+        "chain_heads",
+        sa.Column(
+            "verified_height",
+            sa.BigInteger,
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        schema="blockchain",
+    )
+    op.execute(backfill_chain_sql)
+
+
+def downgrade() -> None:
+    op.drop_column("chain_heads", "verified_height", schema="blockchain")
+    op.drop_column("chain_heads", "verified_block_id", schema="blockchain")
+    op.drop_column("blocks", "block_height", schema="blockchain")
@@ -0,0 +1,30 @@
+"""Added Login Session Index
+
+Revision ID: e5b09a7c3f18
+Revises: c81e4d6f2a93
+Create Date: 2024-07-08 11:37:25.204816
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b09a7c3f18"
+down_revision: Union[str, None] = "c81e4d6f2a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_login_history_session_id",
+        "login_history",
+        ["session_id"],
+        schema="warehouse",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_login_history_session_id", "login_history", schema="warehouse")
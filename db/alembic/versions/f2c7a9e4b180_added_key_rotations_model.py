@@ -0,0 +1,47 @@
+"""Added Key Rotations Model
+
+Revision ID: f2c7a9e4b180
+Revises: b6f19c3e8a52
+Create Date: 2024-06-22 10:14:52.301877
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a9e4b180"
+down_revision: Union[str, None] = "b6f19c3e8a52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "key_rotations",
+        sa.Column("id", sa.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("table_name", sa.String(256), unique=True, nullable=False),
+        sa.Column("key_hash", sa.String(256), nullable=True),
+        sa.Column("last_id", sa.UUID(as_uuid=True), nullable=True),
+        sa.Column("rotated_rows", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column(
+            "created_date",
+            sa.DateTime,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_date",
+            sa.DateTime,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            onupdate=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        schema="warehouse",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("key_rotations", schema="warehouse")
@@ -1,32 +1,64 @@
 """Decorators: Utility Wrapper Functions."""
 
-from functools import wraps
+from functools import lru_cache, wraps
+from inspect import Parameter, signature
+from random import random
+from types import UnionType
 from typing import (
+    Callable,
+    Optional,
     Tuple,
     get_type_hints,
-    List,
-    Dict,
     Any,
     Union,
     get_origin,
     get_args,
 )
 
+from config import AppConfig
 from lib.interfaces.exceptions import ApplicationError
+from lib.utils.constants.validations import ValidationMode
+
+__VALIDATION__: dict[str, Any] = {}
+
+
+def set_validation_mode(mode: ValidationMode, sample_rate: float = 1.0) -> None:
+    """Sets how Wrapped Signatures are Checked: Full, Sampled or Disabled."""
+
+    __VALIDATION__.update({"mode": mode, "sample_rate": sample_rate})
+
+
+def get_validation_mode() -> Tuple[ValidationMode, float]:
+    """Gets the Validation Mode (Defaults to VALIDATION_MODE) and Sample Rate."""
+
+    if not __VALIDATION__:
+        config = AppConfig()
+        set_validation_mode(config.validation_mode, config.validation_sample_rate)
+    return __VALIDATION__["mode"], __VALIDATION__["sample_rate"]
 
 
 def validate_function_signature(is_method: bool = False):
     """Validates wrapped functions and methods' type hints."""
 
     def decorator(func):
+        validator: Optional[Callable[[tuple, dict], None]]
+        try:
+            validator = _compile_signature(func, is_method)
+        except NameError:
+            # Forward references (e.g. to the class being defined) resolve
+            # only once their module has loaded, so compile on first call.
+            validator = None
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            hints = get_type_hints(func)
-            if is_method and args:
-                _validate_args(*args[1:], hints=hints)
-            else:
-                _validate_args(*args, hints=hints)
-            _validate_kwargs(hints, **kwargs)
+            nonlocal validator
+            mode, sample_rate = get_validation_mode()
+            if mode is ValidationMode.FULL or (
+                mode is ValidationMode.SAMPLED and random() < sample_rate
+            ):
+                if validator is None:
+                    validator = _compile_signature(func, is_method)
+                validator(args[1:] if is_method and args else args, kwargs)
             return func(*args, **kwargs)
 
         return wrapper
@@ -34,85 +66,173 @@ def validate_function_signature(is_method: bool = False):
     return decorator
 
 
-def _validate_args(*args, hints: dict[str, Any]):
-    """Validates positional arguments."""
+def _compile_signature(func, is_method: bool) -> Callable[[tuple, dict], None]:
+    """Resolves a Function's Type Hints Once, into an Arguments Validator."""
+
+    hints = get_type_hints(func)
+    hints.pop("return", None)
+    parameters = list(signature(func).parameters.values())
+    if is_method and parameters:
+        parameters = parameters[1:]
+
+    checkers = {name: (hint, compile_type(hint)) for name, hint in hints.items()}
+    positional = [
+        (parameter.name, checkers.get(parameter.name))
+        for parameter in parameters
+        if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    var_positional = next(
+        (checkers.get(item.name) for item in parameters if item.kind is Parameter.VAR_POSITIONAL),
+        None,
+    )
+    has_var_positional = any(item.kind is Parameter.VAR_POSITIONAL for item in parameters)
+    has_var_keyword = any(item.kind is Parameter.VAR_KEYWORD for item in parameters)
+    keywords = {
+        item.name: checkers.get(item.name)
+        for item in parameters
+        if item.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+    }
+    var_keyword = next(
+        (checkers.get(item.name) for item in parameters if item.kind is Parameter.VAR_KEYWORD),
+        None,
+    )
 
-    for index, arg in enumerate(args):
-        if index >= len(hints):
+    def validator(args: tuple, kwargs: dict) -> None:
+        if len(args) > len(positional) and not has_var_positional:
             raise ApplicationError("Too many arguments provided.")
-        param_name = list(hints.keys())[index]
-        expected_type = hints[param_name]
-        if not check_type(arg, expected_type):
-            raise ApplicationError(
-                f"Invalid Argument for '{param_name}'. "
-                + f"Expected {expected_type} but got {type(arg)}."
-            )
-
-
-def _validate_kwargs(hints: dict[str, Any], **kwargs):
-    """Validates key-word arguments."""
+        for index, arg in enumerate(args):
+            if index < len(positional):
+                name, checker = positional[index]
+            else:
+                name, checker = "args", var_positional
+            if checker is not None and not checker[1](arg):
+                raise ApplicationError(
+                    f"Invalid Argument for '{name}'. "
+                    + f"Expected {checker[0]} but got {type(arg)}."
+                )
+
+        for key, value in kwargs.items():
+            if key in keywords:
+                checker = keywords[key]
+            elif has_var_keyword:
+                checker = var_keyword
+            else:
+                raise ApplicationError(f"Unexpected keyword argument '{key}'.")
+            if checker is not None and not checker[1](value):
+                raise ApplicationError(
+                    f"Invalid Keyword Argument for '{key}'. "
+                    + f"Expected {checker[0]} but got {type(value)}."
+                )
 
-    for key, value in kwargs.items():
-        if key not in hints:
-            raise ApplicationError(f"Unexpected keyword argument '{key}'.")
-        expected_type = hints[key]
-        if not check_type(value, expected_type):
-            raise ApplicationError(
-                f"Invalid Keyword Argument for '{key}'. "
-                + f"Expected {expected_type} but got {type(value)}."
-            )
+    return validator
 
 
 def check_type(value: Any, expected_type: Any) -> bool:
     """Check if the value matches the expected type, including nested and complex types."""
 
-    origin = get_origin(expected_type)
-    args = get_args(expected_type)
-    if origin is Union:
-        return any(check_type(value, t) for t in args if t is not type(None)) or (
-            value is None and type(None) in args
-        )
+    return compile_type(expected_type)(value)
+
+
+def compile_type(expected_type: Any) -> Callable[[Any], bool]:
+    """Compiles (and Caches) a Type Check for the Expected Type."""
+
+    try:
+        return __compile_type__(expected_type)
+    except TypeError:
+        return __build_type_check__(expected_type)
 
-    if origin in (list, List):
-        return __check_list__(args, value)
 
-    if origin in (dict, Dict):
-        return __check_dict__(args, value)
+@lru_cache(maxsize=None)
+def __compile_type__(expected_type: Any) -> Callable[[Any], bool]:
+    """Cached Type Check, for Hashable Types."""
+
+    return __build_type_check__(expected_type)
+
+
+def __build_type_check__(expected_type: Any) -> Callable[[Any], bool]:
+    """Builds a Type Check, Compiling any Nested Types Up Front."""
+
+    if expected_type is Any:
+        return lambda value: True
+
+    generic_check = __GENERIC_CHECKS__.get(get_origin(expected_type))
+    if generic_check is not None:
+        return generic_check(get_args(expected_type))
 
     if hasattr(expected_type, "__annotations__") and isinstance(expected_type, type):
-        return __check_complex_type__(args, value)
+        return __check_complex_type__(expected_type)
+
+    if expected_type is int:
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
 
-    if isinstance(value, bool) and expected_type is int:
-        return False
+    return lambda value: isinstance(value, expected_type)
 
-    return isinstance(value, expected_type)
 
+def __check_union__(args: Tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Checks Args of Type Union (or Optional)."""
 
-def __check_list__(args: Tuple[Any], value: list) -> bool:
+    is_optional = type(None) in args
+    checks = [compile_type(item) for item in args if item is not type(None)]
+    return lambda value: any(check(value) for check in checks) or (
+        value is None and is_optional
+    )
+
+
+def __check_list__(args: Tuple[Any, ...]) -> Callable[[Any], bool]:
     """Checks Args of Type List."""
 
-    if not isinstance(value, list):
-        return False
-    item_type = args[0]
-    return all(check_type(item, item_type) for item in value)
+    item_check = compile_type(args[0])
+    return lambda value: isinstance(value, list) and all(item_check(item) for item in value)
 
 
-def __check_dict__(args: Tuple[Any, Any], value: dict) -> bool:
-    if not isinstance(value, dict):
-        return False
-    key_type, val_type = args
-    return all(check_type(k, key_type) for k in value.keys()) and all(
-        check_type(v, val_type) for v in value.values()
+def __check_dict__(args: Tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Checks Args of Type Dict."""
+
+    key_check, value_check = compile_type(args[0]), compile_type(args[1])
+    return lambda value: isinstance(value, dict) and all(
+        key_check(key) and value_check(item) for key, item in value.items()
     )
 
 
-def __check_complex_type__(expected_type: Any, value: Any) -> bool:
-    if not isinstance(value, dict) and isinstance(value, expected_type):
-        return True
+def __check_tuple__(args: Tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Checks Args of Type Tuple."""
+
+    if len(args) == 2 and args[1] is Ellipsis:
+        item_check = compile_type(args[0])
+        return lambda value: isinstance(value, tuple) and all(
+            item_check(item) for item in value
+        )
+
+    item_checks = [compile_type(item) for item in args]
+    return lambda value: (
+        isinstance(value, tuple)
+        and len(value) == len(item_checks)
+        and all(check(item) for check, item in zip(item_checks, value))
+    )
+
+
+def __check_complex_type__(expected_type: Any) -> Callable[[Any], bool]:
+    """Checks Args of a Class or Typed Dictionary Type (Keys Compiled on First Use)."""
+
+    key_checks: list[tuple[str, Callable[[Any], bool]]] = []
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return isinstance(value, expected_type)
+        if not key_checks and expected_type.__annotations__:
+            key_checks.extend(
+                (key, compile_type(key_type))
+                for key, key_type in expected_type.__annotations__.items()
+            )
+        return all(key in value and key_check(value[key]) for key, key_check in key_checks)
+
+    return check
+
 
-    if not isinstance(value, dict):
-        return False
-    for key, key_type in expected_type.__annotations__.items():
-        if key not in value or not check_type(value[key], key_type):
-            return False
-    return True
+__GENERIC_CHECKS__: dict[Any, Callable[[Tuple[Any, ...]], Callable[[Any], bool]]] = {
+    Union: __check_union__,
+    UnionType: __check_union__,
+    list: __check_list__,
+    dict: __check_dict__,
+    tuple: __check_tuple__,
+}
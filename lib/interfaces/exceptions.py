@@ -118,3 +118,13 @@ class BlockError(Exception):
 
         super().__init__(message)
         self.message = message
+
+
+class TokenError(Exception):
+    """Custom Error For Invalid or Expired Authentication Tokens."""
+
+    def __init__(self, message: str) -> None:
+        """TokenError Constructor."""
+
+        super().__init__(message)
+        self.message = message
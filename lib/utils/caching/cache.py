@@ -0,0 +1,176 @@
+"""Caching: Read-Through Caches, over a Swappable Backend."""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import copy
+from math import inf
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from config import AppConfig
+
+NO_EXPIRY = inf
+
+
+class CacheBackend(ABC):
+    """Cache Backend Interface; Shared Backends Let Processes Share Entries.
+
+    A ttl of None uses the backend's default; NO_EXPIRY never expires.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Gets a Live Entry, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Sets an Entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Deletes an Entry, if Present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Deletes every Entry."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Bounded, Thread-Safe, In-Process LRU Backend, with Per-Entry Expiry."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """MemoryCacheBackend Constructor."""
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__entries__: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.__lock__ = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Gets a Live Entry, or None (Dropping it once Expired)."""
+
+        with self.__lock__:
+            entry = self.__entries__.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= monotonic():
+                del self.__entries__[key]
+                return None
+            self.__entries__.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Sets an Entry, Evicting the Least Recently Used once Full."""
+
+        expires = monotonic() + (self.ttl if ttl is None else ttl)
+        with self.__lock__:
+            self.__entries__[key] = (expires, value)
+            self.__entries__.move_to_end(key)
+            while len(self.__entries__) > self.max_size:
+                self.__entries__.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Deletes an Entry, if Present."""
+
+        with self.__lock__:
+            self.__entries__.pop(key, None)
+
+    def clear(self) -> None:
+        """Deletes every Entry."""
+
+        with self.__lock__:
+            self.__entries__.clear()
+
+    def __len__(self) -> int:
+        """Number of Entries (Including any not yet Dropped as Expired)."""
+
+        return len(self.__entries__)
+
+
+class ReadThroughCache:
+    """Namespaced Read-Through Cache, Counting Hits and Misses.
+
+    Values are copied in and out, so callers may mutate what they get back.
+    """
+
+    __backend__: Optional[CacheBackend] = None
+
+    def __init__(self, namespace: str) -> None:
+        """ReadThroughCache Constructor."""
+
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def get_backend(cls) -> CacheBackend:
+        """Gets the Shared Backend, Defaulting to an In-Process LRU."""
+
+        if ReadThroughCache.__backend__ is None:
+            config = AppConfig()
+            ReadThroughCache.__backend__ = MemoryCacheBackend(
+                config.cache_size, config.cache_ttl
+            )
+        return ReadThroughCache.__backend__
+
+    @classmethod
+    def set_backend(cls, backend: Optional[CacheBackend]) -> None:
+        """Swaps the Backend (e.g. for one Shared across Processes)."""
+
+        ReadThroughCache.__backend__ = backend
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Getter: Hit and Miss Counters."""
+
+        return {"hits": self.hits, "misses": self.misses}
+
+    def get(self, key: str) -> Optional[Any]:
+        """Gets a Cached Value, or None."""
+
+        value = self.get_backend().get(self.__get_key__(key))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Caches a Value; a ttl of NO_EXPIRY Marks it Immutable."""
+
+        self.get_backend().set(self.__get_key__(key), copy(value), ttl)
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        store: bool = True,
+    ) -> Any:
+        """Gets a Cached Value, Loading (and, if store, Caching) it on a Miss."""
+
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if store:
+                self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        """Drops Cached Values."""
+
+        backend = self.get_backend()
+        for key in keys:
+            backend.delete(self.__get_key__(key))
+
+    def reset_stats(self) -> None:
+        """Zeroes the Hit and Miss Counters."""
+
+        self.hits = 0
+        self.misses = 0
+
+    def __get_key__(self, key: str) -> str:
+        """Prefixes a Key with the Namespace."""
+
+        return f"{self.namespace}:{key}"
@@ -0,0 +1,69 @@
+"""Caching: Login Sessions, and Revoked Sessions, over a Swappable Backend."""
+
+from time import time
+from typing import Optional
+
+from config import AppConfig
+from lib.utils.caching.cache import CacheBackend, MemoryCacheBackend
+
+
+class SessionStore:
+    """Tracks each User's Current Session, and a Revocation Set.
+
+    A user has one session at a time (logging in logs out the others), so a
+    session is active while it is its user's current session. Current sessions
+    are cached for at most CACHE_TTL, bounding how stale a process-local
+    backend can be; revocations are kept until the session's token expires.
+    """
+
+    __backend__: Optional[CacheBackend] = None
+
+    @classmethod
+    def get_backend(cls) -> CacheBackend:
+        """Gets the Shared Backend, Defaulting to an In-Process LRU."""
+
+        if SessionStore.__backend__ is None:
+            config = AppConfig()
+            SessionStore.__backend__ = MemoryCacheBackend(
+                config.cache_size, config.cache_ttl
+            )
+        return SessionStore.__backend__
+
+    @classmethod
+    def set_backend(cls, backend: Optional[CacheBackend]) -> None:
+        """Swaps the Backend (e.g. for one Shared across Processes)."""
+
+        SessionStore.__backend__ = backend
+
+    def start(self, user_id: str, session_id: str, expires: float) -> None:
+        """Makes a Session its User's Current Session, until it Expires."""
+
+        ttl = min(expires - time(), AppConfig().cache_ttl)
+        if ttl > 0:
+            self.get_backend().set(f"user:{user_id}", session_id, ttl)
+
+    def revoke(self, user_id: str, session_id: str, expires: float) -> None:
+        """Revokes a Session, until it would have Expired."""
+
+        backend = self.get_backend()
+        if backend.get(f"user:{user_id}") == session_id:
+            backend.delete(f"user:{user_id}")
+        ttl = expires - time()
+        if ttl > 0:
+            backend.set(f"revoked:{session_id}", True, ttl)
+
+    def is_active(self, user_id: str, session_id: str) -> Optional[bool]:
+        """Checks a Session in Memory; None if the Store does not Know it."""
+
+        backend = self.get_backend()
+        if backend.get(f"revoked:{session_id}"):
+            return False
+        current_session_id = backend.get(f"user:{user_id}")
+        if current_session_id is None:
+            return None
+        return current_session_id == session_id
+
+    def clear(self) -> None:
+        """Forgets every Session and Revocation."""
+
+        self.get_backend().clear()
@@ -0,0 +1,112 @@
+"""Cards: Luhn-Valid Card Numbers, Reserved in Blocks."""
+
+from collections import deque
+from secrets import randbelow
+from threading import Lock
+from typing import Callable
+
+from config import AppConfig
+from lib.utils.constants.users import CardType
+from lib.utils.encryption.encoders import get_hmac_value
+
+
+def get_luhn_digit(digits: str) -> str:
+    """Gets the Luhn Check Digit, to Append to the Given Digits."""
+
+    total = 0
+    for index, digit in enumerate(reversed(digits)):
+        value = int(digit) * (2 if index % 2 == 0 else 1)
+        total += value - 9 if value > 9 else value
+    return str(-total % 10)
+
+
+def is_luhn_valid(card_number: str) -> bool:
+    """Checks a Card Number's Luhn Check Digit."""
+
+    return (
+        isinstance(card_number, str)
+        and len(card_number) > 1
+        and card_number.isdigit()
+        and get_luhn_digit(card_number[:-1]) == card_number[-1]
+    )
+
+
+def generate_card_numbers(prefix: str, length: int, count: int) -> list[str]:
+    """Generates Distinct, Luhn-Valid Card Numbers from a CSPRNG."""
+
+    body_length = length - len(prefix) - 1
+    card_numbers: dict[str, None] = {}
+    while len(card_numbers) < count:
+        digits = prefix + str(randbelow(10**body_length)).zfill(body_length)
+        card_numbers[digits + get_luhn_digit(digits)] = None
+    return list(card_numbers)
+
+
+def get_card_number_hash(card_number: str) -> str:
+    """Hashes a Plaintext Card Number, for the (Unique) Hashed Number Index.
+
+    The hash is keyed, as card numbers are too few to resist brute force.
+    """
+
+    return get_hmac_value(card_number, AppConfig().card_hash_key)
+
+
+class CardNumberPool:
+    """Per Card Type Pools of Unissued Card Numbers.
+
+    Numbers are reserved a block at a time: one query (get_issued, from hashes
+    to the already issued hashes) filters a whole block, so allocating a
+    number costs no collision query.
+    """
+
+    def __init__(
+        self, block_size: int, get_issued: Callable[[list[str]], set[str]]
+    ) -> None:
+        """CardNumberPool Constructor."""
+
+        self.block_size = block_size
+        self.get_issued = get_issued
+        self.__pools__: dict[CardType, deque[tuple[str, str]]] = {}
+        self.__lock__ = Lock()
+
+    def allocate(self, card_type: CardType) -> tuple[str, str]:
+        """Takes a Reserved (Card Number, Card Number Hash), Reserving once Empty."""
+
+        with self.__lock__:
+            pool = self.__pools__.setdefault(card_type, deque())
+            while not pool:
+                pool.extend(self.__reserve__(card_type, pool))
+            return pool.popleft()
+
+    def reserve(self, card_type: CardType) -> int:
+        """Reserves a Block of Numbers Up Front; Returns the Pool's Size."""
+
+        with self.__lock__:
+            pool = self.__pools__.setdefault(card_type, deque())
+            pool.extend(self.__reserve__(card_type, pool))
+            return len(pool)
+
+    def clear(self) -> None:
+        """Releases every Reserved Number."""
+
+        with self.__lock__:
+            self.__pools__.clear()
+
+    def __reserve__(
+        self, card_type: CardType, pool: deque[tuple[str, str]]
+    ) -> list[tuple[str, str]]:
+        """Generates a Block, Dropping Issued and Already Reserved Numbers."""
+
+        reserved = {card_hash for _, card_hash in pool}
+        card_numbers = {
+            get_card_number_hash(card_number): card_number
+            for card_number in generate_card_numbers(
+                card_type.value[1], AppConfig().card_length, self.block_size
+            )
+        }
+        issued = self.get_issued(list(card_numbers)) | reserved
+        return [
+            (card_number, card_hash)
+            for card_hash, card_number in card_numbers.items()
+            if card_hash not in issued
+        ]
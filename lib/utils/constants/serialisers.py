@@ -0,0 +1,10 @@
+"""Serialisers: Contains Constants, Enumerations and Other Static data."""
+
+from enum import Enum
+
+
+class LoadStrategy(Enum):
+    """Enumeration of Relationship Eager-Loading Strategies."""
+
+    JOINED = "joined"
+    SELECTIN = "selectin"
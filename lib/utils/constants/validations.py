@@ -0,0 +1,11 @@
+"""Validations: Contains Constants, Enumerations and Other Static data."""
+
+from enum import Enum
+
+
+class ValidationMode(Enum):
+    """Enumeration of Function Signature Validation Modes."""
+
+    FULL = "full"
+    SAMPLED = "sampled"
+    DISABLED = "disabled"
@@ -1,23 +1,84 @@
 """Encryption: Contains Data Encrypters."""
 
-from cryptography.fernet import Fernet
+from typing import Optional
+from cryptography.fernet import MultiFernet
 from config import AppConfig
-from lib.interfaces.exceptions import UserError
+from lib.interfaces.exceptions import FernetError, UserError
+
+
+class CryptoProvider:
+    """Process-Wide Cipher, Built Once from the Configured Fernet Keys.
+
+    Encrypts with the current key and decrypts with any configured key, so
+    FERNET_PREVIOUS_KEYS can be retired once their data is re-encrypted.
+    """
+
+    __instance = None
+    __cipher__: Optional[MultiFernet] = None
+
+    def __new__(cls) -> "CryptoProvider":
+        """Singleton Class Constructor."""
+
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @property
+    def cipher(self) -> MultiFernet:
+        """Getter: Cached MultiFernet Cipher."""
+
+        if CryptoProvider.__cipher__ is None:
+            try:
+                CryptoProvider.__cipher__ = AppConfig().multi_fernet
+            except ValueError as exc:
+                raise FernetError("Invalid Fernet Key.") from exc
+        return CryptoProvider.__cipher__
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the Cached Cipher, to Reload Rotated Keys."""
+
+        cls.__cipher__ = None
+
+    def encrypt(self, data: bytes) -> str:
+        """Returns Encrypted Data."""
+
+        return self.cipher.encrypt(data).decode()
+
+    def decrypt(self, data: str) -> str:
+        """Returns Decrypted Data."""
+
+        return self.cipher.decrypt(data.encode()).decode()
+
+    def rotate(self, data: str) -> str:
+        """Returns Data Re-Encrypted with the Current Key."""
+
+        return self.cipher.rotate(data.encode()).decode()
+
+    def encrypt_many(self, data: list[bytes]) -> list[str]:
+        """Returns a Batch of Encrypted Data."""
+
+        cipher = self.cipher
+        return [cipher.encrypt(value).decode() for value in data]
+
+    def decrypt_many(self, data: list[str]) -> list[str]:
+        """Returns a Batch of Decrypted Data."""
+
+        cipher = self.cipher
+        return [cipher.decrypt(value.encode()).decode() for value in data]
 
 
 def encrypt_data(data: bytes) -> str:
     """Returns Encrypted Data."""
 
-    fernet = AppConfig().fernet
-    if not isinstance(fernet, Fernet):
+    if not isinstance(data, bytes):
         raise UserError("Invalid User Data")
-    return fernet.encrypt(data).decode()
+    return CryptoProvider().encrypt(data)
 
 
 def decrypt_data(data: str) -> str:
     """Returns Decrypted Data."""
 
-    fernet = AppConfig().fernet
-    if not isinstance(fernet, Fernet):
+    if not isinstance(data, str):
         raise UserError("Invalid User Data")
-    return fernet.decrypt(data.encode()).decode()
+    return CryptoProvider().decrypt(data)
@@ -1,6 +1,7 @@
 """Encryption: Contains Encoders (SHA256)."""
 
 from hashlib import sha256
+from hmac import new as new_hmac
 
 
 def get_hash_value(value: str, salt_value: str = "") -> str:
@@ -15,3 +16,35 @@ def get_hash_value(value: str, salt_value: str = "") -> str:
     sha256_value = sha256(salt_value.encode("utf-8"))
     sha256_value.update(value.encode("utf-8"))
     return sha256_value.hexdigest()
+
+
+def get_hmac_value(value: str, key: str) -> str:
+    """Generates a Keyed (HMAC-SHA256) Hash Value."""
+
+    if not isinstance(value, str):
+        raise ValueError("Value must be a String.")
+
+    if not isinstance(key, str) or not key:
+        raise ValueError("Key must be a Non-Empty String.")
+
+    return new_hmac(key.encode("utf-8"), value.encode("utf-8"), sha256).hexdigest()
+
+
+def get_merkle_root(hash_values: list[str]) -> str:
+    """Generates the Merkle Root of a List of Hash Values."""
+
+    if not hash_values:
+        raise ValueError("Hash Values must not be Empty.")
+
+    if not all(isinstance(hash_value, str) for hash_value in hash_values):
+        raise ValueError("Value must be a String.")
+
+    level = list(hash_values)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [
+            get_hash_value(level[index] + level[index + 1])
+            for index in range(0, len(level), 2)
+        ]
+    return level[0]
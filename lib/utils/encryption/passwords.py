@@ -0,0 +1,182 @@
+"""Encryption: Password Key Derivation (scrypt), in a Bounded Process Pool."""
+
+from asyncio import gather, get_running_loop, wrap_future
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import scrypt
+from multiprocessing import get_context
+from threading import BoundedSemaphore, Lock
+from typing import Optional
+
+from config import AppConfig
+from lib.interfaces.exceptions import ApplicationError
+from lib.utils.encryption.encoders import get_hash_value
+
+BLOCK_SIZE = 8
+PARALLELISM = 1
+
+
+def derive_key(value: str, salt_value: str, cost: int) -> str:
+    """Derives a Hex scrypt Key, with N = 2**cost."""
+
+    n = 2**cost
+    return scrypt(
+        value.encode("utf-8"),
+        salt=salt_value.encode("utf-8"),
+        n=n,
+        r=BLOCK_SIZE,
+        p=PARALLELISM,
+        maxmem=256 * BLOCK_SIZE * n,
+        dklen=32,
+    ).hex()
+
+
+class PasswordHasher:
+    """Process-Wide Password Hasher, Deriving Keys in a Bounded Process Pool.
+
+    Hashes are scrypt$cost$key, so the cost (KDF_COST) can be raised: hashes at
+    a cost in KDF_PREVIOUS_COSTS, or legacy salted SHA-256 hashes, still match.
+    Passwords, and legacy user IDs, are upgraded on login; other user IDs keep
+    the cost they were created at, so a cost can never be dropped from
+    KDF_PREVIOUS_COSTS once users have been created at it. Derivations run in KDF_WORKERS processes, and at
+    most KDF_MAX_PENDING callers wait on them; any more fail fast, rather than
+    queueing behind a burst of logins. The async variants await the pool, so
+    they do not block an event loop. Workers are spawned (not forked from a
+    process holding database connections), so scripts need a __main__ guard.
+    """
+
+    __instance = None
+    __executor__: Optional[ProcessPoolExecutor] = None
+    __pending__: Optional[BoundedSemaphore] = None
+    __lock__ = Lock()
+    __PREFIX__ = "scrypt"
+
+    def __new__(cls) -> "PasswordHasher":
+        """Singleton Class Constructor."""
+
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Shuts the Process Pool Down, to Restart it with Reloaded Settings."""
+
+        with cls.__lock__:
+            if cls.__executor__ is not None:
+                cls.__executor__.shutdown()
+            cls.__executor__ = None
+            cls.__pending__ = None
+
+    def hash_password(self, value: str, salt_value: str) -> str:
+        """Hashes a Value at the Current Cost."""
+
+        cost = AppConfig().kdf_cost
+        return self.__encode__(cost, self.__derive__([(value, salt_value, cost)])[0])
+
+    async def hash_password_async(self, value: str, salt_value: str) -> str:
+        """Hashes a Value at the Current Cost, Awaiting the Derivation."""
+
+        cost = AppConfig().kdf_cost
+        keys = await self.__derive_async__([(value, salt_value, cost)])
+        return self.__encode__(cost, keys[0])
+
+    def get_password_hashes(self, value: str, salt_value: str) -> list[str]:
+        """Hashes a Value at the Current, then Previous Costs, then as Legacy.
+
+        The scrypt keys are derived concurrently, so matching a value against
+        every accepted hash takes about as long as one derivation.
+        """
+
+        costs = self.__get_costs__()
+        keys = self.__derive__([(value, salt_value, cost) for cost in costs])
+        return self.__encode_hashes__(value, salt_value, costs, keys)
+
+    async def get_password_hashes_async(
+        self, value: str, salt_value: str
+    ) -> list[str]:
+        """Hashes a Value at Every Accepted Cost, Awaiting the Derivations."""
+
+        costs = self.__get_costs__()
+        jobs = [(value, salt_value, cost) for cost in costs]
+        keys = await self.__derive_async__(jobs)
+        return self.__encode_hashes__(value, salt_value, costs, keys)
+
+    def is_legacy(self, hashed: str) -> bool:
+        """Checks whether a Hash is a Legacy (Salted SHA-256) Hash."""
+
+        return not str(hashed).startswith(f"{self.__PREFIX__}$")
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Checks whether a Hash is Legacy, or not at the Current Cost."""
+
+        return not str(hashed).startswith(
+            self.__encode__(AppConfig().kdf_cost, "")
+        )
+
+    def __encode__(self, cost: int, key: str) -> str:
+        """Encodes a Key with its Cost."""
+
+        return f"{self.__PREFIX__}${cost}${key}"
+
+    def __encode_hashes__(
+        self, value: str, salt_value: str, costs: list[int], keys: list[str]
+    ) -> list[str]:
+        """Encodes Keys with their Costs, then Appends the Legacy Hash."""
+
+        return [
+            *(self.__encode__(cost, key) for cost, key in zip(costs, keys)),
+            get_hash_value(value, salt_value),
+        ]
+
+    def __get_costs__(self) -> list[int]:
+        """Gets the Accepted Costs, Current Cost First."""
+
+        config = AppConfig()
+        return [config.kdf_cost, *config.kdf_previous_costs]
+
+    def __derive__(self, jobs: list[tuple[str, str, int]]) -> list[str]:
+        """Derives Keys in the Process Pool (or in this Thread, without Workers)."""
+
+        if not AppConfig().kdf_workers:
+            return [derive_key(*job) for job in jobs]
+
+        executor, pending = self.__reserve__()
+        try:
+            futures = [executor.submit(derive_key, *job) for job in jobs]
+            return [future.result() for future in futures]
+        finally:
+            pending.release()
+
+    async def __derive_async__(self, jobs: list[tuple[str, str, int]]) -> list[str]:
+        """Derives Keys in the Process Pool (or the Loop's Default Executor)."""
+
+        if not AppConfig().kdf_workers:
+            loop = get_running_loop()
+            futures = [loop.run_in_executor(None, derive_key, *job) for job in jobs]
+            return list(await gather(*futures))
+
+        executor, pending = self.__reserve__()
+        try:
+            futures = [wrap_future(executor.submit(derive_key, *job)) for job in jobs]
+            return list(await gather(*futures))
+        finally:
+            pending.release()
+
+    def __reserve__(self) -> tuple[ProcessPoolExecutor, BoundedSemaphore]:
+        """Reserves a Pending Slot on the Process Pool, Starting it on First Use."""
+
+        config = AppConfig()
+        with PasswordHasher.__lock__:
+            if (
+                PasswordHasher.__executor__ is None
+                or PasswordHasher.__pending__ is None
+            ):
+                PasswordHasher.__executor__ = ProcessPoolExecutor(
+                    config.kdf_workers, mp_context=get_context("spawn")
+                )
+                PasswordHasher.__pending__ = BoundedSemaphore(config.kdf_max_pending)
+            executor, pending = PasswordHasher.__executor__, PasswordHasher.__pending__
+
+        if not pending.acquire(blocking=False):
+            raise ApplicationError("Too Many Pending Password Derivations.")
+        return executor, pending
@@ -0,0 +1,101 @@
+"""Encryption: Compact, HMAC-Signed Authentication Tokens."""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import timedelta
+from hashlib import sha256
+from hmac import compare_digest, new as new_hmac
+from json import dumps, loads
+from time import time
+from typing import Any, Optional
+
+from config import AppConfig
+from lib.interfaces.exceptions import TokenError
+
+
+class TokenProvider:
+    """Process-Wide Token Signer, with Keys Derived Once from the Fernet Keys.
+
+    Tokens are header.payload.signature (HS256 JSON Web Tokens). The header's
+    key id picks the verifying key, so tokens signed with a retired key verify
+    until it is dropped from FERNET_PREVIOUS_KEYS.
+    """
+
+    __instance = None
+    __keys__: Optional[dict[str, bytes]] = None
+    __ALGORITHM__ = "HS256"
+
+    def __new__(cls) -> "TokenProvider":
+        """Singleton Class Constructor."""
+
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @property
+    def keys(self) -> dict[str, bytes]:
+        """Getter: Signing Keys by Key ID, the Current Key First."""
+
+        if TokenProvider.__keys__ is None:
+            config = AppConfig()
+            salt_value = str(config.salt_value).encode()
+            keys = {}
+            for fernet_key in config.fernet_keys:
+                key = new_hmac(fernet_key.encode(), salt_value, sha256).digest()
+                keys[sha256(key).hexdigest()[:16]] = key
+            TokenProvider.__keys__ = keys
+        return TokenProvider.__keys__
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the Cached Keys, to Reload Rotated Keys."""
+
+        cls.__keys__ = None
+
+    def sign(self, claims: dict[str, Any], expires_in: timedelta) -> str:
+        """Signs Claims with the Current Key, Adding Issued and Expiry Times."""
+
+        key_id, key = next(iter(self.keys.items()))
+        issued = int(time())
+        header = __encode__({"alg": self.__ALGORITHM__, "typ": "JWT", "kid": key_id})
+        payload = __encode__(
+            {**claims, "iat": issued, "exp": issued + int(expires_in.total_seconds())}
+        )
+        return f"{header}.{payload}.{__sign__(key, header, payload)}"
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Verifies a Token's Signature and Expiry, Returning its Claims."""
+
+        try:
+            header, payload, signature = token.split(".")
+            headers = __decode__(header)
+            key = self.keys.get(headers["kid"])
+            if key is None or headers["alg"] != self.__ALGORITHM__:
+                raise TokenError("Invalid Token.")
+            if not compare_digest(__sign__(key, header, payload), signature):
+                raise TokenError("Invalid Token.")
+            claims = __decode__(payload)
+            if claims["exp"] <= time():
+                raise TokenError("Expired Token.")
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            raise TokenError("Invalid Token.") from exc
+        return claims
+
+
+def __encode__(data: dict[str, Any]) -> str:
+    """Encodes JSON as Unpadded, URL-Safe Base64."""
+
+    encoded = urlsafe_b64encode(dumps(data, separators=(",", ":")).encode())
+    return encoded.rstrip(b"=").decode()
+
+
+def __decode__(data: str) -> dict[str, Any]:
+    """Decodes Unpadded, URL-Safe Base64 JSON."""
+
+    return loads(urlsafe_b64decode(data + "=" * (-len(data) % 4)))
+
+
+def __sign__(key: bytes, header: str, payload: str) -> str:
+    """Signs an Encoded Header and Payload with HMAC-SHA256."""
+
+    signature = new_hmac(key, f"{header}.{payload}".encode(), sha256).digest()
+    return urlsafe_b64encode(signature).rstrip(b"=").decode()
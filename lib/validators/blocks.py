@@ -1,10 +1,9 @@
 """Blocks: validations for Block Related Models."""
 
 from uuid import UUID
-from sqlalchemy.orm import Session
 from lib.interfaces.exceptions import BlockError
 from lib.utils.constants.blocks import BlockType
-from models import ENGINE
+from models import get_session
 from models.blockchain.blocks import Block
 
 
@@ -32,7 +31,7 @@ def validate_block_next(next_block_id: UUID, **kwargs) -> UUID:
     if block.next_block_id:
         raise BlockError("Invalid Block.")
 
-    with Session(ENGINE) as session:
+    with get_session() as session:
         next_block = session.get(Block, next_block_id)
         if not next_block:
             raise BlockError("Invalid Block.")
@@ -53,7 +52,7 @@ def validate_block_previous(previous_block_id: UUID, **kwargs) -> UUID:
     if block.next_block_id:
         raise BlockError("Invalid Block.")
 
-    with Session(ENGINE) as session:
+    with get_session() as session:
         previous_block = session.get(Block, previous_block_id)
         if not previous_block:
             raise BlockError("Invalid Block.")
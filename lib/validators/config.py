@@ -1,8 +1,10 @@
 """Config: validations for Application Config related Models."""
 
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 from lib.interfaces.exceptions import ApplicationError
+from lib.utils.constants.validations import ValidationMode
 
 
 def validate_salt_value(salt_value: UUID) -> UUID:
@@ -25,6 +27,30 @@ def validate_fernet_key(fernet_key: str) -> str:
     return fernet_key
 
 
+def validate_card_hash_key(card_hash_key: Optional[str]) -> str:
+    """Validates Card Number Hash Key."""
+
+    if card_hash_key is None:
+        raise ApplicationError("Missing Card Hash Key (CARD_HASH_KEY).")
+    if not isinstance(card_hash_key, str):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    if not card_hash_key:
+        raise ApplicationError("Invalid Application Configuration.")
+    return card_hash_key
+
+
+def validate_fernet_keys(fernet_keys: list[str]) -> list[str]:
+    """Validates Fernet Keys (Current Key First)."""
+
+    if not isinstance(fernet_keys, list):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    if not fernet_keys:
+        raise ApplicationError("Invalid Application Configuration.")
+    for fernet_key in fernet_keys:
+        validate_fernet_key(fernet_key)
+    return fernet_keys
+
+
 def validate_start_date(start_date: datetime) -> datetime:
     """Validates Start Date."""
 
@@ -65,6 +91,117 @@ def validate_cvv_length(cvv_number: int) -> int:
     return cvv_number
 
 
+def validate_block_size(block_size: int) -> int:
+    """Validates Block Size."""
+
+    if not isinstance(block_size, int):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    if block_size <= 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return block_size
+
+
+def validate_block_interval(block_interval: int) -> int:
+    """Validates Block Interval."""
+
+    if not isinstance(block_interval, int):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    if block_interval < 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return block_interval
+
+
+def validate_validation_mode(validation_mode: str) -> ValidationMode:
+    """Validates Validation Mode."""
+
+    if not isinstance(validation_mode, str):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    try:
+        return ValidationMode(validation_mode.lower())
+    except ValueError as exc:
+        raise ApplicationError("Invalid Application Configuration.") from exc
+
+
+def validate_validation_sample_rate(sample_rate: str) -> float:
+    """Validates Validation Sample Rate."""
+
+    try:
+        rate = float(sample_rate)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if not 0.0 < rate <= 1.0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return rate
+
+
+def validate_cache_size(cache_size: str) -> int:
+    """Validates Cache Size (Maximum Entries per Cache)."""
+
+    try:
+        size = int(cache_size)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if size <= 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return size
+
+
+def validate_cache_ttl(cache_ttl: str) -> float:
+    """Validates Cache TTL (Seconds)."""
+
+    try:
+        ttl = float(cache_ttl)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if ttl <= 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return ttl
+
+
+def validate_kdf_cost(kdf_cost: str) -> int:
+    """Validates Password KDF Cost (scrypt N = 2**cost)."""
+
+    try:
+        cost = int(kdf_cost)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if not 1 <= cost <= 20:
+        raise ApplicationError("Invalid Application Configuration.")
+    return cost
+
+
+def validate_kdf_costs(kdf_costs: list[str]) -> list[int]:
+    """Validates Password KDF Costs."""
+
+    if not isinstance(kdf_costs, list):
+        raise ApplicationError("Invalid Type for this Attribute.")
+    return [validate_kdf_cost(kdf_cost) for kdf_cost in kdf_costs]
+
+
+def validate_kdf_workers(kdf_workers: str) -> int:
+    """Validates Password KDF Workers (Processes)."""
+
+    try:
+        workers = int(kdf_workers)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if workers < 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return workers
+
+
+def validate_kdf_max_pending(kdf_max_pending: str) -> int:
+    """Validates Password KDF Maximum Pending Callers."""
+
+    try:
+        pending = int(kdf_max_pending)
+    except (TypeError, ValueError) as exc:
+        raise ApplicationError("Invalid Type for this Attribute.") from exc
+    if pending <= 0:
+        raise ApplicationError("Invalid Application Configuration.")
+    return pending
+
+
 def validate_session_id(session_id: UUID) -> UUID:
     """Validates Session ID."""
 
@@ -1,18 +1,172 @@
 """Models Module Entry Point."""
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from os import getenv
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.engine import create_engine
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from sqlalchemy.orm import declarative_base, Session
+from sqlalchemy.engine import Connection, Engine, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 DB_NAME = getenv("POSTGRES_DB")
 DB_USER = getenv("POSTGRES_USER")
 DB_PASSWORD = getenv("POSTGRES_PASSWORD")
 DB_HOST = getenv("POSTGRES_HOST")
 DB_PORT = getenv("POSTGRES_PORT")
+DB_POOL_SIZE = int(getenv("POSTGRES_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(getenv("POSTGRES_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(getenv("POSTGRES_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(getenv("POSTGRES_POOL_RECYCLE", "1800"))
+DB_STATEMENT_TIMEOUT = int(getenv("POSTGRES_STATEMENT_TIMEOUT", "30000"))
 
-ENGINE = create_engine(
-    f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+T = TypeVar("T")
+
+
+def get_engine(**kwargs: Any) -> Engine:
+    """Creates a Pooled Engine for the Application Database.
+
+    Pool sizing, recycling and the server-side statement timeout (ms) are read
+    from the POSTGRES_* environment variables; kwargs override any option.
+    """
+
+    options: dict[str, Any] = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "executemany_mode": "values_plus_batch",
+        "connect_args": {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT}"},
+    }
+    options.update(kwargs)
+    return create_engine(
+        f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+        **options,
+    )
+
+
+def get_async_engine(**kwargs: Any) -> AsyncEngine:
+    """Creates a Pooled asyncio Engine (asyncpg) for the Application Database.
+
+    Uses the same POSTGRES_* pool and statement timeout settings as get_engine.
+    """
+
+    options: dict[str, Any] = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "connect_args": {
+            "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT)}
+        },
+    }
+    options.update(kwargs)
+    return create_async_engine(
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+        **options,
+    )
+
+
+ENGINE = get_engine()
+ASYNC_ENGINE = get_async_engine()
 Base = declarative_base()
 
-Base.metadata.create_all(ENGINE)
+
+UNIT_OF_WORK: ContextVar[Optional[Connection]] = ContextVar("unit_of_work", default=None)
+ON_COMMIT: ContextVar[Optional[list[Callable[[], Any]]]] = ContextVar(
+    "on_commit", default=None
+)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Connection]:
+    """Opens a Single Database Transaction, Shared by every Session within it.
+
+    Committed once on exit, or rolled back if an exception is raised. Nested
+    calls join the outermost unit of work.
+    """
+
+    connection = UNIT_OF_WORK.get()
+    if connection is not None:
+        yield connection
+        return
+
+    callbacks: list[Callable[[], Any]] = []
+    with ENGINE.begin() as connection:
+        token = UNIT_OF_WORK.set(connection)
+        callbacks_token = ON_COMMIT.set(callbacks)
+        try:
+            yield connection
+        finally:
+            ON_COMMIT.reset(callbacks_token)
+            UNIT_OF_WORK.reset(token)
+    __run_callbacks__(callbacks)
+
+
+def on_commit(callback: Callable[[], Any]) -> None:
+    """Runs a Callback once the Active Unit of Work Commits (at once, Outside one).
+
+    Callbacks of a unit of work that is rolled back are dropped.
+    """
+
+    callbacks = ON_COMMIT.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def get_session() -> Session:
+    """Gets a Session, Joined to the Active Unit of Work (if any).
+
+    Within a unit of work, Session commits and rollbacks apply to a savepoint,
+    leaving the outer transaction to be committed by the unit of work.
+    """
+
+    connection = UNIT_OF_WORK.get()
+    if connection is None:
+        return Session(ENGINE)
+    return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+
+async def run_in_unit_of_work(function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a Synchronous Operation as a Unit of Work on the asyncio Engine.
+
+    The operation, and every serialiser it calls, runs on an asyncpg connection
+    via AsyncConnection.run_sync, so each round trip awaits the event loop
+    instead of blocking the thread.
+    """
+
+    callbacks: list[Callable[[], Any]] = []
+    async with ASYNC_ENGINE.begin() as connection:
+        result = await connection.run_sync(
+            __run_unit_of_work__, callbacks, function, *args, **kwargs
+        )
+    __run_callbacks__(callbacks)
+    return result
+
+
+def __run_unit_of_work__(
+    connection: Connection,
+    callbacks: list[Callable[[], Any]],
+    function: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Runs an Operation with the given Connection as the Active Unit of Work."""
+
+    token = UNIT_OF_WORK.set(connection)
+    callbacks_token = ON_COMMIT.set(callbacks)
+    try:
+        return function(*args, **kwargs)
+    finally:
+        ON_COMMIT.reset(callbacks_token)
+        UNIT_OF_WORK.reset(token)
+
+
+def __run_callbacks__(callbacks: list[Callable[[], Any]]) -> None:
+    """Runs a Committed Unit of Work's Callbacks, in Order."""
+
+    for callback in callbacks:
+        callback()
@@ -5,17 +5,21 @@ from uuid import uuid4, UUID as uuid
 
 from sqlalchemy import (
     UUID,
+    BigInteger,
     Column,
     DateTime,
     Enum,
     ForeignKey,
+    String,
     text,
 )
 
+from sqlalchemy.orm import relationship
+
 from lib.utils.constants.blocks import BlockType
-from lib.utils.constants.users import Status
 from models import Base
-from models.model import BaseModel
+from models.blockchain.items import BlockItem
+from models.model import BaseModel, as_column
 
 
 class Block(Base, BaseModel):
@@ -29,7 +33,7 @@ class Block(Base, BaseModel):
         "id", UUID(as_uuid=True), primary_key=True, nullable=False
     )
     block_id: uuid | Column[uuid] = Column(
-        "block_id", UUID(as_uuid=True), nullable=False
+        "block_id", UUID(as_uuid=True), unique=True, index=True, nullable=False
     )
     transaction_id: uuid | Column[uuid] = Column(
         "transaction_id",
@@ -44,12 +48,20 @@ class Block(Base, BaseModel):
         nullable=True,
     )
     previous_block_id: uuid | Column[uuid] = Column(
-        "previous_block_id", UUID(as_uuid=True), nullable=True
+        "previous_block_id", UUID(as_uuid=True), index=True, nullable=True
     )
     next_block_id: uuid | Column[uuid] = Column(
-        "next_block_id", UUID(as_uuid=True), nullable=True
+        "next_block_id", UUID(as_uuid=True), index=True, nullable=True
+    )
+    merkle_root: str | Column[str] = Column("merkle_root", String(256), nullable=True)
+    previous_block_hash: str | Column[str] = Column(
+        "previous_block_hash", String(256), nullable=True
     )
-    block_type: Status | Column[Status] = Column(
+    block_hash: str | Column[str] = Column("block_hash", String(256), nullable=True)
+    block_height: int | Column[int] = Column(
+        "block_height", BigInteger, unique=True, nullable=True
+    )
+    block_type: BlockType | Column[BlockType] = Column(
         "block_type",
         Enum(BlockType, name="block_type"),
         nullable=False,
@@ -65,6 +77,12 @@ class Block(Base, BaseModel):
         onupdate=text("CURRENT_TIMESTAMP"),
         nullable=False,
     )
+    items = relationship(
+        BlockItem,
+        backref="Block",
+        cascade="all, delete-orphan",
+        order_by=as_column(BlockItem.position),
+    )
 
     def __init__(self) -> None:
         """Contract Object Constructor."""
@@ -27,21 +27,34 @@ class Contract(Base, BaseModel):
     __tablename__ = "contracts"
     __table_args__ = ({"schema": "blockchain"},)
     __EXCLUDE_ATTRIBUTES__: list[str] = []
+    __HASH_ATTRIBUTES__: list[str] = [
+        "contract_id",
+        "contractor",
+        "contractee",
+        "contract",
+        "contractor_signiture",
+        "contractee_signiture",
+        "salt_value",
+    ]
 
     id: uuid | Column[uuid] = Column(
         "id", UUID(as_uuid=True), primary_key=True, nullable=False
     )
-    contract_id: str | Column[str] = Column("contract_id", String(256), nullable=False)
+    contract_id: str | Column[str] = Column(
+        "contract_id", String(256), unique=True, index=True, nullable=False
+    )
     contractor: uuid | Column[uuid] = Column(
         "contractor",
         UUID(as_uuid=True),
         ForeignKey("users.payment_profiles.id"),
+        index=True,
         nullable=False,
     )
     contractee: uuid | Column[uuid] = Column(
         "contractee",
         UUID(as_uuid=True),
         ForeignKey("users.payment_profiles.id"),
+        index=True,
         nullable=False,
     )
     title: str | Column[str] = Column("title", String(256), nullable=False)
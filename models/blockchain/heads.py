@@ -0,0 +1,58 @@
+"""Heads: Chain Head Model."""
+
+from datetime import datetime
+from uuid import uuid4, UUID as uuid
+
+from sqlalchemy import UUID, BigInteger, Column, DateTime, String, text
+
+from models import Base
+from models.model import BaseModel
+
+
+class ChainHead(Base, BaseModel):
+    """Model representing the Tail Block of a Block Chain."""
+
+    __tablename__ = "chain_heads"
+    __table_args__ = ({"schema": "blockchain"},)
+    __EXCLUDE_ATTRIBUTES__: list[str] = []
+
+    id: uuid | Column[uuid] = Column(
+        "id", UUID(as_uuid=True), primary_key=True, nullable=False
+    )
+    chain_id: str | Column[str] = Column(
+        "chain_id", String(256), unique=True, nullable=False
+    )
+    block_id: uuid | Column[uuid] = Column(
+        "block_id", UUID(as_uuid=True), nullable=True
+    )
+    verified_block_id: uuid | Column[uuid] = Column(
+        "verified_block_id", UUID(as_uuid=True), nullable=True
+    )
+    verified_height: int | Column[int] = Column(
+        "verified_height", BigInteger, nullable=False, default=0
+    )
+    created_date: datetime | Column[datetime] = Column(
+        "created_date", DateTime, default=text("CURRENT_TIMESTAMP"), nullable=False
+    )
+    updated_date: datetime | Column[datetime] = Column(
+        "updated_date",
+        DateTime,
+        default=text("CURRENT_TIMESTAMP"),
+        onupdate=text("CURRENT_TIMESTAMP"),
+        nullable=False,
+    )
+
+    def __init__(self) -> None:
+        """Chain Head Object Constructor."""
+
+        self.id = uuid4()
+
+    def __str__(self) -> str:
+        """String Representation of the Chain Head Object."""
+
+        return f"Chain ID: {str(self.chain_id)}"
+
+    def __repr__(self) -> str:
+        """String Representation of the Chain Head Object."""
+
+        return f"Application Model: {self.__class__.__name__}"
@@ -0,0 +1,60 @@
+"""Items: Block Item Model."""
+
+from datetime import datetime
+from uuid import uuid4, UUID as uuid
+
+from sqlalchemy import UUID, Column, DateTime, ForeignKey, Integer, text
+
+from models import Base
+from models.model import BaseModel
+
+
+class BlockItem(Base, BaseModel):
+    """Model representing a Transaction or Contract Sealed in a Block."""
+
+    __tablename__ = "block_items"
+    __table_args__ = ({"schema": "blockchain"},)
+    __EXCLUDE_ATTRIBUTES__: list[str] = []
+
+    id: uuid | Column[uuid] = Column(
+        "id", UUID(as_uuid=True), primary_key=True, nullable=False
+    )
+    block_id: uuid | Column[uuid] = Column(
+        "block_id",
+        UUID(as_uuid=True),
+        ForeignKey("blockchain.blocks.id"),
+        nullable=False,
+    )
+    transaction_id: uuid | Column[uuid] = Column(
+        "transaction_id",
+        UUID(as_uuid=True),
+        ForeignKey("blockchain.transactions.id"),
+        unique=True,
+        nullable=True,
+    )
+    contract_id: uuid | Column[uuid] = Column(
+        "contract_id",
+        UUID(as_uuid=True),
+        ForeignKey("blockchain.contracts.id"),
+        unique=True,
+        nullable=True,
+    )
+    position: int | Column[int] = Column("position", Integer, nullable=False)
+    created_date: datetime | Column[datetime] = Column(
+        "created_date", DateTime, default=text("CURRENT_TIMESTAMP"), nullable=False
+    )
+
+    def __init__(self) -> None:
+        """Block Item Object Constructor."""
+
+        self.id = uuid4()
+
+    def __str__(self) -> str:
+        """String Representation of the Block Item Object."""
+
+        return f"Block Item ID: {str(self.id)}"
+
+    def __repr__(self) -> str:
+        """String Representation of the Block Item Object."""
+
+        return f"Application Model: {self.__class__.__name__}"
@@ -17,18 +17,35 @@ class Transaction(Base, BaseModel):
     __tablename__ = "transactions"
     __table_args__ = ({"schema": "blockchain"},)
     __EXCLUDE_ATTRIBUTES__: list[str] = []
+    __HASH_ATTRIBUTES__: list[str] = [
+        "transaction_id",
+        "sender",
+        "receiver",
+        "amount",
+        "sender_signiture",
+        "receiver_signiture",
+        "salt_value",
+    ]
 
     id: uuid | Column[uuid] = Column(
         "id", UUID(as_uuid=True), primary_key=True, nullable=False
     )
     transaction_id: uuid | Column[uuid] = Column(
-        "transaction_id", UUID(as_uuid=True), nullable=False
+        "transaction_id", UUID(as_uuid=True), unique=True, index=True, nullable=False
     )
     sender: uuid | Column[uuid] = Column(
-        "sender", UUID(as_uuid=True), ForeignKey("users.payment_profiles.id"), nullable=False
+        "sender",
+        UUID(as_uuid=True),
+        ForeignKey("users.payment_profiles.id"),
+        index=True,
+        nullable=False,
     )
     receiver: uuid | Column[uuid] = Column(
-        "receiver", UUID(as_uuid=True), ForeignKey("users.payment_profiles.id"), nullable=False
+        "receiver",
+        UUID(as_uuid=True),
+        ForeignKey("users.payment_profiles.id"),
+        index=True,
+        nullable=False,
     )
     amount: float | Column[float] = Column("amount", Float, nullable=False)
     title: str | Column[str] = Column("title", String(256), nullable=True)
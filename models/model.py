@@ -1,17 +1,28 @@
 """Model: Base Model for Creating Models."""
 
 from datetime import date, datetime
-
+from json import dumps
+from typing import Any, Callable, ClassVar, Iterable, Optional
 from uuid import UUID
 
+from sqlalchemy import Column, Table
+
 from lib.utils.constants.users import DateFormat
+from lib.utils.encryption.encoders import get_hash_value
+
+
+def as_column(attribute: Any) -> Column[Any]:
+    """Types a Mapped Model Attribute as its Column, for Queries."""
+
+    return attribute
 
 
 class BaseModel:
     """A Base/Abstract Model."""
 
-    __table__ = None
+    __table__: ClassVar[Table]
     __EXCLUDE_ATTRIBUTES__: list[str] = []
+    __HASH_ATTRIBUTES__: list[str] = []
 
     def __str__(self) -> str:
         """String Representation of the Base Class."""
@@ -23,19 +34,81 @@ class BaseModel:
 
         return f"Application Model: {self.__class__.__name__}"
 
-    def to_dict(self):
-        """Converts a Model to a Python Dictionary."""
-        data = {}
-        for key in self.__table__.columns:
-            if key.name in self.__EXCLUDE_ATTRIBUTES__:
+    def to_dict(self, fields: Optional[tuple[str, ...]] = None) -> dict:
+        """Converts a Model (or only the Given Fields) to a Python Dictionary."""
+
+        return self.__get_converter__(fields)(self)
+
+    @classmethod
+    def to_dicts(
+        cls, models: Iterable["BaseModel"], fields: Optional[tuple[str, ...]] = None
+    ) -> list[dict]:
+        """Converts Models (of this Table) to Python Dictionaries."""
+
+        converter = cls.__get_converter__(fields)
+        return [converter(model) for model in models]
+
+    @classmethod
+    def __get_converter__(
+        cls, fields: Optional[tuple[str, ...]] = None
+    ) -> Callable[["BaseModel"], dict]:
+        """Gets the Model's Compiled Converter, Building it on First Use."""
+
+        converters = cls.__dict__.get("__CONVERTERS__")
+        if converters is None:
+            converters = {}
+            setattr(cls, "__CONVERTERS__", converters)
+        converter = converters.get(fields)
+        if converter is None:
+            converter = converters[fields] = cls.__compile_converter__(fields)
+        return converter
+
+    @classmethod
+    def __compile_converter__(
+        cls, fields: Optional[tuple[str, ...]] = None
+    ) -> Callable[["BaseModel"], dict]:
+        """Compiles a Flat, Type-Specialised Converter from the Column Types."""
+
+        names: list[str] = []
+        converters: list[tuple[str, Callable[[Any], Any]]] = []
+        for column in cls.__table__.columns:
+            if column.name in cls.__EXCLUDE_ATTRIBUTES__:
+                continue
+            if fields is not None and column.name not in fields:
                 continue
-            value = getattr(self, key.name)
-            if isinstance(value, date):
-                data[key.name] = value.strftime(DateFormat.SHORT.value)
-            elif isinstance(value, datetime):
-                data[key.name] = value.strftime(DateFormat.HYPHEN.value)
-            elif isinstance(value, UUID):
-                data[key.name] = str(value)
-            else:
-                data[key.name] = value
-        return data
+            names.append(column.name)
+            convert = cls.__get_column_converter__(column)
+            if convert is not None:
+                converters.append((column.name, convert))
+
+        def converter(model: "BaseModel") -> dict:
+            data = {name: getattr(model, name) for name in names}
+            for name, convert in converters:
+                value = data[name]
+                if value is not None:
+                    data[name] = convert(value)
+            return data
+
+        return converter
+
+    @staticmethod
+    def __get_column_converter__(column) -> Optional[Callable[[Any], Any]]:
+        """Gets a Column's Value Converter (datetime is Checked Before date)."""
+
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return None
+        if issubclass(python_type, datetime):
+            return lambda value: value.strftime(DateFormat.HYPHEN.value)
+        if issubclass(python_type, date):
+            return lambda value: value.strftime(DateFormat.SHORT.value)
+        if issubclass(python_type, UUID):
+            return str
+        return None
+
+    def to_hash(self) -> str:
+        """Hashes a Model's Content (Hash Attributes) into a Hex Digest."""
+
+        data = {key: str(getattr(self, key)) for key in self.__HASH_ATTRIBUTES__}
+        return get_hash_value(dumps(data, sort_keys=True))
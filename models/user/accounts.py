@@ -33,7 +33,11 @@ class Account(Base, BaseModel):
         unique=True,
     )
     user_id: uuid | Column[uuid] = Column(
-        "user_id", UUID(as_uuid=True), ForeignKey("users.users.id"), nullable=False
+        "user_id",
+        UUID(as_uuid=True),
+        ForeignKey("users.users.id"),
+        index=True,
+        nullable=False,
     )
     status: Status | Column[Status] = Column(
         "status",
@@ -17,18 +17,20 @@ class PaymentProfile(Base, BaseModel):
 
     id: uuid | Column[uuid] = Column("id", UUID(as_uuid=True), primary_key=True)
     payment_id: uuid | Column[uuid] = Column(
-        "payment_id", UUID(as_uuid=True), nullable=False
+        "payment_id", UUID(as_uuid=True), unique=True, index=True, nullable=False
     )
     account_id: uuid | Column[uuid] = Column(
         "account_id",
         UUID(as_uuid=True),
         ForeignKey("users.accounts.id"),
+        index=True,
         nullable=False,
     )
     card_id: uuid | Column[uuid] = Column(
         "card_id",
         UUID(as_uuid=True),
         ForeignKey("warehouse.cards.id"),
+        index=True,
         nullable=False,
     )
     name: str | Column[str] = Column(
@@ -45,12 +45,15 @@ class UserProfile(Base, BaseModel):
         "profile_id",
         UUID(as_uuid=True),
         default=text(f"'{str(uuid4())}'"),
+        unique=True,
+        index=True,
         nullable=False,
     )
     account_id: uuid | Column[uuid] = Column(
         "account_id",
         UUID(as_uuid=True),
         ForeignKey("users.accounts.id"),
+        index=True,
         nullable=False,
     )
     first_name = Column("first_name", String(256), nullable=True)
@@ -35,12 +35,13 @@ class SettingsProfile(Base, BaseModel):
         "id", UUID(as_uuid=True), primary_key=True, nullable=False
     )
     settings_id: uuid | Column[uuid] = Column(
-        "settings_id", UUID(as_uuid=True), nullable=False
+        "settings_id", UUID(as_uuid=True), unique=True, index=True, nullable=False
     )
     account_id: uuid | Column[uuid] = Column(
         "account_id",
         UUID(as_uuid=True),
         ForeignKey("users.accounts.id"),
+        index=True,
         nullable=False,
     )
     email_status: Verification | Column[Verification] = Column(
@@ -14,7 +14,7 @@ class Card(Base, BaseModel):
 
     __tablename__ = "cards"
     __table_args__ = ({"schema": "warehouse"},)
-    __EXCLUDE_ATTRIBUTES__: list[str] = []
+    __EXCLUDE_ATTRIBUTES__: list[str] = ["card_number_hash"]
 
     id: uuid | Column[uuid] = Column(
         "id",
@@ -25,9 +25,14 @@ class Card(Base, BaseModel):
         "card_id",
         String(256),
         default=text(f"'{str(uuid4())}'"),
+        unique=True,
+        index=True,
         nullable=False,
     )
     card_number: str | Column[str] = Column("card_number", String(256), nullable=False)
+    card_number_hash: str | Column[str] = Column(
+        "card_number_hash", String(256), unique=True, index=True, nullable=True
+    )
     cvv_number: str | Column[str] = Column("cvv_number", String(256), nullable=False)
     card_type: CardType | Column[CardType] = Column(
         "card_type", Enum(CardType, name="card_type"), nullable=False
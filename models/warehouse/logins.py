@@ -24,14 +24,21 @@ class LoginHistory(Base, BaseModel):
         "login_id",
         UUID(as_uuid=True),
         default=text(f"'{str(uuid4())}'"),
+        unique=True,
+        index=True,
         nullable=False,
     )
     user_id: uuid | Column[uuid] = Column(
-        "user_id", UUID(as_uuid=True), ForeignKey("users.users.id"), nullable=False
+        "user_id",
+        UUID(as_uuid=True),
+        ForeignKey("users.users.id"),
+        index=True,
+        nullable=False,
     )
     session_id = Column(
         "session_id",
         UUID(as_uuid=True),
+        index=True,
         nullable=True,
     )
     login_date = Column(
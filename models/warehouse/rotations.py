@@ -0,0 +1,57 @@
+"""Rotations: Key Rotation Checkpoint Model."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4, UUID as uuid
+
+from sqlalchemy import UUID, BigInteger, Column, DateTime, String, text
+
+from models import Base
+from models.model import BaseModel
+
+
+class KeyRotation(Base, BaseModel):
+    """Model representing a Table's Re-Encryption Progress for a Fernet Key."""
+
+    __tablename__ = "key_rotations"
+    __table_args__ = ({"schema": "warehouse"},)
+    __EXCLUDE_ATTRIBUTES__: list[str] = []
+
+    id: uuid | Column[uuid] = Column(
+        "id", UUID(as_uuid=True), primary_key=True, nullable=False
+    )
+    table_name: str | Column[str] = Column(
+        "table_name", String(256), unique=True, nullable=False
+    )
+    key_hash: str | Column[str] = Column("key_hash", String(256), nullable=True)
+    last_id: Optional[uuid] | Column[uuid] = Column(
+        "last_id", UUID(as_uuid=True), nullable=True
+    )
+    rotated_rows: int | Column[int] = Column(
+        "rotated_rows", BigInteger, nullable=False, default=0
+    )
+    created_date: datetime | Column[datetime] = Column(
+        "created_date", DateTime, default=text("CURRENT_TIMESTAMP"), nullable=False
+    )
+    updated_date: datetime | Column[datetime] = Column(
+        "updated_date",
+        DateTime,
+        default=text("CURRENT_TIMESTAMP"),
+        onupdate=text("CURRENT_TIMESTAMP"),
+        nullable=False,
+    )
+
+    def __init__(self) -> None:
+        """Key Rotation Object Constructor."""
+
+        self.id = uuid4()
+
+    def __str__(self) -> str:
+        """String Representation of the Key Rotation Object."""
+
+        return f"Table Name: {str(self.table_name)}"
+
+    def __repr__(self) -> str:
+        """String Representation of the Key Rotation Object."""
+
+        return f"Application Model: {self.__class__.__name__}"
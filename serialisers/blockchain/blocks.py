@@ -1,15 +1,39 @@
 """Blocks: Serialiser for Block Model."""
 
-from typing import Optional
+from datetime import timedelta
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    String,
+    and_,
+    cast,
+    column,
+    exists,
+    func,
+    or_,
+    select,
+    update,
+    values,
+    UUID as uuid,
+)
 from sqlalchemy.exc import IntegrityError
 
 from lib.interfaces.exceptions import BlockError
+from lib.utils.caching.cache import NO_EXPIRY, ReadThroughCache
+from lib.utils.constants.blocks import BlockType
+from lib.utils.constants.contracts import ContractStatus
+from lib.utils.constants.transactions import TransactionStatus
+from lib.utils.encryption.encoders import get_hash_value, get_merkle_root
 from lib.validators.blocks import validate_block_next, validate_block_previous
-from models import ENGINE
+from models import get_session
 from models.blockchain.blocks import Block
+from models.blockchain.contracts import Contract
+from models.blockchain.items import BlockItem
+from models.blockchain.transactions import Transaction
+from models.model import as_column
+from serialisers.blockchain.heads import ChainHeadSerialiser
 from serialisers.serialiser import BaseSerialiser
 
 
@@ -17,53 +41,214 @@ class BlockSerialiser(Block, BaseSerialiser):
     """Serialiser for the Block Model."""
 
     __SERIALISER_EXCEPTION__ = BlockError
-    __MUTABLE_KWARGS__: list[str] = ["block_type", "previous_block_id", "next_block_id"]
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "block_type",
+            "previous_block_id",
+            "next_block_id",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid Block."
+    __CACHE__ = ReadThroughCache("blocks")
 
     def get_block(
         self,
         block_id: Optional[UUID] = None,
         transaction_id: Optional[UUID] = None,
         contract_id: Optional[UUID] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> dict:
-        """CRUD Operation: Read Block."""
+        """CRUD Operation: Read Block (Cached by Block ID).
 
-        with Session(ENGINE) as session:
-            if block_id:
-                query = select(Block).filter(cast(Block.block_id, uuid) == block_id)
-            elif transaction_id:
+        Finalized blocks (linked to a next block) are cached without expiry.
+        """
+
+        fields = self.__get_fields__(Block, fields)
+        if block_id:
+            return self.__read_through__(
+                block_id,
+                self.__load_block__,
+                fields,
+                ttl=lambda block: NO_EXPIRY if block["next_block_id"] else None,
+            )
+
+        with get_session() as session:
+            if transaction_id:
                 query = select(Block).filter(
-                    cast(Block.transaction_id, uuid) == transaction_id
+                    self.__match_id__(Block.transaction_id, transaction_id)
                 )
             else:
                 query = select(Block).filter(
-                    cast(Block.contract_id, uuid) == contract_id
+                    self.__match_id__(Block.contract_id, contract_id)
                 )
+            query = query.options(*self.__get_load_options__(Block, fields=fields))
+            block = session.execute(query).scalar_one_or_none()
+
+            if not block:
+                raise BlockError("Block Not Found.")
+            return self.__get_model_data__(block, fields=fields)
+
+    def __load_block__(self, block_id: UUID) -> dict:
+        """Reads a Block from the Database."""
+
+        with get_session() as session:
+            query = select(Block).filter(self.__match_id__(Block.block_id, block_id))
             block = session.execute(query).scalar_one_or_none()
 
             if not block:
                 raise BlockError("Block Not Found.")
             return self.__get_model_data__(block)
 
+    def get_chain_blocks(
+        self, block_height: int, limit: int, fields: Optional[Iterable[str]] = None
+    ) -> list[dict]:
+        """CRUD Operation: Read Chained Blocks after a Height, in Chain Order."""
+
+        fields = self.__get_fields__(Block, fields)
+        with get_session() as session:
+            query = (
+                select(Block)
+                .filter(as_column(Block.block_height) > block_height)
+                .order_by(as_column(Block.block_height))
+                .limit(limit)
+                .options(*self.__get_load_options__(Block, fields=fields))
+            )
+            blocks = session.execute(query).scalars()
+
+            return Block.to_dicts(blocks, fields)
+
+    def get_item_hashes(self, block_ids: list[UUID]) -> dict[str, list[str]]:
+        """CRUD Operation: Read Blocks' Payload Hashes, in Item Order, by ID."""
+
+        with get_session() as session:
+            query = (
+                select(as_column(BlockItem.block_id), Transaction, Contract)
+                .select_from(BlockItem)
+                .outerjoin(
+                    Transaction, as_column(Transaction.id) == BlockItem.transaction_id
+                )
+                .outerjoin(Contract, as_column(Contract.id) == BlockItem.contract_id)
+                .filter(as_column(BlockItem.block_id).in_(block_ids))
+                .order_by(as_column(BlockItem.block_id), as_column(BlockItem.position))
+            )
+            item_hashes: dict[str, list[str]] = {
+                str(block_id): [] for block_id in block_ids
+            }
+            for block_id, transaction, contract in session.execute(query):
+                item_hashes[str(block_id)].append((transaction or contract).to_hash())
+
+            return item_hashes
+
     def create_block(
         self,
         transaction_id: Optional[UUID] = None,
         contract_id: Optional[UUID] = None,
-    ) -> str:
+    ) -> dict:
         """CRUD Operation: Create Block."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
+            item = BlockItem()
+            item.block_id = self.id
+            item.position = 0
             if transaction_id:
-                self.transaction_id = transaction_id
+                self.transaction_id = item.transaction_id = transaction_id
+                payload = session.get(Transaction, transaction_id)
+                if payload is None:
+                    raise BlockError("Block Not Created.")
+                self.merkle_root = get_merkle_root([payload.to_hash()])
             if contract_id:
-                self.contract_id = contract_id
+                self.contract_id = item.contract_id = contract_id
+                payload = session.get(Contract, contract_id)
+                if payload is None:
+                    raise BlockError("Block Not Created.")
+                self.merkle_root = get_merkle_root([payload.to_hash()])
+            items = [item] if transaction_id or contract_id else []
+            # Mirrors the set_block_type_enum trigger, so the row needs no reload.
+            self.block_type = self.validate_serialiser_kwargs(
+                "block_type", BlockType.UNIT, model=self
+            )
 
             try:
                 session.add(self)
+                session.add_all(items)
+                session.flush()
+                data = self.__get_model_data__(self)
+                data["items"] = BlockItem.to_dicts(items)
                 session.commit()
             except IntegrityError as exc:
                 raise BlockError("Block Not Created." + str(exc)) from exc
 
-            return str(self)
+            return data
+
+    def pack_block(
+        self, block_type: BlockType, block_size: int, block_interval: timedelta
+    ) -> Optional[dict]:
+        """CRUD Operation: Seal Pending (Mempool) Items into a New Block.
+
+        A block is sealed once block_size items are pending, or once the oldest
+        pending item has waited block_interval; otherwise None is returned.
+        """
+
+        model: type[Transaction] | type[Contract]
+        match block_type:
+            case BlockType.TRANSACTION:
+                model, item_key = Transaction, "transaction_id"
+                is_approved = (
+                    as_column(Transaction.transaction_status) == TransactionStatus.APPROVED
+                )
+            case BlockType.CONTRACT:
+                model, item_key = Contract, "contract_id"
+                is_approved = (
+                    as_column(Contract.contract_status) == ContractStatus.APPROVED
+                )
+            case _:
+                raise BlockError("Invalid Block Type.")
+        item_column = as_column(getattr(BlockItem, item_key))
+        model_id = as_column(model.id)
+        updated_date = as_column(model.updated_date)
+        is_pending = and_(is_approved, ~exists().where(item_column == model_id))
+
+        with get_session() as session:
+            pending_query = select(
+                func.count(model_id),
+                func.bool_or(updated_date <= func.localtimestamp() - block_interval),
+            ).filter(is_pending)
+            pending_size, is_due = session.execute(pending_query).one()
+            if pending_size < block_size and not is_due:
+                return None
+
+            payload_query = (
+                select(model, model_id)
+                .filter(is_pending)
+                .order_by(updated_date, model_id)
+                .limit(block_size)
+                .with_for_update(skip_locked=True)
+            )
+            payloads = session.execute(payload_query).all()
+            if not payloads:
+                return None
+
+            self.block_type = block_type
+            self.merkle_root = get_merkle_root([payload.to_hash() for payload, _ in payloads])
+            items = []
+            for position, (_, payload_id) in enumerate(payloads):
+                item = BlockItem()
+                item.block_id = self.id
+                item.position = position
+                setattr(item, item_key, payload_id)
+                items.append(item)
+
+            try:
+                session.add(self)
+                session.add_all(items)
+                session.flush()
+                data = self.__get_model_data__(self)
+                data["items"] = BlockItem.to_dicts(items)
+                session.commit()
+            except IntegrityError as exc:
+                raise BlockError("Block Not Created.") from exc
+
+            return data
 
     def update_block(
         self,
@@ -72,39 +257,174 @@ class BlockSerialiser(Block, BaseSerialiser):
     ) -> str:
         """CRUD Operation: Update Block."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             block = session.get(Block, private_id)
 
             if block is None:
                 raise BlockError("Block Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in BlockSerialiser.__MUTABLE_KWARGS__:
-                    raise BlockError("Invalid Block.")
-                value = self.validate_serialiser_kwargs(key, value, model=block)
+            for key, value in self.validate_many(kwargs, model=block).items():
                 setattr(block, key, value)
+            block_id = str(block.block_id)
 
             try:
                 session.add(block)
                 session.commit()
             except IntegrityError as exc:
                 raise BlockError("Block Not Updated.") from exc
+            self.__invalidate__(block_id)
 
             return str(Block)
 
+    def append_blocks(
+        self, block_ids: list[UUID]
+    ) -> tuple[list[dict], Optional[dict]]:
+        """CRUD Operation: Link Blocks onto the Chain Tail, in one Transaction."""
+
+        if not block_ids or len(set(block_ids)) != len(block_ids):
+            raise BlockError("Invalid Blocks.")
+
+        with get_session() as session:
+            chain_head = ChainHeadSerialiser.lock_chain_head(session)
+            query = select(Block).filter(
+                or_(
+                    as_column(Block.block_id).in_(block_ids),
+                    Block.id == chain_head.block_id,
+                )
+            )
+            found = {block.id: block for block in session.execute(query).scalars()}
+
+            previous_block = found.pop(chain_head.block_id, None)
+            if chain_head.block_id and previous_block is None:
+                raise BlockError("Invalid Chain Head.")
+            if previous_block and previous_block.next_block_id:
+                raise BlockError("Invalid Chain Head.")
+            if previous_block and previous_block.block_id in block_ids:
+                raise BlockError("Invalid Block.")
+            found = {block.block_id: block for block in found.values()}
+
+            blocks = []
+            for block_id in block_ids:
+                block = found.get(block_id)
+                if block is None:
+                    raise BlockError("Block Not Found.")
+                if not block.merkle_root and not (
+                    block.transaction_id or block.contract_id
+                ):
+                    raise BlockError("Invalid Transaction Block.")
+                if block.previous_block_id or block.next_block_id:
+                    raise BlockError("Invalid Block.")
+                blocks.append(block)
+
+            chain = [previous_block, *blocks] if previous_block else blocks
+            links = []
+            previous_block_hash = previous_block.block_hash if previous_block else None
+            block_height: int = (
+                int(previous_block.block_height or 0) if previous_block else 0
+            )
+            for index, block in enumerate(chain):
+                block_hash = None
+                if block is not previous_block:
+                    block_height += 1
+                    block_hash = self.get_block_hash(
+                        block.block_id, block.merkle_root, previous_block_hash
+                    )
+                links.append(
+                    (
+                        block.id,
+                        chain[index - 1].id if index > 0 else None,
+                        chain[index + 1].id if index < len(chain) - 1 else None,
+                        previous_block_hash if block is not previous_block else None,
+                        block_hash,
+                        block_height if block is not previous_block else None,
+                    )
+                )
+                previous_block_hash = block_hash or previous_block_hash
+            link_values = values(
+                column("id", uuid(as_uuid=True)),
+                column("previous_block_id", uuid(as_uuid=True)),
+                column("next_block_id", uuid(as_uuid=True)),
+                column("previous_block_hash", String),
+                column("block_hash", String),
+                column("block_height", BigInteger),
+                name="links",
+            ).data(links)
+            link_query = (
+                update(Block)
+                .where(as_column(Block.id) == link_values.c.id)
+                .values(
+                    previous_block_id=func.coalesce(
+                        cast(link_values.c.previous_block_id, uuid),
+                        Block.previous_block_id,
+                    ),
+                    next_block_id=func.coalesce(
+                        cast(link_values.c.next_block_id, uuid), Block.next_block_id
+                    ),
+                    previous_block_hash=func.coalesce(
+                        cast(link_values.c.previous_block_hash, String),
+                        Block.previous_block_hash,
+                    ),
+                    block_hash=func.coalesce(
+                        cast(link_values.c.block_hash, String), Block.block_hash
+                    ),
+                    block_height=func.coalesce(
+                        cast(link_values.c.block_height, BigInteger),
+                        Block.block_height,
+                    ),
+                )
+                .returning(Block)
+                .execution_options(synchronize_session=False)
+            )
+            chain_ids = [str(block.block_id) for block in chain]
+            for block in chain:
+                session.expunge(block)
+
+            chain_head.block_id = blocks[-1].id
+
+            try:
+                updated = {
+                    block.id: block for block in session.execute(link_query).scalars()
+                }
+                data = (
+                    Block.to_dicts(updated[block.id] for block in blocks),
+                    self.__get_model_data__(updated[previous_block.id])
+                    if previous_block
+                    else None,
+                )
+                session.commit()
+            except IntegrityError as exc:
+                raise BlockError("Blocks Not Appended.") from exc
+            self.__invalidate__(*chain_ids)
+
+            return data
+
+    @staticmethod
+    def get_block_hash(
+        block_id: UUID | Column[UUID],
+        merkle_root: Optional[str | Column[str]],
+        previous_block_hash: Optional[str | Column[str]],
+    ) -> str:
+        """Hashes a Block's Payload (Merkle Root) onto the Previous Block's Hash."""
+
+        return get_hash_value(
+            str(block_id) + str(merkle_root or ""), str(previous_block_hash or "")
+        )
+
     def delete_block(self, private_id: str) -> str:
         """CRUD Operation: Delete Block."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             block = session.get(Block, private_id)
 
             if not block:
                 raise BlockError("Block Not Found")
+            block_id = str(block.block_id)
 
             try:
                 session.delete(block)
                 session.commit()
             except IntegrityError as exc:
                 raise BlockError("Block Not Deleted.") from exc
+            self.__invalidate__(block_id)
 
             return f"Deleted: {private_id}"
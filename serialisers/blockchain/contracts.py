@@ -1,13 +1,14 @@
 """Contracts: Serialiser for Contract Model."""
 
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import String, cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from lib.interfaces.exceptions import ContractError
+from lib.utils.caching.cache import ReadThroughCache
 from lib.utils.encryption.encoders import get_hash_value
-from models import ENGINE
+from models import get_session
 from models.blockchain.contracts import Contract
 from models.user.payments import PaymentProfile
 from models.warehouse.cards import Card
@@ -18,14 +19,30 @@ class ContractSerialiser(Contract, BaseSerialiser):
     """Serialiser for the Contract Model."""
 
     __SERIALISER_EXCEPTION__ = ContractError
-    __MUTABLE_KWARGS__: list[str] = ["title", "description", "contract_status"]
-
-    def get_contract(self, contract_id: str) -> dict:
-        """CRUD Operation: Read Contract."""
-
-        with Session(ENGINE) as session:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "title",
+            "description",
+            "contract_status",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid Contract."
+    __CACHE__ = ReadThroughCache("contracts")
+
+    def get_contract(
+        self, contract_id: str, fields: Optional[Iterable[str]] = None
+    ) -> dict:
+        """CRUD Operation: Read Contract (Cached)."""
+
+        fields = self.__get_fields__(Contract, fields)
+        return self.__read_through__(contract_id, self.__load_contract__, fields)
+
+    def __load_contract__(self, contract_id: str) -> dict:
+        """Reads a Contract from the Database."""
+
+        with get_session() as session:
             query = select(Contract).filter(
-                cast(Contract.contract_id, String) == contract_id
+                self.__match_id__(Contract.contract_id, contract_id)
             )
             contract = session.execute(query).scalar_one_or_none()
 
@@ -34,10 +51,10 @@ class ContractSerialiser(Contract, BaseSerialiser):
 
             return self.__get_model_data__(contract)
 
-    def create_contract(self, contractor: UUID, contractee: UUID, contract: str) -> str:
+    def create_contract(self, contractor: UUID, contractee: UUID, contract: str) -> dict:
         """CRUD Operation: Create Contract."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             contractor_profile = session.get(PaymentProfile, contractor)
             contractee_profile = session.get(PaymentProfile, contractee)
             if not contractor_profile:
@@ -69,18 +86,20 @@ class ContractSerialiser(Contract, BaseSerialiser):
 
             try:
                 session.add(self)
+                session.flush()
+                data = self.__get_model_data__(self)
                 session.commit()
             except IntegrityError as exc:
                 raise ContractError("Contract Not Created.") from exc
 
-            return str(self)
+            return data
 
     def update_contract(
         self, private_id: UUID, contractor_signiture: str, contractee_signiture: str, **kwargs
     ) -> str:
         """CRUD Operation: Update Contract."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             contract = session.get(Contract, private_id)
 
             if contract is None:
@@ -91,34 +110,39 @@ class ContractSerialiser(Contract, BaseSerialiser):
             if contract.contractee_signiture != contractee_signiture:
                 raise ContractError("Receiver Not Authorised.")
 
-            for key, value in kwargs.items():
-                if key not in ContractSerialiser.__MUTABLE_KWARGS__:
-                    raise ContractError("Invalid Contract.")
-                if value != getattr(contract, key):
-                    value = self.validate_serialiser_kwargs(key, value, model=contract)
-                    setattr(contract, key, value)
+            changes = {
+                key: value
+                for key, value in kwargs.items()
+                if key not in self.__MUTABLE_KWARGS__ or value != getattr(contract, key)
+            }
+            for key, value in self.validate_many(changes, model=contract).items():
+                setattr(contract, key, value)
+            contract_id = str(contract.contract_id)
 
             try:
                 session.add(contract)
                 session.commit()
             except IntegrityError as exc:
                 raise ContractError("Contract Not Updated.") from exc
+            self.__invalidate__(contract_id)
 
             return str(Contract)
 
     def delete_contract(self, private_id: UUID) -> str:
         """CRUD Operation: Delete Contract."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             contract = session.get(Contract, private_id)
 
             if not contract:
                 raise ContractError("Contract Not Found")
+            contract_id = str(contract.contract_id)
 
             try:
                 session.delete(contract)
                 session.commit()
             except IntegrityError as exc:
                 raise ContractError("Contract Not Deleted.") from exc
+            self.__invalidate__(contract_id)
 
             return f"Deleted: {private_id}"
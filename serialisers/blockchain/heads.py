@@ -0,0 +1,95 @@
+"""Heads: Serialiser for Chain Head Model."""
+
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from lib.interfaces.exceptions import BlockError
+from models import get_session
+from models.blockchain.blocks import Block
+from models.blockchain.heads import ChainHead
+from models.model import as_column
+from serialisers.serialiser import BaseSerialiser
+
+
+class ChainHeadSerialiser(ChainHead, BaseSerialiser):
+    """Serialiser for the Chain Head Model."""
+
+    __SERIALISER_EXCEPTION__ = BlockError
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset()
+    __CHAIN_ID__ = "main"
+
+    def get_chain_head(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """CRUD Operation: Read Chain Head."""
+
+        fields = self.__get_fields__(ChainHead, fields)
+        with get_session() as session:
+            query = (
+                select(ChainHead)
+                .filter(ChainHead.chain_id == ChainHeadSerialiser.__CHAIN_ID__)
+                .options(*self.__get_load_options__(ChainHead, fields=fields))
+            )
+            chain_head = session.execute(query).scalar_one_or_none()
+
+            if not chain_head:
+                raise BlockError("Chain Head Not Found.")
+
+            return self.__get_model_data__(chain_head, fields=fields)
+
+    def get_chain_tail(self, fields: Optional[Iterable[str]] = None) -> Optional[dict]:
+        """CRUD Operation: Read the Chain Head's Tail Block."""
+
+        fields = self.__get_fields__(Block, fields)
+        with get_session() as session:
+            query = (
+                select(Block)
+                .join(ChainHead, as_column(ChainHead.block_id) == Block.id)
+                .filter(ChainHead.chain_id == ChainHeadSerialiser.__CHAIN_ID__)
+                .options(*self.__get_load_options__(Block, fields=fields))
+            )
+            block = session.execute(query).scalar_one_or_none()
+
+            if not block:
+                return None
+
+            return self.__get_model_data__(block, fields=fields)
+
+    def update_chain_checkpoint(self, block_id: UUID, block_height: int) -> str:
+        """CRUD Operation: Update the Chain Head's Verified Block."""
+
+        with get_session() as session:
+            chain_head = self.lock_chain_head(session)
+            chain_head.verified_block_id = block_id
+            chain_head.verified_height = block_height
+
+            try:
+                session.add(chain_head)
+                session.commit()
+            except IntegrityError as exc:
+                raise BlockError("Chain Head Not Updated.") from exc
+
+            return str(chain_head)
+
+    @staticmethod
+    def lock_chain_head(session: Session) -> ChainHead:
+        """Locks the Chain Head Row (SELECT ... FOR UPDATE) for the Session."""
+
+        query = (
+            select(ChainHead)
+            .filter(ChainHead.chain_id == ChainHeadSerialiser.__CHAIN_ID__)
+            .with_for_update()
+        )
+        chain_head: Optional[ChainHead] = session.execute(query).scalar_one_or_none()
+        if chain_head is None:
+            session.execute(
+                insert(ChainHead)
+                .values(id=uuid4(), chain_id=ChainHeadSerialiser.__CHAIN_ID__)
+                .on_conflict_do_nothing(index_elements=[ChainHead.chain_id])
+            )
+            chain_head = session.execute(query).scalar_one_or_none()
+        if chain_head is None:
+            raise BlockError("Chain Head Not Found.")
+        return chain_head
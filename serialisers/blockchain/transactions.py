@@ -1,14 +1,16 @@
 """Transactions: Serialiser for Transaction Model."""
 
-from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 
 from lib.interfaces.exceptions import TransactionError
+from lib.utils.caching.cache import ReadThroughCache
 from lib.utils.encryption.encoders import get_hash_value
-from models import ENGINE
+from models import get_session
 from models.blockchain.transactions import Transaction
+from models.model import as_column
 from models.user.payments import PaymentProfile
 from models.warehouse.cards import Card
 from serialisers.serialiser import BaseSerialiser
@@ -18,19 +20,31 @@ class TransactionSerialiser(Transaction, BaseSerialiser):
     """Serialiser for the Transaction Model."""
 
     __SERIALISER_EXCEPTION__ = TransactionError
-    __MUTABLE_KWARGS__: list[str] = [
-        "title",
-        "description",
-        "amount",
-        "transaction_status",
-    ]
-
-    def get_transaction(self, transaction_id: str) -> dict:
-        """CRUD Operation: Read Transaction."""
-
-        with Session(ENGINE) as session:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "title",
+            "description",
+            "amount",
+            "transaction_status",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid Transaction."
+    __CACHE__ = ReadThroughCache("transactions")
+
+    def get_transaction(
+        self, transaction_id: str, fields: Optional[Iterable[str]] = None
+    ) -> dict:
+        """CRUD Operation: Read Transaction (Cached)."""
+
+        fields = self.__get_fields__(Transaction, fields)
+        return self.__read_through__(transaction_id, self.__load_transaction__, fields)
+
+    def __load_transaction__(self, transaction_id: str) -> dict:
+        """Reads a Transaction from the Database."""
+
+        with get_session() as session:
             query = select(Transaction).filter(
-                cast(Transaction.transaction_id, uuid) == transaction_id
+                self.__match_id__(Transaction.transaction_id, transaction_id)
             )
             transaction = session.execute(query).scalar_one_or_none()
 
@@ -39,10 +53,10 @@ class TransactionSerialiser(Transaction, BaseSerialiser):
 
             return self.__get_model_data__(transaction)
 
-    def create_transaction(self, sender: UUID, receiver: UUID, amount: float) -> str:
+    def create_transaction(self, sender: UUID, receiver: UUID, amount: float) -> dict:
         """CRUD Operation: Create Transaction."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             sender_profile = session.get(PaymentProfile, sender)
             receiver_profile = session.get(PaymentProfile, receiver)
             if not sender_profile:
@@ -73,18 +87,88 @@ class TransactionSerialiser(Transaction, BaseSerialiser):
 
             try:
                 session.add(self)
+                session.flush()
+                data = self.__get_model_data__(self)
                 session.commit()
             except IntegrityError as exc:
                 raise TransactionError("Transaction Not Created.") from exc
 
-            return str(self)
+            return data
+
+    def create_transactions_bulk(
+        self, transactions: list[tuple[UUID, UUID, float]]
+    ) -> list[dict]:
+        """CRUD Operation: Create Transactions, from (Sender, Receiver, Amount).
+
+        Payment profiles and cards are resolved in one query, and the rows are
+        inserted with batched multi-row INSERT ... RETURNING statements.
+        """
+
+        if not transactions:
+            raise TransactionError("Invalid Transactions.")
+
+        with get_session() as session:
+            profile_ids = {
+                profile_id
+                for sender, receiver, _ in transactions
+                for profile_id in (sender, receiver)
+            }
+            card_query = (
+                select(as_column(PaymentProfile.id), as_column(Card.card_id))
+                .outerjoin(Card, as_column(Card.id) == PaymentProfile.card_id)
+                .filter(as_column(PaymentProfile.id).in_(profile_ids))
+            )
+            card_ids = dict(session.execute(card_query).tuples().all())
+
+            rows = []
+            for sender, receiver, amount in transactions:
+                if sender not in card_ids:
+                    raise TransactionError("Invalid Sender.")
+                if receiver not in card_ids:
+                    raise TransactionError("Invalid Receiver.")
+                if card_ids[sender] is None:
+                    raise TransactionError("Invalid Sender Card Information.")
+                if card_ids[receiver] is None:
+                    raise TransactionError("Invalid Receiver Card Information.")
+
+                salt_value = uuid4()
+                rows.append(
+                    {
+                        "id": uuid4(),
+                        "transaction_id": uuid4(),
+                        "sender": sender,
+                        "receiver": receiver,
+                        "amount": self.validate_serialiser_kwargs(
+                            "amount", amount, model=self
+                        ),
+                        "sender_signiture": get_hash_value(
+                            str(card_ids[sender]), str(salt_value)
+                        ),
+                        "receiver_signiture": get_hash_value(
+                            str(card_ids[receiver]), str(salt_value)
+                        ),
+                        "salt_value": salt_value,
+                    }
+                )
+
+            try:
+                insert_query = insert(Transaction).returning(
+                    Transaction, sort_by_parameter_order=True
+                )
+                created = session.execute(insert_query, rows).scalars().all()
+                data = Transaction.to_dicts(created)
+                session.commit()
+            except IntegrityError as exc:
+                raise TransactionError("Transactions Not Created.") from exc
+
+            return data
 
     def update_transaction(
         self, private_id: str, sender_signiture: str, receiver_signiture: str, **kwargs
     ) -> str:
         """CRUD Operation: Update Transaction."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             transaction = session.get(Transaction, private_id)
 
             if transaction is None:
@@ -95,34 +179,39 @@ class TransactionSerialiser(Transaction, BaseSerialiser):
             if transaction.receiver_signiture != receiver_signiture:
                 raise TransactionError("Receiver Not Authorised.")
 
-            for key, value in kwargs.items():
-                if key not in TransactionSerialiser.__MUTABLE_KWARGS__:
-                    raise TransactionError("Invalid Transaction.")
-                if value != getattr(transaction, key):
-                    value = self.validate_serialiser_kwargs(key, value, model=transaction)
-                    setattr(transaction, key, value)
+            changes = {
+                key: value
+                for key, value in kwargs.items()
+                if key not in self.__MUTABLE_KWARGS__ or value != getattr(transaction, key)
+            }
+            for key, value in self.validate_many(changes, model=transaction).items():
+                setattr(transaction, key, value)
+            transaction_id = str(transaction.transaction_id)
 
             try:
                 session.add(transaction)
                 session.commit()
             except IntegrityError as exc:
                 raise TransactionError("Transaction Not Updated.") from exc
+            self.__invalidate__(transaction_id)
 
             return str(transaction)
 
     def delete_transaction(self, private_id: str) -> str:
         """CRUD Operation: Delete Transaction."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             transaction = session.get(Transaction, private_id)
 
             if not transaction:
                 raise TransactionError("Transaction Not Found")
+            transaction_id = str(transaction.transaction_id)
 
             try:
                 session.delete(transaction)
                 session.commit()
             except IntegrityError as exc:
                 raise TransactionError("Transaction Not Deleted.") from exc
+            self.__invalidate__(transaction_id)
 
             return f"Deleted: {private_id}"
@@ -1,10 +1,17 @@
 """Serialiser: Base Serialiser for model Model."""
 
-from enum import Enum, EnumMeta
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
 from json import dumps
-from typing import Any, Tuple, Union
+from typing import Any, Callable, Iterable, Optional, Union
+
+from sqlalchemy import ColumnElement, false
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
 from lib.interfaces.exceptions import ApplicationError
+from lib.utils.caching.cache import ReadThroughCache
+from lib.utils.constants.serialisers import LoadStrategy
 from lib.utils.encryption.cryptography import encrypt_data
 from lib.validators.blocks import (
     validate_block_next,
@@ -33,15 +40,32 @@ from lib.validators.users import (
     validate_status,
     validate_username,
 )
+from models import UNIT_OF_WORK, on_commit
 from models.model import BaseModel
 
+IncludeSpec = Union[Iterable[str], dict[str, LoadStrategy]]
+
+
+@dataclass(frozen=True)
+class ColumnMetaData:
+    """A Column's Python Type, Nullability and Validator."""
+
+    python_type: type
+    nullable: bool
+    validator: Optional[Callable[..., Any]]
+
 
 class BaseSerialiser:
     """A Base/Abstract Serialiser."""
 
-    __table__ = None
     __SERIALISER_EXCEPTION__: type[BaseException] = ApplicationError
-    __VALIDATORS__ = {
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset()
+    __MUTABLE_ERROR__: str = "Invalid Attribute."
+    __COLUMN_METADATA__: dict[str, ColumnMetaData] = {}
+    __RELATIONSHIPS__: dict[str, LoadStrategy] = {}
+    __LOADERS__ = {LoadStrategy.JOINED: joinedload, LoadStrategy.SELECTIN: selectinload}
+    __CACHE__: Optional[ReadThroughCache] = None
+    __VALIDATORS__: dict[str, Callable[..., Any]] = {
         # User Profile
         "status": validate_status,
         "first_name": validate_first_name,
@@ -71,6 +95,22 @@ class BaseSerialiser:
         "next_block_id": validate_block_next,
     }
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Builds the Column Meta-Data Registry, Once per Serialiser."""
+
+        super().__init_subclass__(**kwargs)
+        cls.__MUTABLE_KWARGS__ = frozenset(cls.__MUTABLE_KWARGS__)
+        table = getattr(cls, "__table__", None)
+        if table is not None:
+            cls.__COLUMN_METADATA__ = {
+                column.name: ColumnMetaData(
+                    column.type.python_type,
+                    column.nullable,
+                    cls.__VALIDATORS__.get(column.name),
+                )
+                for column in table.columns
+            }
+
     def __str__(self) -> str:
         """String Representation of the Base Serialiser."""
 
@@ -84,44 +124,162 @@ class BaseSerialiser:
     def validate_serialiser_kwargs(self, key: str, value: Any, model=None) -> Any:
         """Updates Validated Model Attributes."""
 
-        data_type, nullable, validator = self.__get_column_data__(key)
+        column = self.__get_column_data__(key)
 
-        if not nullable and value is None:
+        if not column.nullable and value is None:
             raise self.__SERIALISER_EXCEPTION__("Non-Nullable Attribute.")
 
-        if not isinstance(value, data_type) and value is not None:
+        if not isinstance(value, column.python_type) and value is not None:
             raise self.__SERIALISER_EXCEPTION__("Invalid Type for this Attribute.")
 
-        if validator is not None and hasattr(validator, "__call__"):
-            value = validator(value, model=model)
+        if column.validator is not None:
+            value = column.validator(value, model=model)
 
         return value
 
-    def __get_column_data__(
-        self, key: str
-    ) -> Tuple[EnumMeta, bool, Union["function", None]]:
+    def validate_many(self, kwargs: dict[str, Any], model=None) -> dict[str, Any]:
+        """Validates Mutable Model Attributes, in a Single Pass."""
+
+        for key in kwargs:
+            if key not in self.__MUTABLE_KWARGS__:
+                raise self.__SERIALISER_EXCEPTION__(self.__MUTABLE_ERROR__)
+
+        return {
+            key: self.validate_serialiser_kwargs(key, value, model=model)
+            for key, value in kwargs.items()
+        }
+
+    def __get_column_data__(self, key: str) -> ColumnMetaData:
         """Extract a Columns Meta-Data."""
 
-        if self.__table__ is None:
+        column = self.__COLUMN_METADATA__.get(key)
+        if column is None:
             raise self.__SERIALISER_EXCEPTION__("Invalid Table Meta Data")
+        return column
+
+    @classmethod
+    def __get_includes__(cls, include: Optional[IncludeSpec]) -> dict[str, LoadStrategy]:
+        """Resolves an Include Spec: Relationship Names, or Names to Strategies.
+
+        No spec includes every relationship, with its default strategy.
+        """
 
-        column = dict(self.__table__.columns).get(key)
-        return (
-            column.type.python_type,
-            column.nullable,
-            self.__VALIDATORS__.get(column.name),
+        if include is None:
+            return cls.__RELATIONSHIPS__
+        strategies = (
+            include
+            if isinstance(include, dict)
+            else {name: cls.__RELATIONSHIPS__.get(name) for name in include}
         )
 
+        includes: dict[str, LoadStrategy] = {}
+        for name, strategy in strategies.items():
+            if name not in cls.__RELATIONSHIPS__ or not isinstance(strategy, LoadStrategy):
+                raise cls.__SERIALISER_EXCEPTION__("Invalid Include.")
+            includes[name] = strategy
+        return includes
+
+    @staticmethod
+    def __match_id__(column: Any, public_id: Any) -> ColumnElement[bool]:
+        """Compares a Column to an ID, Coerced to the Column's Native Type.
+
+        Leaves the column bare (so its index is usable); IDs that cannot be
+        coerced match no rows.
+        """
+
+        python_type = column.type.python_type
+        if public_id is None:
+            return false()
+        if not isinstance(public_id, python_type):
+            try:
+                public_id = python_type(str(public_id))
+            except (TypeError, ValueError):
+                return false()
+        return column == public_id
+
+    @classmethod
+    def __read_through__(
+        cls,
+        public_id: Any,
+        loader: Callable[[Any], dict],
+        fields: Optional[tuple[str, ...]] = None,
+        ttl: Optional[Callable[[dict], Optional[float]]] = None,
+    ) -> dict:
+        """Reads a Row's Data through the Serialiser's Cache, by Public ID.
+
+        Rows read within a unit of work are not cached, as they may be rolled
+        back. Fields are projected from the cached row.
+        """
+
+        cache = cls.__CACHE__
+        data = cache.get(str(public_id)) if cache else None
+        if data is None:
+            data = loader(public_id)
+            if cache and UNIT_OF_WORK.get() is None:
+                cache.set(str(public_id), data, ttl(data) if ttl else None)
+        if fields is not None:
+            data = {name: data[name] for name in fields}
+        return data
+
     @classmethod
-    def __get_encrypted_model_data__(cls, model: BaseModel) -> str:
+    def __invalidate__(cls, *public_ids: str) -> None:
+        """Drops Rows from the Serialiser's Cache, once their Changes Commit.
+
+        Within a unit of work, this waits for the outer transaction, so no
+        reader re-caches a row's pre-commit data in between.
+        """
+
+        if cls.__CACHE__ is not None:
+            on_commit(partial(cls.__CACHE__.invalidate, *public_ids))
+
+    @classmethod
+    def __get_fields__(
+        cls, model: type[BaseModel], fields: Optional[Iterable[str]]
+    ) -> Optional[tuple[str, ...]]:
+        """Validates a Field Projection, Returning it in Column Order."""
+
+        if fields is None:
+            return None
+        fields = set(fields)
+        columns = model.__table__.columns.keys()
+        if not fields or not fields.issubset(columns):
+            raise cls.__SERIALISER_EXCEPTION__("Invalid Fields.")
+        return tuple(name for name in columns if name in fields)
+
+    @classmethod
+    def __get_load_options__(
+        cls,
+        model: type[BaseModel],
+        include: Optional[IncludeSpec] = None,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> list:
+        """Maps an Include Spec and Field Projection to Query Loader Options."""
+
+        options = [
+            cls.__LOADERS__[strategy](getattr(model, name))
+            for name, strategy in cls.__get_includes__(include).items()
+        ]
+        if fields is not None:
+            options.append(load_only(*(getattr(model, name) for name in fields)))
+        return options
+
+    @classmethod
+    def __get_encrypted_model_data__(
+        cls,
+        model: BaseModel,
+        include: Optional[IncludeSpec] = None,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> str:
         """Get model Information."""
 
-        data = model.to_dict()
-        if hasattr(model, "login_history"):
+        data = model.to_dict(fields)
+        if "login_history" in cls.__get_includes__(include) and hasattr(
+            model, "login_history"
+        ):
             data.update(
                 {
                     "login_history": [
-                        cls.__get_encrypted_model_data__(login_history)
+                        cls.__get_encrypted_model_data__(login_history, include=())
                         for login_history in model.login_history
                         if login_history.logged_in
                     ]
@@ -134,34 +292,15 @@ class BaseSerialiser:
         return encrypt_data(dumps(data).encode())
 
     @classmethod
-    def __get_model_data__(cls, model: BaseModel) -> dict:
-        """Gets the Model Data."""
-
-        data = model.to_dict()
-        if hasattr(model, "user_profiles"):
-            data.update(
-                {
-                    "user_profiles": [
-                        profile.to_dict() for profile in model.user_profiles
-                    ]
-                }
-            )
-
-        if hasattr(model, "payment_profiles"):
-            data.update(
-                {
-                    "payment_profiles": [
-                        payment.to_dict() for payment in model.payment_profiles
-                    ]
-                }
-            )
+    def __get_model_data__(
+        cls,
+        model: BaseModel,
+        include: Optional[IncludeSpec] = None,
+        fields: Optional[tuple[str, ...]] = None,
+    ) -> dict:
+        """Gets the Model Data (or only its Fields), with Included Relationships."""
 
-        if hasattr(model, "settings_profile"):
-            data.update(
-                {
-                    "settings_profile": [
-                        settings.to_dict() for settings in model.settings_profile
-                    ]
-                }
-            )
+        data = model.to_dict(fields)
+        for name in cls.__get_includes__(include):
+            data[name] = [item.to_dict() for item in getattr(model, name)]
         return data
@@ -1,38 +1,57 @@
 """Accounts: Serialiser for Account Model."""
 
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from lib.interfaces.exceptions import AccountError
-from models import ENGINE
+from lib.utils.constants.serialisers import LoadStrategy
+from models import get_session
 from models.user.accounts import Account
-from serialisers.serialiser import BaseSerialiser
+from serialisers.serialiser import BaseSerialiser, IncludeSpec
 
 
 class AccountSerialiser(Account, BaseSerialiser):
     """Serialiser for the Account Model."""
 
     __SERIALISER_EXCEPTION__ = AccountError
-    __MUTABLE_KWARGS__: list[str] = ["status"]
-
-    def get_account(self, account_id: UUID) -> dict:
-        """CRUD Operation: Read Account."""
-
-        with Session(ENGINE) as session:
-            query = select(Account).filter(cast(Account.account_id, uuid) == account_id)
-            account = session.execute(query).scalar_one_or_none()
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset({"status"})
+    __MUTABLE_ERROR__ = "Invalid Account."
+    # Joined in one query; sibling collections multiply the rows returned (one
+    # per combination of profiles), which unique() folds back into the account.
+    __RELATIONSHIPS__ = {
+        "user_profiles": LoadStrategy.JOINED,
+        "payment_profiles": LoadStrategy.JOINED,
+        "settings_profile": LoadStrategy.JOINED,
+    }
+
+    def get_account(
+        self,
+        account_id: UUID,
+        include: Optional[IncludeSpec] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> dict:
+        """CRUD Operation: Read Account, Eager-Loading the Included Relationships."""
+
+        fields = self.__get_fields__(Account, fields)
+        with get_session() as session:
+            query = (
+                select(Account)
+                .filter(self.__match_id__(Account.account_id, account_id))
+                .options(*self.__get_load_options__(Account, include, fields))
+            )
+            account = session.execute(query).unique().scalar_one_or_none()
 
             if not account:
                 raise AccountError("Account Not Found.")
 
-            return self.__get_model_data__(account)
+            return self.__get_model_data__(account, include, fields)
 
     def create_account(self, user_id: UUID) -> str:
         """CRUD Operation: Create Account."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.user_id = user_id
 
             try:
@@ -46,17 +65,13 @@ class AccountSerialiser(Account, BaseSerialiser):
     def update_account(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update Account."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             account = session.get(Account, private_id)
 
             if account is None:
                 raise AccountError("Account Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in AccountSerialiser.__MUTABLE_KWARGS__:
-                    raise AccountError("Invalid Account.")
-
-                value = self.validate_serialiser_kwargs(key, value)
+            for key, value in self.validate_many(kwargs).items():
                 setattr(account, key, value)
 
             try:
@@ -70,7 +85,7 @@ class AccountSerialiser(Account, BaseSerialiser):
     def delete_account(self, private_id: UUID) -> str:
         """CRUD Operation: Delete Account."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             account = session.get(Account, private_id)
 
             if not account:
@@ -1,11 +1,11 @@
 """Payments: Serialiser for Payment Profile Model."""
 
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from lib.interfaces.exceptions import PaymentProfileError
-from models import ENGINE
+from models import get_session
 from models.user.payments import PaymentProfile
 from serialisers.serialiser import BaseSerialiser
 
@@ -14,31 +14,39 @@ class PaymentProfileSerialiser(PaymentProfile, BaseSerialiser):
     """Serialiser for the Payment Profile Model."""
 
     __SERIALISER_EXCEPTION__ = PaymentProfileError
-    __MUTABLE_KWARGS__: list[str] = [
-        "name",
-        "description",
-        "status",
-        "balance",
-    ]
-
-    def get_payment_profile(self, payment_id: UUID) -> dict:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "name",
+            "description",
+            "status",
+            "balance",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid User Profile."
+
+    def get_payment_profile(
+        self, payment_id: UUID, fields: Optional[Iterable[str]] = None
+    ) -> dict:
         """CRUD Operation: Get Payment Profile."""
 
-        with Session(ENGINE) as session:
-            query = select(PaymentProfile).filter(
-                cast(PaymentProfile.payment_id, uuid) == payment_id
+        fields = self.__get_fields__(PaymentProfile, fields)
+        with get_session() as session:
+            query = (
+                select(PaymentProfile)
+                .filter(self.__match_id__(PaymentProfile.payment_id, payment_id))
+                .options(*self.__get_load_options__(PaymentProfile, fields=fields))
             )
             payment_profile = session.execute(query).scalar_one_or_none()
 
             if not payment_profile:
                 raise PaymentProfileError("Payment Profile not Found.")
 
-            return self.__get_model_data__(payment_profile)
+            return self.__get_model_data__(payment_profile, fields=fields)
 
     def create_payment_profile(self, account_id: UUID, card_id: UUID) -> str:
         """CRUD Operation: Add Payment Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.card_id = card_id
             self.account_id = account_id
 
@@ -53,17 +61,13 @@ class PaymentProfileSerialiser(PaymentProfile, BaseSerialiser):
     def update_payment_profile(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update Payment Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             payment_profile = session.get(PaymentProfile, private_id)
 
             if payment_profile is None:
                 raise PaymentProfileError("Payment Profile Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in PaymentProfileSerialiser.__MUTABLE_KWARGS__:
-                    raise PaymentProfileError("Invalid User Profile.")
-
-                value = self.validate_serialiser_kwargs(key, value)
+            for key, value in self.validate_many(kwargs).items():
                 setattr(payment_profile, key, value)
 
             try:
@@ -77,7 +81,7 @@ class PaymentProfileSerialiser(PaymentProfile, BaseSerialiser):
     def delete_payment_profile(self, private_id: UUID) -> str:
         """CRUD Operation: Delete Payment Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             payment_profile = session.get(PaymentProfile, private_id)
 
             if not payment_profile:
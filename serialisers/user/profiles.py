@@ -1,12 +1,11 @@
 """Profiles: Serialiser for User Profile Model."""
 
-from typing import Union
+from typing import Iterable, Optional, Union
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from lib.interfaces.exceptions import UserProfileError
-from models import ENGINE
+from models import get_session
 from models.user.profiles import UserProfile
 from serialisers.serialiser import BaseSerialiser
 
@@ -15,39 +14,49 @@ class UserProfileSerialiser(UserProfile, BaseSerialiser):
     """Serialiser for the User Profile Model."""
 
     __SERIALISER_EXCEPTION__ = UserProfileError
-    __MUTABLE_KWARGS__: list[str] = [
-        "first_name",
-        "last_name",
-        "username",
-        "date_of_birth",
-        "gender",
-        "profile_picture",
-        "mobile_number",
-        "country",
-        "language",
-        "biography",
-        "occupation",
-        "interests",
-        "social_media_links",
-        "status",
-    ]
-
-    def get_user_profile(self, profile_id: UUID) -> dict:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "first_name",
+            "last_name",
+            "username",
+            "date_of_birth",
+            "gender",
+            "profile_picture",
+            "mobile_number",
+            "country",
+            "language",
+            "biography",
+            "occupation",
+            "interests",
+            "social_media_links",
+            "status",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid User Profile."
+
+    def get_user_profile(
+        self, profile_id: UUID, fields: Optional[Iterable[str]] = None
+    ) -> dict:
         """CRUD Operation: Get User Profile."""
 
-        with Session(ENGINE) as session:
-            query = select(UserProfile).filter(cast(UserProfile.profile_id, uuid) == profile_id)
+        fields = self.__get_fields__(UserProfile, fields)
+        with get_session() as session:
+            query = (
+                select(UserProfile)
+                .filter(self.__match_id__(UserProfile.profile_id, profile_id))
+                .options(*self.__get_load_options__(UserProfile, fields=fields))
+            )
             user_profile = session.execute(query).scalar_one_or_none()
 
             if not user_profile:
                 raise UserProfileError("User Profile not Found.")
 
-            return self.__get_model_data__(user_profile)
+            return self.__get_model_data__(user_profile, fields=fields)
 
     def create_user_profile(self, account_id: UUID) -> str:
         """CRUD Operation: Add User Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.account_id = account_id
 
             try:
@@ -61,7 +70,7 @@ class UserProfileSerialiser(UserProfile, BaseSerialiser):
     def update_user_profile(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update User Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             user_profile: Union[UserProfile, UserProfileError, None] = session.get(
                 UserProfile, private_id
             )
@@ -69,11 +78,7 @@ class UserProfileSerialiser(UserProfile, BaseSerialiser):
             if user_profile is None:
                 raise UserProfileError("User Profile Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in UserProfileSerialiser.__MUTABLE_KWARGS__:
-                    raise UserProfileError("Invalid User Profile.")
-
-                value = self.validate_serialiser_kwargs(key, value)
+            for key, value in self.validate_many(kwargs).items():
                 setattr(user_profile, key, value)
             try:
                 session.add(user_profile)
@@ -86,7 +91,7 @@ class UserProfileSerialiser(UserProfile, BaseSerialiser):
     def delete_user_profile(self, private_id: UUID) -> str:
         """CRUD Operation: Delete User Profile."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             user_profile = session.get(UserProfile, private_id)
 
             if not user_profile:
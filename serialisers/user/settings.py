@@ -1,13 +1,13 @@
 """Settings: Serialiser for Settings Profile Model."""
 
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from lib.interfaces.exceptions import (
     SettingsProfileError,
 )
-from models import ENGINE
+from models import get_session
 from models.user.settings import SettingsProfile
 from serialisers.serialiser import BaseSerialiser
 
@@ -16,37 +16,45 @@ class SettingsProfileSerialiser(SettingsProfile, BaseSerialiser):
     """Serialiser for the Settings Model."""
 
     __SERIALISER_EXCEPTION__ = SettingsProfileError
-    __MUTABLE_KWARGS__: list[str] = [
-        "mfa_enabled",
-        "location_tracking_enabled",
-        "cookies_enabled",
-        "email_status",
-        "data_sharing_preferences",
-        "communication_preference",
-        "theme_preference",
-        "profile_visibility_preference",
-        "mfa_last_used_date",
-        "communication_status",
-    ]
-
-    def get_settings_profile(self, settings_id: UUID) -> dict:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "mfa_enabled",
+            "location_tracking_enabled",
+            "cookies_enabled",
+            "email_status",
+            "data_sharing_preferences",
+            "communication_preference",
+            "theme_preference",
+            "profile_visibility_preference",
+            "mfa_last_used_date",
+            "communication_status",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid Setting to Update."
+
+    def get_settings_profile(
+        self, settings_id: UUID, fields: Optional[Iterable[str]] = None
+    ) -> dict:
         """CRUD Operation: Get Settings."""
 
-        with Session(ENGINE) as session:
-            query = select(SettingsProfile).filter(
-                cast(SettingsProfile.settings_id, uuid) == settings_id
+        fields = self.__get_fields__(SettingsProfile, fields)
+        with get_session() as session:
+            query = (
+                select(SettingsProfile)
+                .filter(self.__match_id__(SettingsProfile.settings_id, settings_id))
+                .options(*self.__get_load_options__(SettingsProfile, fields=fields))
             )
             settings_profile = session.execute(query).scalar_one_or_none()
 
             if not settings_profile:
                 raise SettingsProfileError("Settings Not Found.")
 
-            return self.__get_model_data__(settings_profile)
+            return self.__get_model_data__(settings_profile, fields=fields)
 
     def create_settings_profile(self, account_id: UUID) -> str:
         """CRUD Operation: Add Settings."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.account_id = account_id
 
             try:
@@ -60,17 +68,13 @@ class SettingsProfileSerialiser(SettingsProfile, BaseSerialiser):
     def update_settings_profile(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update Settings."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             settings_profile = session.get(SettingsProfile, private_id)
 
             if settings_profile is None:
                 raise SettingsProfileError("Settings Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in SettingsProfileSerialiser.__MUTABLE_KWARGS__:
-                    raise SettingsProfileError("Invalid Setting to Update.")
-
-                value = self.validate_serialiser_kwargs(key, value)
+            for key, value in self.validate_many(kwargs).items():
                 setattr(settings_profile, key, value)
 
             try:
@@ -84,7 +88,7 @@ class SettingsProfileSerialiser(SettingsProfile, BaseSerialiser):
     def delete_settings_profile(self, private_id: UUID) -> str:
         """CRUD Operation: Delete Settings."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             settings_profile = session.get(SettingsProfile, private_id)
 
             if not settings_profile:
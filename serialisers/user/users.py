@@ -1,43 +1,142 @@
 """Users: Serialiser for User Model."""
 
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import String, cast, select
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from config import AppConfig
 from lib.interfaces.exceptions import UserError
+from lib.utils.constants.serialisers import LoadStrategy
 from lib.utils.constants.users import Status
 from lib.utils.encryption.cryptography import decrypt_data, encrypt_data
-from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.passwords import PasswordHasher
 from lib.validators.users import validate_email, validate_password, validate_status
-from models import ENGINE
+from models import get_session
+from models.model import as_column
 from models.user.users import User
-from serialisers.serialiser import BaseSerialiser
+from serialisers.serialiser import BaseSerialiser, IncludeSpec
 
 
 class UserSerialiser(User, BaseSerialiser):
     """Serialiser for the User Model."""
 
     __SERIALISER_EXCEPTION__ = UserError
-    __MUTABLE_KWARGS__: list[str] = []
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset()
+    __RELATIONSHIPS__ = {"login_history": LoadStrategy.SELECTIN}
 
-    def get_user(self, user_id: str) -> str:
-        """CRUD Operation: Read User."""
+    def get_user(
+        self,
+        user_id: str,
+        include: Optional[IncludeSpec] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> str:
+        """CRUD Operation: Read User, Eager-Loading the Included Relationships."""
 
-        with Session(ENGINE) as session:
-            query = select(User).filter(cast(User.user_id, String) == user_id)
-            user = session.execute(query).scalar_one_or_none()
+        fields = self.__get_fields__(User, fields)
+        with get_session() as session:
+            query = (
+                select(User)
+                .filter(self.__match_id__(User.user_id, user_id))
+                .options(*self.__get_load_options__(User, include, fields))
+            )
+            user = session.execute(query).unique().scalar_one_or_none()
 
             if not user:
                 raise UserError("User Not Found.")
 
-            return self.__get_encrypted_model_data__(user)
+            return self.__get_encrypted_model_data__(user, include, fields)
+
+    def get_user_by_login(
+        self,
+        email: str,
+        password: str,
+        include: Optional[IncludeSpec] = None,
+        user_ids: Optional[list[str]] = None,
+    ) -> str:
+        """CRUD Operation: Read User by Login.
+
+        The user is matched on any accepted user ID hash (current cost, previous
+        costs, or legacy) in one query. A legacy user ID is replaced by
+        update_user_id, and an outdated password hash by update_password.
+        Callers on an event loop derive the user IDs beforehand.
+        """
+
+        email, password = validate_email(str(email)), validate_password(password)
+        if user_ids is None:
+            user_ids = PasswordHasher().get_password_hashes(
+                email + password, str(AppConfig().salt_value)
+            )
+        with get_session() as session:
+            query = (
+                select(User)
+                .filter(as_column(User.user_id).in_(user_ids))
+                .options(*self.__get_load_options__(User, include))
+            )
+            users = session.execute(query).unique().scalars().all()
+
+            if not users:
+                raise UserError("User Not Found.")
+
+            user = min(users, key=lambda user: user_ids.index(str(user.user_id)))
+            return self.__get_encrypted_model_data__(user, include)
+
+    def update_password(
+        self, private_id: UUID, password: str, password_hash: Optional[str] = None
+    ) -> str:
+        """CRUD Operation: Update User, Re-Hashing an Outdated Password.
+
+        The password hash may be derived beforehand (with the user's salt), by
+        callers on an event loop.
+        """
+
+        with get_session() as session:
+            user = session.get(User, private_id)
+
+            if user is None:
+                raise UserError("User Not Found.")
+
+            if PasswordHasher().needs_rehash(str(user.password)):
+                setattr(
+                    user,
+                    "password",
+                    password_hash
+                    or self.__get_valid_password__(password, str(user.salt_value)),
+                )
+                try:
+                    session.add(user)
+                    session.commit()
+                except IntegrityError as exc:
+                    raise UserError("User not Updated.") from exc
+
+            return str(user)
+
+    def update_user_id(self, private_id: UUID, user_id: str) -> str:
+        """CRUD Operation: Update User, Replacing a Legacy User ID.
+
+        The user ID is derived beforehand, at the current cost, from the login.
+        """
+
+        with get_session() as session:
+            user = session.get(User, private_id)
+
+            if user is None:
+                raise UserError("User Not Found.")
+
+            if PasswordHasher().is_legacy(str(user.user_id)):
+                setattr(user, "user_id", user_id)
+                try:
+                    session.add(user)
+                    session.commit()
+                except IntegrityError as exc:
+                    raise UserError("User not Updated.") from exc
+
+            return str(user)
 
     def create_user(self, email: str, password: str) -> str:
         """CRUD Operation: Create User."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.email = str(self.__get_valid_email__(email))
             self.password = str(self.__get_valid_password__(password, str(self.salt_value)))
             self.user_id = str(self.__get_valid_user_id__(str(email), password))
@@ -58,7 +157,7 @@ class UserSerialiser(User, BaseSerialiser):
     ) -> str:
         """CRUD OperatiFon: Update User."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             user = session.get(User, private_id)
 
             if user is None:
@@ -89,7 +188,7 @@ class UserSerialiser(User, BaseSerialiser):
     def delete_user(self, private_id: UUID) -> str:
         """CRUD Operation: Delete User."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             user = session.get(User, private_id)
 
             if not user:
@@ -113,11 +212,13 @@ class UserSerialiser(User, BaseSerialiser):
         """Get Valid Password."""
 
         password = validate_password(password)
-        return str(get_hash_value(password, str(salt_value)))
+        return PasswordHasher().hash_password(password, str(salt_value))
 
     def __get_valid_user_id__(self, email: str, password: str) -> str:
         """Get Valid User ID."""
 
         email = validate_email(str(email))
         password = validate_password(password)
-        return get_hash_value(str(email) + password, str(AppConfig().salt_value))
+        return PasswordHasher().hash_password(
+            str(email) + password, str(AppConfig().salt_value)
+        )
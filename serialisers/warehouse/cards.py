@@ -1,16 +1,17 @@
 """Cards: Serialiser for Card Model."""
 
 from datetime import date, timedelta
-from random import randint
-from uuid import UUID
-from sqlalchemy import Column, Date, Enum, String, cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from secrets import randbelow
+from typing import Iterable, Optional
+from uuid import UUID, uuid4
+from sqlalchemy import Column, insert, select
 from sqlalchemy.exc import IntegrityError
 
 from config import AppConfig
 from lib.interfaces.exceptions import CardValidationError
+from lib.utils.cards.numbers import CardNumberPool
 from lib.utils.constants.users import CardType, DateFormat, Status
-from lib.utils.encryption.cryptography import decrypt_data, encrypt_data
+from lib.utils.encryption.cryptography import CryptoProvider
 from lib.utils.encryption.encoders import get_hash_value
 from lib.validators.users import (
     validate_card_number,
@@ -18,7 +19,8 @@ from lib.validators.users import (
     validate_cvv_number,
     validate_pin,
 )
-from models import ENGINE
+from models import get_session
+from models.model import as_column
 from models.warehouse.cards import Card
 from serialisers.serialiser import BaseSerialiser
 
@@ -27,68 +29,128 @@ class CardSerialiser(Card, BaseSerialiser):
     """Serialiser for the Card Model."""
 
     __SERIALISER_EXCEPTION__ = CardValidationError
-    __MUTABLE_KWARGS__: list[str] = ["status", "pin"]
-    __MAX_RETRIES__ = 3
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset({"status", "pin"})
+    __MUTABLE_ERROR__ = "Invalid attribute to Update."
     __CARD_VALID_YEARS__ = 365 * 5
+    __POOL_SIZE__ = 1000
+    __INSERT_ATTEMPTS__ = 3
+    __POOL__: Optional[CardNumberPool] = None
 
-    def get_card(self, card_id: UUID) -> str:
+    def get_card(self, card_id: UUID, fields: Optional[Iterable[str]] = None) -> str:
         """CRUD Operation: Get Card."""
 
-        with Session(ENGINE) as session:
-            query = select(Card).filter(cast(Card.card_id, String) == card_id)
+        fields = self.__get_fields__(Card, fields)
+        with get_session() as session:
+            query = (
+                select(Card)
+                .filter(self.__match_id__(Card.card_id, card_id))
+                .options(*self.__get_load_options__(Card, fields=fields))
+            )
             card = session.execute(query).scalar_one_or_none()
 
             if not card:
                 raise CardValidationError("Card not Found.")
 
-            return self.__get_encrypted_model_data__(card)
+            return self.__get_encrypted_model_data__(card, fields=fields)
 
     def create_card(self, card_type: CardType, pin: str) -> str:
         """CRUD Operation: Add Card."""
 
-        with Session(ENGINE) as session:
-            card_type = validate_card_type(card_type)
-            self.card_type = card_type
-            self.cvv_number = str(self.__get_cvv_number__())
-            self.expiration_date = (
-                date.today() + timedelta(days=self.__CARD_VALID_YEARS__)
-            ).replace(day=1)
-            self.card_number = str(self.__get_card_number__())
-            self.pin = str(self.__get_pin__(pin, str(self.salt_value)))
-            self.card_id = str(
-                self.get_card_id(
-                    str(decrypt_data(str(self.cvv_number))),
-                    str(decrypt_data(str(self.card_number))),
-                    self.expiration_date,
-                )
+        rows = self.__insert_cards__(card_type, [pin], "Card not Created.")
+        for key, value in rows[0].items():
+            setattr(self, key, value)
+        return str(self)
+
+    def create_cards_bulk(
+        self, card_type: CardType, count: int, pins: list[str]
+    ) -> list[str]:
+        """CRUD Operation: Add Cards, with Batched Multi-Row INSERT Statements.
+
+        Returns the new Card IDs, in the order of the given pins.
+        """
+
+        if not isinstance(count, int) or count < 1 or not isinstance(pins, list):
+            raise CardValidationError("Invalid Card Count.")
+        if len(pins) != count:
+            raise CardValidationError("Invalid Card Count.")
+
+        rows = self.__insert_cards__(card_type, pins, "Cards not Created.")
+        return [row["card_id"] for row in rows]
+
+    def __insert_cards__(
+        self, card_type: CardType, pins: list[str], message: str
+    ) -> list[dict]:
+        """Inserts New Cards' Rows, Drawing Fresh Numbers on a Conflict.
+
+        Each process reserves numbers in its own pool, so two may issue the
+        same number; the unique hash index rejects the second insert.
+        """
+
+        error: Optional[IntegrityError] = None
+        for _ in range(self.__INSERT_ATTEMPTS__):
+            rows = self.__get_card_rows__(card_type, pins)
+            with get_session() as session:
+                try:
+                    session.execute(insert(Card), rows)
+                    session.commit()
+                    return rows
+                except IntegrityError as exc:
+                    error = exc
+        raise CardValidationError(message) from error
+
+    def __get_card_rows__(self, card_type: CardType, pins: list[str]) -> list[dict]:
+        """Builds New Cards' Rows, in One Pass.
+
+        Card IDs and number hashes are taken from the plaintext, before it is
+        encrypted (in one batch), so nothing is decrypted again.
+        """
+
+        card_type = validate_card_type(card_type)
+        expiration_date = (
+            date.today() + timedelta(days=self.__CARD_VALID_YEARS__)
+        ).replace(day=1)
+
+        rows: list[dict] = []
+        plaintext: list[bytes] = []
+        for pin in pins:
+            card_number, card_number_hash = self.generate_card(card_type)
+            card_number = validate_card_number(card_number)
+            cvv_number = self.__get_cvv_number__()
+            salt_value = uuid4()
+            rows.append(
+                {
+                    "id": uuid4(),
+                    "card_id": self.get_card_id(
+                        cvv_number, card_number, expiration_date
+                    ),
+                    "card_number_hash": card_number_hash,
+                    "card_type": card_type,
+                    "status": Status.NEW,
+                    "pin": self.__get_pin__(pin, str(salt_value)),
+                    "expiration_date": expiration_date,
+                    "salt_value": salt_value,
+                }
             )
-            try:
-                session.add(self)
-                session.commit()
-            except IntegrityError as exc:
-                raise CardValidationError("Card not Created.") from exc
+            plaintext.extend((card_number.encode(), cvv_number.encode()))
 
-            return str(self)
+        encrypted = CryptoProvider().encrypt_many(plaintext)
+        for index, row in enumerate(rows):
+            row["card_number"], row["cvv_number"] = encrypted[2 * index : 2 * index + 2]
+        return rows
 
     def update_card(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update Card."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             card = session.get(Card, private_id)
 
             if card is None:
                 raise CardValidationError("Card Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in CardSerialiser.__MUTABLE_KWARGS__:
-                    raise CardValidationError("Invalid attribute to Update.")
-
-                if key == "pin":
-                    valid_pin = self.__get_pin__(value, str(card.salt_value))
-                    setattr(card, key, valid_pin)
-                if key == "status":
-                    value = self.validate_serialiser_kwargs(key, value)
-                    setattr(card, key, value)
+            if "pin" in kwargs:
+                card.pin = self.__get_pin__(kwargs.pop("pin"), str(card.salt_value))
+            for key, value in self.validate_many(kwargs).items():
+                setattr(card, key, value)
 
             try:
                 session.add(card)
@@ -102,7 +164,7 @@ class CardSerialiser(Card, BaseSerialiser):
     def delete_card(cls, private_id: UUID) -> str:
         """CRUD Operation: Delete Card."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             card = session.get(Card, private_id)
 
             if card is None:
@@ -116,22 +178,6 @@ class CardSerialiser(Card, BaseSerialiser):
 
             return f"Deleted: {private_id}"
 
-    def __get_card_number__(self) -> str:
-        """Sets the Private Attribute."""
-
-        for retries in range(self.__MAX_RETRIES__):
-            try:
-                card_number = self.generate_card(
-                    self.card_type, self.cvv_number, self.expiration_date
-                )
-                break
-            except CardValidationError:
-                if retries == self.__MAX_RETRIES__ - 1:
-                    raise
-
-        card_number = validate_card_number(str(card_number))
-        return encrypt_data(str(card_number).encode())
-
     def __get_pin__(self, pin: str, salt_value: str) -> str:
         """Sets Valid Card Pin."""
 
@@ -139,46 +185,30 @@ class CardSerialiser(Card, BaseSerialiser):
         return str(get_hash_value(pin, salt_value))
 
     def __get_cvv_number__(self) -> str:
-        """Sets the Private Attribute."""
+        """Generates a (Plaintext) CVV Number."""
 
         cvv_length = AppConfig().cvv_length
         if not isinstance(cvv_length, int):
             raise CardValidationError("Invalid CVV Number Length")
-        cvv_number = "".join([str(randint(0, 9)) for _ in range(cvv_length)])
-        cvv_number = validate_cvv_number(cvv_number)
-        return encrypt_data(cvv_number.encode())
+        cvv_number = str(randbelow(10**cvv_length)).zfill(cvv_length)
+        return validate_cvv_number(cvv_number)
+
+    @classmethod
+    def generate_card(cls, card_type: CardType) -> tuple[str, str]:
+        """Allocates a Reserved, Luhn-Valid Card Number, and its Hash."""
+
+        if cls.__POOL__ is None:
+            cls.__POOL__ = CardNumberPool(cls.__POOL_SIZE__, cls.__get_issued_hashes__)
+        return cls.__POOL__.allocate(card_type)
 
     @staticmethod
-    def generate_card(
-        card_type: CardType | Column[CardType],
-        cvv_number: str | Column[str],
-        expiration_date: date | Column[date],
-    ) -> str:
-        """Generates a Valid Card."""
+    def __get_issued_hashes__(card_hashes: list[str]) -> set[str]:
+        """Finds which Card Number Hashes are Issued, in One Indexed Query."""
 
-        card_length = AppConfig().card_length
-        if not isinstance(card_length, int):
-            raise CardValidationError("Invalid Card Number Length.")
-        card_number = "".join(
-            [str(randint(0, 9)) for _ in range(card_length - len(card_type.value[1]))]
-        )
-        card_number = card_type.value[1] + card_number
-        with Session(ENGINE) as session:
-            cards_count = (
-                session.query(Card)
-                .filter(
-                    cast(Card.status, Enum(Status, name="card_status"))
-                    != Status.INACTIVE,
-                    cast(Card.card_number, String) == card_number,
-                    cast(Card.card_type, Enum(CardType, name="card_type")) == card_type,
-                    cast(Card.cvv_number, String) == cvv_number,
-                    cast(Card.expiration_date, Date) == expiration_date,
-                )
-                .count()
-            )
-            if cards_count != 0:
-                raise CardValidationError("Card Number Already Exists.")
-            return card_number
+        with get_session() as session:
+            card_number_hash = as_column(Card.card_number_hash)
+            query = select(card_number_hash).filter(card_number_hash.in_(card_hashes))
+            return set(session.execute(query).scalars())
 
     @staticmethod
     def get_card_id(
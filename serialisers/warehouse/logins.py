@@ -1,13 +1,15 @@
 """Logins: Serialiser for Login History Model."""
 
+from datetime import datetime
+from typing import Iterable, Optional
 from uuid import UUID
-from sqlalchemy import cast, select, UUID as uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from lib.interfaces.exceptions import (
     LoginHistoryError,
 )
-from models import ENGINE
+from models import get_session
+from models.model import as_column
 from models.warehouse.logins import LoginHistory
 from serialisers.serialiser import BaseSerialiser
 
@@ -16,32 +18,52 @@ class LoginHistorySerialiser(LoginHistory, BaseSerialiser):
     """Serialiser for the Login History Model."""
 
     __SERIALISER_EXCEPTION__ = LoginHistoryError
-    __MUTABLE_KWARGS__: list[str] = [
-        "session_id",
-        "login_location",
-        "login_device",
-        "login_method",
-        "logged_in",
-        "logout_date",
-        "authentication_token",
-    ]
-
-    def get_login_history(self, login_id: UUID) -> dict:
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset(
+        {
+            "session_id",
+            "login_location",
+            "login_device",
+            "login_method",
+            "logged_in",
+            "logout_date",
+            "authentication_token",
+        }
+    )
+    __MUTABLE_ERROR__ = "Invalid Login History."
+
+    def get_login_history(
+        self, login_id: UUID, fields: Optional[Iterable[str]] = None
+    ) -> dict:
         """CRUD Operation: Get Login History."""
 
-        with Session(ENGINE) as session:
-            query = select(LoginHistory).filter(cast(LoginHistory.login_id, uuid) == login_id)
+        fields = self.__get_fields__(LoginHistory, fields)
+        with get_session() as session:
+            query = (
+                select(LoginHistory)
+                .filter(self.__match_id__(LoginHistory.login_id, login_id))
+                .options(*self.__get_load_options__(LoginHistory, fields=fields))
+            )
             login_history = session.execute(query).scalar_one_or_none()
 
             if not login_history:
                 raise LoginHistoryError("Login History Not Found.")
 
-            return self.__get_model_data__(login_history)
+            return self.__get_model_data__(login_history, fields=fields)
+
+    def is_logged_in(self, session_id: UUID) -> bool:
+        """CRUD Operation: Check a Session is Logged In."""
+
+        with get_session() as session:
+            query = select(as_column(LoginHistory.id)).filter(
+                self.__match_id__(LoginHistory.session_id, session_id),
+                LoginHistory.logged_in,
+            )
+            return session.execute(query.limit(1)).first() is not None
 
     def create_login_history(self, user_id: UUID) -> str:
         """CRUD Operation: Add Login History."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             self.user_id = user_id
 
             try:
@@ -55,17 +77,13 @@ class LoginHistorySerialiser(LoginHistory, BaseSerialiser):
     def update_login_history(self, private_id: UUID, **kwargs) -> str:
         """CRUD Operation: Update Login History."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             login_history = session.get(LoginHistory, private_id)
 
             if login_history is None:
                 raise LoginHistoryError("Login History Not Found.")
 
-            for key, value in kwargs.items():
-                if key not in LoginHistorySerialiser.__MUTABLE_KWARGS__:
-                    raise LoginHistoryError("Invalid Login History.")
-
-                value = self.validate_serialiser_kwargs(key, value)
+            for key, value in self.validate_many(kwargs).items():
                 setattr(login_history, key, value)
             try:
                 session.add(login_history)
@@ -75,10 +93,34 @@ class LoginHistorySerialiser(LoginHistory, BaseSerialiser):
 
             return str(login_history)
 
+    def logout_login_history(self, user_id: UUID) -> int:
+        """CRUD Operation: Log Out a User's Active Logins, in One Statement.
+
+        Returns the Number of Logins Logged Out.
+        """
+
+        with get_session() as session:
+            query = (
+                update(LoginHistory)
+                .where(
+                    self.__match_id__(LoginHistory.user_id, user_id),
+                    LoginHistory.logged_in,
+                )
+                .values(logged_in=False, logout_date=datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            try:
+                logged_out = session.execute(query).rowcount
+                session.commit()
+            except IntegrityError as exc:
+                raise LoginHistoryError("Login History not Updated.") from exc
+
+            return logged_out
+
     def delete_login_history(self, private_id: UUID) -> str:
         """CRUD Operation: Delete Login History."""
 
-        with Session(ENGINE) as session:
+        with get_session() as session:
             login_history = session.get(LoginHistory, private_id)
 
             if not login_history:
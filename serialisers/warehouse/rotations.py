@@ -0,0 +1,157 @@
+"""Rotations: Serialiser for Key Rotation Model."""
+
+from typing import Iterable, Optional, Sequence
+from uuid import uuid4
+from cryptography.fernet import InvalidToken
+from sqlalchemy import UUID, Column, Row, String, Update, case, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from config import AppConfig
+from lib.interfaces.exceptions import FernetError
+from lib.utils.encryption.cryptography import CryptoProvider
+from lib.utils.encryption.encoders import get_hash_value
+from models import get_session
+from models.user.users import User
+from models.warehouse.cards import Card
+from models.model import as_column
+from models.warehouse.rotations import KeyRotation
+from serialisers.serialiser import BaseSerialiser
+
+
+class KeyRotationSerialiser(KeyRotation, BaseSerialiser):
+    """Serialiser for the Key Rotation Model."""
+
+    __SERIALISER_EXCEPTION__ = FernetError
+    __MUTABLE_KWARGS__: frozenset[str] = frozenset()
+    __ROTATION_COLUMNS__: dict[str, list[Column]] = {
+        "warehouse.cards": [as_column(Card.card_number), as_column(Card.cvv_number)],
+        "users.users": [as_column(User.email)],
+    }
+
+    def get_key_rotation(
+        self, table_name: str, fields: Optional[Iterable[str]] = None
+    ) -> dict:
+        """CRUD Operation: Read Key Rotation."""
+
+        fields = self.__get_fields__(KeyRotation, fields)
+        with get_session() as session:
+            query = (
+                select(KeyRotation)
+                .filter(as_column(KeyRotation.table_name) == table_name)
+                .options(*self.__get_load_options__(KeyRotation, fields=fields))
+            )
+            key_rotation = session.execute(query).scalar_one_or_none()
+
+            if not key_rotation:
+                raise FernetError("Key Rotation Not Found.")
+
+            return self.__get_model_data__(key_rotation, fields=fields)
+
+    def rotate_batch(self, table_name: str, batch_size: int) -> int:
+        """CRUD Operation: Re-Encrypt a Table's Next Batch with the Current Key.
+
+        Rows are walked in primary key order from the table's checkpoint, which
+        restarts whenever the current Fernet key changes. Returns the number of
+        rows rotated, 0 once the table is complete.
+        """
+
+        if table_name not in KeyRotationSerialiser.__ROTATION_COLUMNS__:
+            raise FernetError("Invalid Key Rotation Table.")
+        if batch_size <= 0:
+            raise FernetError("Invalid Key Rotation Batch Size.")
+        columns = KeyRotationSerialiser.__ROTATION_COLUMNS__[table_name]
+        table = columns[0].table
+        key_hash = get_hash_value(AppConfig().fernet_keys[0])
+
+        with get_session() as session:
+            key_rotation = self.lock_key_rotation(session, table_name)
+            if key_rotation.key_hash != key_hash:
+                key_rotation.key_hash = key_hash
+                key_rotation.last_id = None
+                key_rotation.rotated_rows = 0
+
+            query = select(table.c.id, *columns).order_by(table.c.id).limit(batch_size)
+            if key_rotation.last_id is not None:
+                query = query.filter(table.c.id > key_rotation.last_id)
+            rows = session.execute(query).all()
+
+            if rows:
+                session.execute(self.__get_rotation_query__(columns, rows))
+                key_rotation.last_id = rows[-1][0]
+                key_rotation.rotated_rows = int(key_rotation.rotated_rows) + len(rows)
+
+            try:
+                session.add(key_rotation)
+                session.commit()
+            except IntegrityError as exc:
+                raise FernetError("Key Rotation Not Updated.") from exc
+
+            return len(rows)
+
+    @staticmethod
+    def __get_rotation_query__(columns: list[Column], rows: Sequence[Row]) -> Update:
+        """Builds a Single UPDATE ... FROM (VALUES ...) for a Rotated Batch.
+
+        A value is only replaced if it is unchanged since it was read, so
+        concurrent writes (already under the current key) are kept.
+        """
+
+        provider = CryptoProvider()
+        try:
+            data = [
+                (
+                    row[0],
+                    *[None if value is None else provider.rotate(value) for value in row[1:]],
+                    *row[1:],
+                )
+                for row in rows
+            ]
+        except InvalidToken as exc:
+            raise FernetError("Invalid Fernet Key.") from exc
+
+        rotated = values(
+            column("id", UUID(as_uuid=True)),
+            *[column(f"new_{item.name}", String) for item in columns],
+            *[column(f"old_{item.name}", String) for item in columns],
+            name="rotated",
+        ).data(data)
+        table = columns[0].table
+        return (
+            update(table)
+            .where(table.c.id == rotated.c.id)
+            .values(
+                {
+                    item.name: case(
+                        (
+                            table.c[item.name].is_not_distinct_from(
+                                rotated.c[f"old_{item.name}"]
+                            ),
+                            rotated.c[f"new_{item.name}"],
+                        ),
+                        else_=table.c[item.name],
+                    )
+                    for item in columns
+                }
+            )
+        )
+
+    @staticmethod
+    def lock_key_rotation(session: Session, table_name: str) -> KeyRotation:
+        """Locks a Table's Key Rotation Row (SELECT ... FOR UPDATE) for the Session."""
+
+        query = (
+            select(KeyRotation)
+            .filter(as_column(KeyRotation.table_name) == table_name)
+            .with_for_update()
+        )
+        key_rotation = session.execute(query).scalar_one_or_none()
+        if key_rotation is None:
+            session.execute(
+                insert(KeyRotation)
+                .values(id=uuid4(), table_name=table_name)
+                .on_conflict_do_nothing(index_elements=[KeyRotation.table_name])
+            )
+            key_rotation = session.execute(query).scalar_one()
+        return key_rotation
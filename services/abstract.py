@@ -6,6 +6,8 @@ from lib.interfaces.exceptions import UserError
 
 class AbstractService:
 
+    __PUBLIC_ID_REGEX__ = regex_compile(r"^.*: (.*)$")
+
     def to_dict(self):
         """Returns a Dictionary representation."""
         return self.__dict__
@@ -14,8 +16,7 @@ class AbstractService:
     def get_public_id(value: str) -> str:
         """Retrieve the Public ID from String Representation."""
 
-        regex = regex_compile(r"^.*: (.*)$")
-        regex_match = regex.match(value)
+        regex_match = AbstractService.__PUBLIC_ID_REGEX__.match(value)
         if not regex_match:
             raise UserError("Invalid Public ID String.")
         matches = regex_match.groups()
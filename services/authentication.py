@@ -1,16 +1,22 @@
 """Authentication: User Authentication Services."""
 
 from datetime import datetime, timedelta
-from json import dumps, loads
-from uuid import uuid4
+from functools import partial
+from json import loads
+from time import time
+from typing import Optional
+from uuid import UUID, uuid4
 from config import AppConfig
 from lib.decorators.utils import validate_function_signature
+from lib.interfaces.exceptions import TokenError
 from lib.interfaces.responses import ServiceResponse
 from lib.interfaces.data_classes import UserData
+from lib.utils.caching.sessions import SessionStore
 from lib.utils.constants.responses import ServiceStatus
-from lib.utils.constants.users import DateFormat
-from lib.utils.encryption.cryptography import decrypt_data, encrypt_data
-from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.cryptography import decrypt_data
+from lib.utils.encryption.passwords import PasswordHasher
+from lib.utils.encryption.tokens import TokenProvider
+from models import on_commit, run_in_unit_of_work, unit_of_work
 from serialisers.user.users import UserSerialiser
 from serialisers.warehouse.logins import LoginHistorySerialiser
 from services.abstract import AbstractService
@@ -20,6 +26,8 @@ class AuthenticationService(AbstractService):
     """Manages Authentication Operations."""
 
     __instance = None
+    __TOKEN_EXPIRY__ = timedelta(days=30)
+    __SESSIONS__ = SessionStore()
     ACTIVE = True
 
     def __new__(cls, *args, **kwargs) -> "AuthenticationService":
@@ -43,63 +51,218 @@ class AuthenticationService(AbstractService):
     def login_user(
         self, email: str, password: str, user_data: UserData
     ) -> ServiceResponse:
-        """Logs a User In."""
+        """Logs a User In, Upgrading an Outdated Password Hash.
 
-        user_id = get_hash_value(email + password, str(AppConfig().salt_value))
-        encrypted_user = UserSerialiser().get_user(user_id)
-        user = loads(decrypt_data(encrypted_user))
+        Password hashes are derived outside the units of work, so no connection
+        is checked out while the KDF runs.
+        """
 
-        if isinstance(user.get("login_history", ""), list):
-            for login in user["login_history"]:
-                self.logout_user(loads(decrypt_data(login))["id"])
-
-        response = LoginHistorySerialiser().create_login_history(user["id"])
-        login_id = self.get_public_id(response)
-        login_history = LoginHistorySerialiser().get_login_history(login_id)
-
-        session_id = uuid4()
-        token = AuthenticationService().__generate_authentication_token__(
-            user_id=user["user_id"],
-            login_id=login_history["login_id"],
-            session_id=str(session_id),
-        )
-        LoginHistorySerialiser().update_login_history(
-            login_history["id"],
-            session_id=session_id,
-            authentication_token=token,
-            **user_data.login.to_dict()
-        )
-        return ServiceResponse(
-            "User Authenticated.",
-            status=ServiceStatus.SUCCESS,
-            data={
-                "id": user["user_id"],
-                "token": token,
-            },
+        hasher = PasswordHasher()
+        user_ids = hasher.get_password_hashes(
+            email + password, str(AppConfig().salt_value)
         )
+        response, user = self.__login__(email, password, user_data, user_ids)
+        if hasher.needs_rehash(user["password"]):
+            password_hash = hasher.hash_password(password, user["salt_value"])
+            UserSerialiser().update_password(
+                UUID(user["id"]), password, password_hash
+            )
+        return response
 
     def logout_user(self, login_id: str):
         """Logs User Out."""
 
-        LoginHistorySerialiser().update_login_history(
+        response = LoginHistorySerialiser().update_login_history(
             login_id, logged_in=False, logout_date=datetime.now()
         )
+        login_history = LoginHistorySerialiser().get_login_history(
+            self.get_public_id(response), fields=["authentication_token"]
+        )
+        self.__revoke_token__(login_history["authentication_token"])
         return ServiceResponse(
             "User No Longer Authenticated.",
             ServiceStatus.SUCCESS,
             data={"id": login_id},
         )
 
+    @validate_function_signature(True)
+    def verify_token(self, token: str) -> ServiceResponse:
+        """Verifies an Authentication Token, and that its Session is Active.
+
+        Sessions are checked in the session store; the database is only read
+        for sessions the store does not know (and the answer is then stored).
+        """
+
+        claims, is_active = self.__get_session__(token)
+        if is_active is None:
+            is_active = self.__load_session__(claims)
+        return self.__get_verified_response__(claims, is_active)
+
+    @classmethod
+    def __get_session__(cls, token: str) -> tuple[dict, Optional[bool]]:
+        """Verifies a Token, Returning its Claims and its Stored Session State."""
+
+        claims = TokenProvider().verify(token)
+        if "user_id" not in claims or "session_id" not in claims:
+            raise TokenError("Invalid Token.")
+        return claims, cls.__SESSIONS__.is_active(
+            claims["user_id"], claims["session_id"]
+        )
+
+    @classmethod
+    def __load_session__(cls, claims: dict) -> bool:
+        """Reads a Token's Session State from the Database, Storing it."""
+
+        user_id, session_id = claims["user_id"], claims["session_id"]
+        is_active = LoginHistorySerialiser().is_logged_in(session_id)
+        if is_active:
+            cls.__SESSIONS__.start(user_id, session_id, claims["exp"])
+        else:
+            cls.__SESSIONS__.revoke(user_id, session_id, claims["exp"])
+        return is_active
+
     @staticmethod
-    def __generate_authentication_token__(**kwargs) -> str:
-        """Generates a valid JSON Web Token."""
+    def __get_verified_response__(claims: dict, is_active: bool) -> ServiceResponse:
+        """Gets a Verified Token's Response, unless its Session is Inactive."""
+
+        if not is_active:
+            raise TokenError("Revoked Token.")
+        return ServiceResponse(
+            "Token Verified.", status=ServiceStatus.SUCCESS, data=claims
+        )
 
-        result = {
-            "expires": (datetime.now() + timedelta(days=30)).strftime(
-                DateFormat.HYPHEN.value
+    def __login__(
+        self,
+        email: str,
+        password: str,
+        user_data: UserData,
+        user_ids: list[str],
+    ) -> tuple[ServiceResponse, dict]:
+        """Logs a User In, Returning the Response and the User's Data.
+
+        The user IDs are the accepted user ID hashes, current cost first; a
+        legacy user ID is replaced by the first.
+        """
+
+        with unit_of_work():
+            encrypted_user = UserSerialiser().get_user_by_login(
+                email, password, include=(), user_ids=user_ids
+            )
+            user = loads(decrypt_data(encrypted_user))
+            if PasswordHasher().is_legacy(user["user_id"]):
+                UserSerialiser().update_user_id(UUID(user["id"]), user_ids[0])
+                user["user_id"] = user_ids[0]
+            LoginHistorySerialiser().logout_login_history(user["id"])
+
+            response = LoginHistorySerialiser().create_login_history(user["id"])
+            login_id = self.get_public_id(response)
+            login_history = LoginHistorySerialiser().get_login_history(login_id)
+
+            session_id = uuid4()
+            token = AuthenticationService().__generate_authentication_token__(
+                user_id=user["user_id"],
+                login_id=login_history["login_id"],
+                session_id=str(session_id),
+            )
+            LoginHistorySerialiser().update_login_history(
+                login_history["id"],
+                session_id=session_id,
+                authentication_token=token,
+                **user_data.login.to_dict()
+            )
+            on_commit(
+                partial(
+                    self.__SESSIONS__.start,
+                    user["user_id"],
+                    str(session_id),
+                    time() + self.__TOKEN_EXPIRY__.total_seconds(),
+                )
+            )
+        return (
+            ServiceResponse(
+                "User Authenticated.",
+                status=ServiceStatus.SUCCESS,
+                data={
+                    "id": user["user_id"],
+                    "token": token,
+                },
             ),
-        }
-        for key, kwarg in kwargs.items():
-            result[key] = kwarg
+            user,
+        )
+
+    @classmethod
+    def __generate_authentication_token__(cls, **kwargs) -> str:
+        """Generates a Signed (HS256) JSON Web Token."""
+
+        return TokenProvider().sign(kwargs, cls.__TOKEN_EXPIRY__)
+
+    @classmethod
+    def __revoke_token__(cls, token: Optional[str]) -> None:
+        """Revokes a Token's Session, if the Token is still Valid."""
+
+        if token is None:
+            return
+        try:
+            claims = TokenProvider().verify(token)
+        except TokenError:
+            return
+        if "user_id" in claims and "session_id" in claims:
+            cls.__SESSIONS__.revoke(
+                claims["user_id"], claims["session_id"], claims["exp"]
+            )
+
+
+class AsyncAuthenticationService:
+    """Manages Authentication Operations on the asyncio Engine."""
+
+    async def register_user(self, email: str, password: str) -> ServiceResponse:
+        """Registers User."""
+
+        return await run_in_unit_of_work(
+            AuthenticationService().register_user, email, password
+        )
+
+    async def login_user(
+        self, email: str, password: str, user_data: UserData
+    ) -> ServiceResponse:
+        """Logs a User In, Deriving Password Hashes in the Pool, off the Loop.
+
+        The user IDs are derived before the unit of work runs; an outdated
+        password hash is derived, and stored, once the user's salt is known.
+        """
+
+        hasher = PasswordHasher()
+        user_ids = await hasher.get_password_hashes_async(
+            email + password, str(AppConfig().salt_value)
+        )
+        response, user = await run_in_unit_of_work(
+            AuthenticationService().__login__, email, password, user_data, user_ids
+        )
+        if hasher.needs_rehash(user["password"]):
+            password_hash = await hasher.hash_password_async(
+                password, user["salt_value"]
+            )
+            await run_in_unit_of_work(
+                UserSerialiser().update_password,
+                UUID(user["id"]),
+                password,
+                password_hash,
+            )
+        return response
+
+    async def logout_user(self, login_id: str) -> ServiceResponse:
+        """Logs User Out."""
+
+        return await run_in_unit_of_work(AuthenticationService().logout_user, login_id)
+
+    async def verify_token(self, token: str) -> ServiceResponse:
+        """Verifies an Authentication Token, and that its Session is Active.
+
+        Only sessions the session store does not know are read from the database.
+        """
 
-        return encrypt_data(dumps(result).encode())
+        service = AuthenticationService()
+        claims, is_active = service.__get_session__(token)
+        if is_active is None:
+            is_active = await run_in_unit_of_work(service.__load_session__, claims)
+        return service.__get_verified_response__(claims, is_active)
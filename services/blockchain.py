@@ -1,7 +1,9 @@
 """Blockchain: BlockChain Services."""
 
+from datetime import timedelta
 from typing import Optional
 from uuid import UUID
+from config import AppConfig
 from lib.decorators.utils import validate_function_signature
 from lib.interfaces.exceptions import BlockError
 from lib.interfaces.responses import ServiceResponse
@@ -10,8 +12,11 @@ from lib.utils.constants.blocks import BlockType
 from lib.utils.constants.contracts import ContractStatus
 from lib.utils.constants.responses import ServiceStatus
 from lib.utils.constants.transactions import TransactionStatus
+from lib.utils.encryption.encoders import get_merkle_root
+from models import run_in_unit_of_work, unit_of_work
 from serialisers.blockchain.blocks import BlockSerialiser
 from serialisers.blockchain.contracts import ContractSerialiser
+from serialisers.blockchain.heads import ChainHeadSerialiser
 from serialisers.blockchain.transactions import TransactionSerialiser
 
 
@@ -19,7 +24,7 @@ class BlockChainService:
     """Manages BlockChain Operations."""
 
     __instance = None
-    CHAIN: list[dict] = []
+    __VERIFY_BATCH_SIZE__ = 1000
 
     def __new__(cls) -> "BlockChainService":
         """Singleton Class Constructor."""
@@ -33,33 +38,111 @@ class BlockChainService:
     def append_block_chain(cls, block_id: UUID) -> ServiceResponse:
         """Appends a Block."""
 
-        block = BlockSerialiser().get_block(block_id)
-        previous_block: Optional[dict] = None
+        blocks, previous_block = BlockSerialiser().append_blocks([block_id])
+
+        data = {"block": blocks[-1], "previous_block": previous_block}
+        return ServiceResponse("Block Chain Updated.", ServiceStatus.SUCCESS, data=data)
+
+    @classmethod
+    @validate_function_signature(True)
+    def append_block_chain_batch(cls, block_ids: list[UUID]) -> ServiceResponse:
+        """Appends Blocks, in Order, within a Single Transaction."""
+
+        blocks, previous_block = BlockSerialiser().append_blocks(block_ids)
+
+        data = {"blocks": blocks, "previous_block": previous_block}
+        return ServiceResponse("Block Chain Updated.", ServiceStatus.SUCCESS, data=data)
+
+    @classmethod
+    @validate_function_signature(True)
+    def get_chain_tail(cls) -> ServiceResponse:
+        """Gets the Tail Block of the Chain, from the Chain Head."""
+
+        return ServiceResponse(
+            "Block Chain Tail Retrieved.",
+            ServiceStatus.SUCCESS,
+            data=ChainHeadSerialiser().get_chain_tail(),
+        )
+
+    @classmethod
+    @validate_function_signature(True)
+    def get_cache_stats(cls) -> ServiceResponse:
+        """Gets the Block, Transaction and Contract Caches' Hits and Misses."""
+
+        data = {
+            "blocks": BlockSerialiser.__CACHE__.stats,
+            "transactions": TransactionSerialiser.__CACHE__.stats,
+            "contracts": ContractSerialiser.__CACHE__.stats,
+        }
+        return ServiceResponse("Cache Stats Retrieved.", ServiceStatus.SUCCESS, data=data)
+
+    @classmethod
+    @validate_function_signature(True)
+    def verify_chain(cls, from_checkpoint: Optional[int] = None) -> ServiceResponse:
+        """Verifies Chain Links and Hashes, Resuming from the Last Checkpoint."""
 
-        if not block["transaction_id"] and not block["contract_id"]:
-            raise BlockError("Invalid Transaction Block.")
+        block_height = from_checkpoint
+        if block_height is None:
+            block_height = ChainHeadSerialiser().get_chain_head()["verified_height"]
+        if block_height < 0:
+            raise BlockError("Invalid Block Chain Checkpoint.")
+
+        previous_block: Optional[dict] = None
+        if block_height:
+            previous_blocks = BlockSerialiser().get_chain_blocks(block_height - 1, 1)
+            if not previous_blocks:
+                raise BlockError("Invalid Block Chain Checkpoint.")
+            previous_block = previous_blocks[0]
 
-        if cls.CHAIN:
-            previous_block = BlockSerialiser().get_block(
-                UUID(cls.CHAIN[-1]["block_id"])
+        verified_blocks = 0
+        while True:
+            blocks = BlockSerialiser().get_chain_blocks(
+                block_height, cls.__VERIFY_BATCH_SIZE__
             )
-            
-        if previous_block:
-            BlockSerialiser().update_block(
-                block["id"], previous_block_id=UUID(previous_block["id"])
+            if not blocks:
+                break
+            item_hashes = BlockSerialiser().get_item_hashes(
+                [UUID(block["id"]) for block in blocks]
             )
-            BlockSerialiser().update_block(
-                previous_block["id"], next_block_id=UUID(block["id"])
+            for block in blocks:
+                cls.__verify_block__(block, previous_block, item_hashes[block["id"]])
+                previous_block = block
+
+            block_height = blocks[-1]["block_height"]
+            ChainHeadSerialiser().update_chain_checkpoint(
+                UUID(blocks[-1]["id"]), block_height
             )
+            verified_blocks += len(blocks)
 
-        cls.CHAIN.append(block)
+        data = {"verified_blocks": verified_blocks, "verified_height": block_height}
+        return ServiceResponse("Block Chain Verified.", ServiceStatus.SUCCESS, data=data)
 
-        block = BlockSerialiser().get_block(block["block_id"])
-        if previous_block:
-            previous_block = BlockSerialiser().get_block(previous_block["block_id"])
+    @staticmethod
+    def __verify_block__(
+        block: dict, previous_block: Optional[dict], item_hashes: list[str]
+    ) -> None:
+        """Checks a Block's Height, Links and Hash against the Previous Block.
 
-        data = {"block": block, "previous_block": previous_block}
-        return ServiceResponse("Block Chain Updated.", ServiceStatus.SUCCESS, data=data)
+        The merkle root is recomputed from the block's items (payload hashes),
+        so an edited transaction or contract fails verification.
+        """
+
+        previous_block = previous_block or {}
+        merkle_root = get_merkle_root(item_hashes) if item_hashes else None
+        is_valid = (
+            block["block_height"] == previous_block.get("block_height", 0) + 1
+            and block["previous_block_id"] == previous_block.get("id")
+            and block["previous_block_hash"] == previous_block.get("block_hash")
+            and block["merkle_root"] == merkle_root
+            and block["block_hash"]
+            == BlockSerialiser.get_block_hash(
+                block["block_id"], block["merkle_root"], block["previous_block_hash"]
+            )
+        )
+        if previous_block and previous_block["next_block_id"] != block["id"]:
+            is_valid = False
+        if not is_valid:
+            raise BlockError(f"Invalid Block Chain at Block: {block['block_id']}.")
 
     @classmethod
     @validate_function_signature(True)
@@ -68,17 +151,31 @@ class BlockChainService:
     ) -> ServiceResponse:
         """Creates a New Transaction Block."""
 
-        response = TransactionSerialiser().create_transaction(
+        transaction = TransactionSerialiser().create_transaction(
             sender, receiver, amount=transaction_amount
         )
-        transaction_id = response.split(" ")[-1]
-        transaction = TransactionSerialiser().get_transaction(transaction_id)
         return ServiceResponse(
             "Transaction Block Created Successfully.",
             ServiceStatus.SUCCESS,
             data=transaction,
         )
 
+    @classmethod
+    @validate_function_signature(True)
+    def create_transactions_bulk(
+        cls, transactions: list[tuple[UUID, UUID, float]]
+    ) -> ServiceResponse:
+        """Creates New Transaction Blocks, from (Sender, Receiver, Amount)."""
+
+        data = {
+            "transactions": TransactionSerialiser().create_transactions_bulk(
+                transactions
+            )
+        }
+        return ServiceResponse(
+            "Transaction Blocks Created Successfully.", ServiceStatus.SUCCESS, data=data
+        )
+
     @classmethod
     @validate_function_signature(True)
     def create_contract(
@@ -86,11 +183,9 @@ class BlockChainService:
     ) -> ServiceResponse:
         """Creates a New Transaction Block."""
 
-        response = ContractSerialiser().create_contract(
+        contract = ContractSerialiser().create_contract(
             contractor, contractee, contract_data
         )
-        contract_id = response.split(" ")[-1]
-        contract = ContractSerialiser().get_contract(contract_id)
         return ServiceResponse(
             "Contract Block Created Successfully.", ServiceStatus.SUCCESS, data=contract
         )
@@ -107,18 +202,20 @@ class BlockChainService:
         """Approve a Given Transaction."""
 
         data = {}
-        response = TransactionSerialiser().update_transaction(
-            transaction_id,
-            sender_signiture,
-            receiver_signiture,
-            **transaction_data,
-        )
-        transaction_id = response.split(" ")[-1]
-        transaction = TransactionSerialiser().get_transaction(transaction_id)
-        data.update({"transaction": transaction})
-        if transaction_data["transaction_status"] == TransactionStatus.APPROVED:
-            block = cls.__create_new_block__(transaction_id=transaction["id"])
-            data.update({"block": block})
+        with unit_of_work():
+            response = TransactionSerialiser().update_transaction(
+                transaction_id,
+                sender_signiture,
+                receiver_signiture,
+                **transaction_data,
+            )
+            transaction_id = response.split(" ")[-1]
+            transaction = TransactionSerialiser().get_transaction(transaction_id)
+            data.update({"transaction": transaction})
+            if transaction_data["transaction_status"] == TransactionStatus.APPROVED:
+                block = cls.pack_mempool(BlockType.TRANSACTION).data
+                if block:
+                    data.update({"block": block})
         return ServiceResponse(
             "Transaction Block Created Successfully.",
             ServiceStatus.SUCCESS,
@@ -137,41 +234,137 @@ class BlockChainService:
         """Approve a Given Contract."""
 
         data = {}
-        response = ContractSerialiser().update_contract(
-            contract_id,
-            contractor_signiture,
-            contractee_signiture,
-            **contract_data,
-        )
-        contract_id = response.split(" ")[-1]
-        contract = ContractSerialiser().get_contract(contract_id)
-        data.update({"contract": contract})
-        if contract_data["contract_status"] == ContractStatus.APPROVED:
-            block = cls.__create_new_block__(contract_id=contract["id"])
-            data.update({"block": block})
+        with unit_of_work():
+            response = ContractSerialiser().update_contract(
+                contract_id,
+                contractor_signiture,
+                contractee_signiture,
+                **contract_data,
+            )
+            contract_id = response.split(" ")[-1]
+            contract = ContractSerialiser().get_contract(contract_id)
+            data.update({"contract": contract})
+            if contract_data["contract_status"] == ContractStatus.APPROVED:
+                block = cls.pack_mempool(BlockType.CONTRACT).data
+                if block:
+                    data.update({"block": block})
         return ServiceResponse(
             "Contract Block Created Successfully.", ServiceStatus.SUCCESS, data=data
         )
 
     @classmethod
     @validate_function_signature(True)
-    def __create_new_block__(
-        cls, transaction_id: Optional[UUID] = None, contract_id: Optional[UUID] = None
-    ) -> dict:
-        """Creates a New Block - Transaction or Contract."""
-
-        if transaction_id and contract_id:
-            raise BlockError("Invalid Block - Transaction or Contract not both.")
-
-        response = BlockSerialiser().create_block(transaction_id, contract_id)
-        block_id = response.split(" ")[-1]
-        block = BlockSerialiser().get_block(block_id)
-        if transaction_id:
-            BlockSerialiser().update_block(
-                block["id"], block_type=BlockType.TRANSACTION
-            )
+    def pack_mempool(cls, block_type: BlockType) -> ServiceResponse:
+        """Seals Approved Transactions or Contracts into a Block, once Due."""
+
+        config = AppConfig()
+        block = BlockSerialiser().pack_block(
+            block_type,
+            config.block_size,
+            timedelta(milliseconds=config.block_interval),
+        )
+        if block is None:
+            return ServiceResponse("Block Not Yet Due.", ServiceStatus.WARNING)
+        return ServiceResponse(
+            "Block Created Successfully.", ServiceStatus.SUCCESS, data=block
+        )
+
+
+class AsyncBlockChainService:
+    """Manages BlockChain Operations on the asyncio Engine.
+
+    Each operation runs BlockChainService as a single unit of work over asyncpg.
+    verify_chain is left synchronous, as it commits a checkpoint per batch.
+    """
+
+    @classmethod
+    async def append_block_chain(cls, block_id: UUID) -> ServiceResponse:
+        """Appends a Block."""
+
+        return await run_in_unit_of_work(BlockChainService.append_block_chain, block_id)
+
+    @classmethod
+    async def append_block_chain_batch(cls, block_ids: list[UUID]) -> ServiceResponse:
+        """Appends Blocks, in Order, within a Single Transaction."""
+
+        return await run_in_unit_of_work(
+            BlockChainService.append_block_chain_batch, block_ids
+        )
+
+    @classmethod
+    async def get_chain_tail(cls) -> ServiceResponse:
+        """Gets the Tail Block of the Chain, from the Chain Head."""
+
+        return await run_in_unit_of_work(BlockChainService.get_chain_tail)
+
+    @classmethod
+    async def create_transaction(
+        cls, sender: UUID, receiver: UUID, transaction_amount: float
+    ) -> ServiceResponse:
+        """Creates a New Transaction Block."""
+
+        return await run_in_unit_of_work(
+            BlockChainService.create_transaction, sender, receiver, transaction_amount
+        )
+
+    @classmethod
+    async def create_transactions_bulk(
+        cls, transactions: list[tuple[UUID, UUID, float]]
+    ) -> ServiceResponse:
+        """Creates New Transaction Blocks, from (Sender, Receiver, Amount)."""
+
+        return await run_in_unit_of_work(
+            BlockChainService.create_transactions_bulk, transactions
+        )
+
+    @classmethod
+    async def create_contract(
+        cls, contractor: UUID, contractee: UUID, contract_data: str
+    ) -> ServiceResponse:
+        """Creates a New Contract Block."""
+
+        return await run_in_unit_of_work(
+            BlockChainService.create_contract, contractor, contractee, contract_data
+        )
+
+    @classmethod
+    async def update_transaction(
+        cls,
+        transaction_id: UUID,
+        sender_signiture: str,
+        receiver_signiture: str,
+        transaction_data: TransactionDict,
+    ) -> ServiceResponse:
+        """Approve a Given Transaction."""
+
+        return await run_in_unit_of_work(
+            BlockChainService.update_transaction,
+            transaction_id,
+            sender_signiture,
+            receiver_signiture,
+            transaction_data,
+        )
+
+    @classmethod
+    async def update_contract(
+        cls,
+        contract_id: UUID,
+        contractor_signiture: str,
+        contractee_signiture: str,
+        contract_data: ContractDict,
+    ) -> ServiceResponse:
+        """Approve a Given Contract."""
 
-        if contract_id:
-            BlockSerialiser().update_block(block["id"], block_type=BlockType.CONTRACT)
+        return await run_in_unit_of_work(
+            BlockChainService.update_contract,
+            contract_id,
+            contractor_signiture,
+            contractee_signiture,
+            contract_data,
+        )
+
+    @classmethod
+    async def pack_mempool(cls, block_type: BlockType) -> ServiceResponse:
+        """Seals Approved Transactions or Contracts into a Block, once Due."""
 
-        return BlockSerialiser().get_block(block_id)
+        return await run_in_unit_of_work(BlockChainService.pack_mempool, block_type)
@@ -27,9 +27,11 @@ from lib.interfaces.typed_dicts import (
     TransactionDict,
 )
 from lib.interfaces.data_classes import UserData
+from lib.utils.constants.blocks import BlockType
 from lib.utils.constants.users import SocialMediaLink
 from services.blockchain import BlockChainService
 from services.authentication import AuthenticationService
+from services.rotation import KeyRotationService
 
 
 class Cli:
@@ -61,6 +63,8 @@ class Cli:
         "create": {"args": ("create",), "kwargs": {"help": "Creates Resource."}},
         "read": {"args": ("read",), "kwargs": {"help": "Gets Resource."}},
         "update": {"args": ("update",), "kwargs": {"help": "Updates Resource."}},
+        "verify": {"args": ("verify",), "kwargs": {"help": "Verifies Resource."}},
+        "rotate": {"args": ("rotate",), "kwargs": {"help": "Rotates Encryption Keys."}},
         "help": {"args": ("help",), "kwargs": {"help": "Help Information."}},
     }
     __TRANSACTION_ARGS__ = {
@@ -216,6 +220,11 @@ class Cli:
                         .register_user(arg_data["email"], arg_data["password"])
                         .to_dict()
                     )
+                if args.block:
+                    return [
+                        BlockChainService().pack_mempool(block_type).to_dict()
+                        for block_type in (BlockType.TRANSACTION, BlockType.CONTRACT)
+                    ]
             case "update":
                 if args.transaction:
                     return (
@@ -241,6 +250,12 @@ class Cli:
                     )
                 if args.block:
                     return BlockChainService().append_block_chain(args.uuid).to_dict()
+            case "verify":
+                if args.block:
+                    return BlockChainService().verify_chain().to_dict()
+            case "rotate":
+                if args.user:
+                    return KeyRotationService().rotate_keys().to_dict()
             case "read":
                 if args.user:
                     return (
@@ -322,7 +337,7 @@ class Cli:
 
         return (
             "\n".join(result)
-            + "\n\nExamples:\n  create -T -d\n  read -T\n  create -U -email ##### -p #####\n  create -C --sender-signature ##### --receiver-signature #####\n"
+            + "\n\nExamples:\n  create -T -d\n  read -T\n  create -U -email ##### -p #####\n  create -C --sender-signature ##### --receiver-signature #####\n  verify -B\n  rotate -U\n"
         )
 
     @staticmethod
@@ -0,0 +1,43 @@
+"""Rotation: Encryption Key Rotation Services."""
+
+from typing import Optional
+from lib.decorators.utils import validate_function_signature
+from lib.interfaces.responses import ServiceResponse
+from lib.utils.constants.responses import ServiceStatus
+from serialisers.warehouse.rotations import KeyRotationSerialiser
+from services.abstract import AbstractService
+
+
+class KeyRotationService(AbstractService):
+    """Manages Encryption Key Rotation Operations."""
+
+    __instance = None
+    __ROTATION_BATCH_SIZE__ = 1000
+
+    def __new__(cls) -> "KeyRotationService":
+        """Singleton Class Constructor."""
+
+        if not cls.__instance:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    @validate_function_signature(True)
+    def rotate_keys(cls, batch_size: Optional[int] = None) -> ServiceResponse:
+        """Re-Encrypts Stored Data with the Current Key, from each Checkpoint."""
+
+        batch_size = batch_size or cls.__ROTATION_BATCH_SIZE__
+        rotated_rows = {}
+        for table_name in KeyRotationSerialiser.__ROTATION_COLUMNS__:
+            rotated_rows[table_name] = 0
+            while True:
+                rows = KeyRotationSerialiser().rotate_batch(table_name, batch_size)
+                if not rows:
+                    break
+                rotated_rows[table_name] += rows
+
+        return ServiceResponse(
+            "Encryption Keys Rotated.",
+            ServiceStatus.SUCCESS,
+            data={"rotated_rows": rotated_rows},
+        )
@@ -6,6 +6,7 @@ from lib.decorators.utils import validate_function_signature
 from lib.interfaces.responses import ServiceResponse
 from lib.interfaces.data_classes import UserData
 from lib.utils.constants.responses import ServiceStatus
+from models import run_in_unit_of_work, unit_of_work
 from serialisers.user.accounts import AccountSerialiser
 from serialisers.user.profiles import UserProfileSerialiser
 from serialisers.user.settings import SettingsProfileSerialiser
@@ -29,22 +30,23 @@ class UserService(AbstractService):
     def create_user_account(cls, user_id: UUID, user_data: UserData):
         """Creates an Account for a given User."""
 
-        response = AccountSerialiser().create_account(user_id)
-        account_id = cls.get_public_id(response)
-        account = AccountSerialiser().get_account(account_id)
+        with unit_of_work():
+            response = AccountSerialiser().create_account(user_id)
+            account_id = cls.get_public_id(response)
+            account = AccountSerialiser().get_account(account_id, include=())
 
-        response = UserProfileSerialiser().create_user_profile(account["id"])
-        profile_id = cls.get_public_id(response)
-        profile = UserProfileSerialiser().get_user_profile(profile_id)
+            response = UserProfileSerialiser().create_user_profile(account["id"])
+            profile_id = cls.get_public_id(response)
+            profile = UserProfileSerialiser().get_user_profile(profile_id)
 
-        response = SettingsProfileSerialiser().create_settings_profile(account_id)
-        settings_id = cls.get_public_id(response)
-        settings = SettingsProfileSerialiser().get_settings_profile(settings_id)
+            response = SettingsProfileSerialiser().create_settings_profile(account_id)
+            settings_id = cls.get_public_id(response)
+            settings = SettingsProfileSerialiser().get_settings_profile(settings_id)
 
-        updated_data = cls.update_user_account(
-            user_data, account["id"], profile["id"], settings["id"]
-        )
-        account = cls.get_user_account(account["account_id"])
+            updated_data = cls.update_user_account(
+                user_data, account["id"], profile["id"], settings["id"]
+            )
+            account = cls.get_user_account(account["account_id"])
         return ServiceResponse(
             "User Account Successfully Created.",
             ServiceStatus.SUCCESS,
@@ -62,18 +64,19 @@ class UserService(AbstractService):
     ):
         """Updates a User's Account."""
 
-        if account_id:
-            AccountSerialiser().update_account(
-                account_id, **user_data.account.to_dict()
-            )
-        if profile_id:
-            UserProfileSerialiser().update_user_profile(
-                profile_id, **user_data.profile.to_dict()
-            )
-        if settings_id:
-            SettingsProfileSerialiser().update_settings_profile(
-                settings_id, **user_data.settings.to_dict()
-            )
+        with unit_of_work():
+            if account_id:
+                AccountSerialiser().update_account(
+                    account_id, **user_data.account.to_dict()
+                )
+            if profile_id:
+                UserProfileSerialiser().update_user_profile(
+                    profile_id, **user_data.profile.to_dict()
+                )
+            if settings_id:
+                SettingsProfileSerialiser().update_settings_profile(
+                    settings_id, **user_data.settings.to_dict()
+                )
         return ServiceResponse(
             "User Account Successfully Updated.",
             ServiceStatus.SUCCESS,
@@ -99,3 +102,41 @@ class UserService(AbstractService):
 
     # def remove_payment_profile():
     #     pass
+
+
+class AsyncUserService:
+    """Manages User Operations on the asyncio Engine."""
+
+    @classmethod
+    async def create_user_account(
+        cls, user_id: UUID, user_data: UserData
+    ) -> ServiceResponse:
+        """Creates an Account for a given User."""
+
+        return await run_in_unit_of_work(
+            UserService.create_user_account, user_id, user_data
+        )
+
+    @classmethod
+    async def update_user_account(
+        cls,
+        user_data: UserData,
+        account_id: Optional[str],
+        profile_id: Optional[str],
+        settings_id: Optional[str],
+    ) -> ServiceResponse:
+        """Updates a User's Account."""
+
+        return await run_in_unit_of_work(
+            UserService.update_user_account,
+            user_data,
+            account_id,
+            profile_id,
+            settings_id,
+        )
+
+    @classmethod
+    async def get_user_account(cls, account_id: str) -> ServiceResponse:
+        """Finds a Valid User Account."""
+
+        return await run_in_unit_of_work(UserService.get_user_account, account_id)
@@ -1,13 +1,18 @@
 """Tests: Testing Configuration Module."""
 
 from pytest import fixture
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, object_session
 
 from lib.interfaces.exceptions import ApplicationError
 from models import ENGINE
+from models.blockchain.heads import ChainHead
+from serialisers.blockchain.blocks import BlockSerialiser
+from serialisers.blockchain.heads import ChainHeadSerialiser
 from tests.test_utils.blockchain import (
     create_blocks,
     create_contracts,
+    create_transaction_blocks,
     create_transactions,
 )
 from tests.test_utils.users import (
@@ -238,3 +243,49 @@ def get_blocks():
         yield blocks
 
         run_test_teardown(blocks, session)
+
+
+@fixture
+def get_chain_head():
+    """Returns the Chain Head, Restoring its Tail after the Test."""
+
+    with Session(ENGINE) as session:
+        chain_head = ChainHeadSerialiser.lock_chain_head(session)
+        session.commit()
+        data = {
+            "block_id": chain_head.block_id,
+            "verified_block_id": chain_head.verified_block_id,
+            "verified_height": chain_head.verified_height,
+        }
+
+        yield chain_head
+
+        session.execute(
+            update(ChainHead).filter(ChainHead.id == chain_head.id).values(**data)
+        )
+        session.commit()
+
+
+@fixture(name="transaction_blocks")
+def fixture_transaction_blocks(get_transactions):
+    """Returns Test Transaction Blocks, not yet Appended to the Chain."""
+
+    with Session(ENGINE) as session:
+        blocks = create_transaction_blocks(get_transactions)
+        setup_test_commit(blocks, session)
+
+        yield blocks
+
+        run_test_teardown(blocks, session)
+
+
+@fixture(name="chained_blocks")
+def fixture_chained_blocks(request, transaction_blocks):
+    """Returns Test Transaction Blocks, Appended to the Chain Tail."""
+
+    request.getfixturevalue("get_chain_head")
+    BlockSerialiser().append_blocks([block.block_id for block in transaction_blocks])
+    for block in transaction_blocks:
+        object_session(block).expire(block)
+
+    return transaction_blocks
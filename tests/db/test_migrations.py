@@ -0,0 +1,68 @@
+"""DB: Testing Data Migrations."""
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session, object_session
+
+from models import ENGINE
+from models.blockchain.blocks import Block
+from serialisers.blockchain.blocks import BlockSerialiser
+from services.blockchain import BlockChainService
+
+VERSIONS = Path(__file__).parents[2] / "db" / "alembic" / "versions"
+
+
+def load_migration(name: str):
+    """Loads a Migration Module from the Alembic Versions."""
+
+    spec = spec_from_file_location(name, VERSIONS / f"{name}.py")
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Migration Not Found: {name}.")
+    migration = module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    return migration
+
+
+def test_backfilled_block_merkle_roots(chained_blocks):
+    """Testing Migrations: Backfill Merkle Roots of a Chain Sealed Before Items."""
+
+    migration = load_migration("a4d2c8e6f913_backfilled_block_merkle_roots")
+    with Session(ENGINE) as session:
+        hashes = [
+            (block.merkle_root, block.previous_block_hash, block.block_hash)
+            for block in chained_blocks
+        ]
+        previous_hash = chained_blocks[0].previous_block_hash
+        for block in chained_blocks:
+            block_hash = BlockSerialiser.get_block_hash(
+                block.block_id, None, previous_hash
+            )
+            session.execute(
+                update(Block)
+                .filter(Block.id == block.id)
+                .values(
+                    merkle_root=None,
+                    previous_block_hash=previous_hash,
+                    block_hash=block_hash,
+                )
+            )
+            previous_hash = block_hash
+        session.commit()
+
+    with ENGINE.begin() as connection:
+        first_height = migration.backfill_merkle_roots(connection)
+        assert first_height == chained_blocks[0].block_height
+        migration.backfill_block_hashes(connection, first_height)
+
+    for block in chained_blocks:
+        object_session(block).expire(block)
+    assert [
+        (block.merkle_root, block.previous_block_hash, block.block_hash)
+        for block in chained_blocks
+    ] == hashes
+    assert BlockChainService.verify_chain(chained_blocks[0].block_height).data == {
+        "verified_blocks": 2,
+        "verified_height": chained_blocks[-1].block_height,
+    }
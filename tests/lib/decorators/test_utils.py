@@ -0,0 +1,175 @@
+"""Decorators: Testing Utility Wrapper Functions."""
+
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from pytest import fixture, mark, raises
+
+from lib.decorators.utils import (
+    check_type,
+    compile_type,
+    get_validation_mode,
+    set_validation_mode,
+    validate_function_signature,
+)
+from lib.interfaces.exceptions import ApplicationError
+from lib.utils.constants.validations import ValidationMode
+
+
+class Node:  # pylint: disable=too-few-public-methods
+    """Test Class, Referenced by its Own Methods' Type Hints."""
+
+    @validate_function_signature(True)
+    def link(self, node: "Node") -> "Node":
+        """Returns the Linked Node."""
+
+        return node
+
+
+@fixture
+def validation_mode():
+    """Restores the Validation Mode after each Test."""
+
+    mode, sample_rate = get_validation_mode()
+    yield
+    set_validation_mode(mode, sample_rate)
+
+
+@mark.parametrize(
+    "data",
+    [
+        ((uuid4(), uuid4(), 1.0), tuple[UUID, UUID, float], True),
+        ((uuid4(), uuid4()), tuple[UUID, UUID, float], False),
+        ((uuid4(), "uuid", 1.0), tuple[UUID, UUID, float], False),
+        ([uuid4(), uuid4(), 1.0], tuple[UUID, UUID, float], False),
+        ((1, 2, 3), tuple[int, ...], True),
+        ((1, "2"), tuple[int, ...], False),
+        ([(uuid4(), 1)], list[tuple[UUID, int]], True),
+        (None, Optional[tuple[int]], True),
+        (None, int | None, True),
+        ("1", int | None, False),
+        (True, int, False),
+        (object(), Any, True),
+        ({"a": 1}, dict[str, int], True),
+        ({"a": "1"}, dict[str, int], False),
+    ],
+)
+def test_check_type(data):
+    """Testing Check Type."""
+
+    value, expected_type, result = data
+    assert check_type(value, expected_type) is result
+
+
+def test_validate_function_signature():
+    """Testing Validate Function Signature."""
+
+    @validate_function_signature()
+    def function(values: list[tuple[UUID, float]], flag: bool = False) -> int:
+        return len(values) + int(flag)
+
+    assert function([(uuid4(), 1.0)]) == 1
+    assert function([], flag=True) == 1
+    with raises(ApplicationError):
+        function([(uuid4(), 1)])
+    with raises(ApplicationError):
+        function([], flags=True)
+
+
+def test_validate_function_signature_methods():
+    """Testing Validate Function Signature on Methods, *args and **kwargs."""
+
+    class Service:
+        """Test Service."""
+
+        @classmethod
+        @validate_function_signature(True)
+        def method(cls, value: int, *values: str, **options: bool) -> int:
+            """Test Class Method."""
+
+            return value + len(values) + len(options)
+
+        @staticmethod
+        @validate_function_signature()
+        def function(*values: str) -> int:
+            """Test Static Method."""
+
+            return len(values)
+
+    assert Service.method(1, "a", "b", flag=True) == 4
+    assert Service.function("a", "b") == 2
+    with raises(ApplicationError):
+        Service.function("a", 2)
+    with raises(ApplicationError):
+        Service.method("1")
+    with raises(ApplicationError):
+        Service.method(1, 2)
+    with raises(ApplicationError):
+        Service.method(1, flag="yes")
+
+
+def test_validate_function_signature_too_many_arguments():
+    """Testing Validate Function Signature with Too Many Arguments."""
+
+    @validate_function_signature()
+    def function(value: int) -> int:
+        return value
+
+    with raises(ApplicationError, match="Too many arguments provided."):
+        function(1, 2)
+
+
+def test_validate_function_signature_compiled_on_decoration():
+    """Testing Validate Function Signature Resolves Type Hints when Applied."""
+
+    with raises(SyntaxError):
+
+        @validate_function_signature()
+        def function(value: "not a type") -> Any:
+            return value
+
+
+def test_validate_function_signature_forward_reference():
+    """Testing Validate Function Signature with a Forward Reference."""
+
+    node = Node()
+    assert node.link(node) is node
+    with raises(ApplicationError):
+        node.link("Node")
+
+
+def test_compile_type_cached():
+    """Testing Compiled Type Checks are Cached."""
+
+    assert compile_type(list[tuple[UUID, float]]) is compile_type(list[tuple[UUID, float]])
+
+
+@mark.usefixtures("validation_mode")
+def test_validate_function_signature_disabled():
+    """Testing Validate Function Signature with Validation Disabled."""
+
+    @validate_function_signature()
+    def function(value: int) -> Any:
+        return value
+
+    set_validation_mode(ValidationMode.DISABLED)
+    assert function("1") == "1"
+    set_validation_mode(ValidationMode.FULL)
+    with raises(ApplicationError):
+        function("1")
+
+
+@mark.usefixtures("validation_mode")
+def test_validate_function_signature_sampled(monkeypatch):
+    """Testing Validate Function Signature with Sampled Validation."""
+
+    @validate_function_signature()
+    def function(value: int) -> Any:
+        return value
+
+    set_validation_mode(ValidationMode.SAMPLED, 0.5)
+    monkeypatch.setattr("lib.decorators.utils.random", lambda: 0.75)
+    assert function("1") == "1"
+    monkeypatch.setattr("lib.decorators.utils.random", lambda: 0.25)
+    with raises(ApplicationError):
+        function("1")
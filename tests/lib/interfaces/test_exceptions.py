@@ -9,6 +9,7 @@ from lib.interfaces.exceptions import (
     FernetError,
     LoginHistoryError,
     PaymentProfileError,
+    TokenError,
     TransactionError,
     UserError,
     UserProfileError,
@@ -112,3 +113,12 @@ def test_blockerror():
         raise BlockError("Testing BlockError.")
     except BlockError as e:
         assert str(e) == "Testing BlockError."
+
+
+def test_tokenerror():
+    """Testing Custom Token Error."""
+
+    try:
+        raise TokenError("Testing TokenError.")
+    except TokenError as e:
+        assert str(e) == "Testing TokenError."
@@ -0,0 +1,129 @@
+"""Caching: Testing Read-Through Caches."""
+
+from typing import Any, Optional
+
+from pytest import fixture
+
+from lib.utils.caching.cache import (
+    NO_EXPIRY,
+    CacheBackend,
+    MemoryCacheBackend,
+    ReadThroughCache,
+)
+
+
+class DictBackend(CacheBackend):
+    """Test (Shared) Backend, Recording its TTLs."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, Any] = {}
+        self.ttls: dict[str, Optional[float]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.entries[key] = value
+        self.ttls[key] = ttl
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+@fixture(name="backend")
+def fixture_backend():
+    """Swaps in a Test Backend, Restoring the Default Afterwards."""
+
+    previous = ReadThroughCache.get_backend()
+    test_backend = DictBackend()
+    ReadThroughCache.set_backend(test_backend)
+    yield test_backend
+    ReadThroughCache.set_backend(previous)
+
+
+def test_memory_cache_backend_lru():
+    """Testing Memory Cache Backend: Evicts the Least Recently Used."""
+
+    cache = MemoryCacheBackend(2, 60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_memory_cache_backend_ttl(monkeypatch):
+    """Testing Memory Cache Backend: Expires Entries, unless Immutable."""
+
+    now = [100.0]
+    monkeypatch.setattr("lib.utils.caching.cache.monotonic", lambda: now[0])
+    cache = MemoryCacheBackend(10, 5)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+    cache.set("immutable", 3, ttl=NO_EXPIRY)
+
+    now[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+    now[0] += 1000
+    assert cache.get("default") is None
+    assert cache.get("immutable") == 3
+
+
+def test_memory_cache_backend_delete():
+    """Testing Memory Cache Backend: Delete and Clear."""
+
+    cache = MemoryCacheBackend(10, 60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_read_through_cache(backend):
+    """Testing Read-Through Cache: Hits, Misses and Invalidation."""
+
+    cache = ReadThroughCache("test")
+    loads = []
+
+    def loader() -> dict:
+        loads.append(1)
+        return {"id": "1"}
+
+    assert cache.get_or_load("1", loader) == {"id": "1"}
+    assert cache.get_or_load("1", loader) == {"id": "1"}
+    assert len(loads) == 1
+    assert cache.stats == {"hits": 1, "misses": 1}
+    assert backend.entries == {"test:1": {"id": "1"}}
+
+    cache.get("1")["id"] = "mutated"
+    assert cache.get("1") == {"id": "1"}
+
+    cache.invalidate("1", "2")
+    assert cache.get("1") is None
+    cache.get_or_load("1", loader, store=False)
+    assert cache.get("1") is None
+    assert len(loads) == 2
+
+    cache.reset_stats()
+    assert cache.stats == {"hits": 0, "misses": 0}
+
+
+def test_read_through_cache_ttl(backend):
+    """Testing Read-Through Cache: TTLs are Passed to the Backend."""
+
+    cache = ReadThroughCache("test")
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=NO_EXPIRY)
+
+    assert backend.ttls == {"test:a": None, "test:b": NO_EXPIRY}
@@ -0,0 +1,72 @@
+"""Caching: Testing Session Store."""
+
+from time import time
+from uuid import uuid4
+
+from pytest import fixture
+
+from config import AppConfig
+from lib.utils.caching.cache import MemoryCacheBackend
+from lib.utils.caching.sessions import SessionStore
+
+
+@fixture(name="backend")
+def fixture_backend():
+    """Swaps in an Empty Backend, Restoring the Default Afterwards."""
+
+    previous = SessionStore.get_backend()
+    test_backend = MemoryCacheBackend(16, 60)
+    SessionStore.set_backend(test_backend)
+    yield test_backend
+    SessionStore.set_backend(previous)
+
+
+def test_session_store_start(backend):
+    """Testing Session Store: Starting Sessions Supersedes the Last."""
+
+    user_id, session_id, next_session_id = str(uuid4()), str(uuid4()), str(uuid4())
+    assert SessionStore().is_active(user_id, session_id) is None
+
+    SessionStore().start(user_id, session_id, time() + 60)
+    assert SessionStore().is_active(user_id, session_id) is True
+
+    SessionStore().start(user_id, next_session_id, time() + 60)
+    assert SessionStore().is_active(user_id, session_id) is False
+    assert SessionStore().is_active(user_id, next_session_id) is True
+    assert len(backend) == 1
+
+    SessionStore().start(str(uuid4()), str(uuid4()), time() - 1)
+    assert len(backend) == 1
+
+
+def test_session_store_ttl(backend, monkeypatch):
+    """Testing Session Store: Sessions are Cached for at most CACHE_TTL."""
+
+    user_id, session_id = str(uuid4()), str(uuid4())
+    SessionStore().start(user_id, session_id, time() + 10**6)
+    SessionStore().revoke(str(uuid4()), str(uuid4()), time() + 10**6)
+
+    clock = backend.__entries__[f"user:{user_id}"][0] + 1
+    assert clock < AppConfig().cache_ttl + 10**6
+    monkeypatch.setattr("lib.utils.caching.cache.monotonic", lambda: clock)
+    assert SessionStore().is_active(user_id, session_id) is None
+    assert len(backend) == 1
+
+
+def test_session_store_revoke(backend):
+    """Testing Session Store: Revoked Sessions are Inactive until they Expire."""
+
+    user_id, session_id = str(uuid4()), str(uuid4())
+    SessionStore().start(user_id, session_id, time() + 60)
+    SessionStore().revoke(user_id, session_id, time() + 60)
+    assert SessionStore().is_active(user_id, session_id) is False
+    assert backend.get(f"user:{user_id}") is None
+
+    SessionStore().start(user_id, session_id, time() + 60)
+    assert SessionStore().is_active(user_id, session_id) is False
+
+    SessionStore().revoke(user_id, str(uuid4()), time() - 1)
+    assert len(backend) == 2
+
+    SessionStore().clear()
+    assert SessionStore().is_active(user_id, session_id) is None
@@ -0,0 +1,88 @@
+"""Cards: Testing Card Number Generation and Pools."""
+
+from pytest import mark
+
+from config import AppConfig
+from lib.utils.cards.numbers import (
+    CardNumberPool,
+    generate_card_numbers,
+    get_card_number_hash,
+    get_luhn_digit,
+    is_luhn_valid,
+)
+from lib.utils.constants.users import CardType
+from lib.utils.encryption.encoders import get_hash_value, get_hmac_value
+
+
+@mark.parametrize(
+    "data", [("7992739871", "3"), ("4539578763621486"[:-1], "6"), ("0", "0")]
+)
+def test_get_luhn_digit(data):
+    """Testing Card Numbers: Luhn Check Digit."""
+
+    assert get_luhn_digit(data[0]) == data[1]
+
+
+@mark.parametrize(
+    "data",
+    [("79927398713", True), ("79927398710", False), ("1991123456789", False), (1, False)],
+)
+def test_is_luhn_valid(data):
+    """Testing Card Numbers: Luhn Validation."""
+
+    assert is_luhn_valid(data[0]) is data[1]
+
+
+@mark.parametrize("data", list(CardType))
+def test_generate_card_numbers(data):
+    """Testing Card Numbers: Generates Distinct, Luhn-Valid Numbers."""
+
+    card_length = AppConfig().card_length
+    card_numbers = generate_card_numbers(data.value[1], card_length, 500)
+
+    assert len(set(card_numbers)) == 500
+    for card_number in card_numbers:
+        assert len(card_number) == card_length
+        assert card_number.startswith(data.value[1])
+        assert is_luhn_valid(card_number)
+
+
+def test_get_card_number_hash(monkeypatch):
+    """Testing Card Numbers: Hashes are Keyed, not Salted with the Public Salt."""
+
+    card_hash = get_card_number_hash("79927398713")
+    assert card_hash == get_hmac_value("79927398713", AppConfig().card_hash_key)
+    assert card_hash != get_hash_value("79927398713", str(AppConfig().salt_value))
+
+    monkeypatch.setattr(AppConfig, "__CARD_HASH_KEY__", "card-hash-key")
+    assert get_card_number_hash("79927398713") != card_hash
+
+
+def test_card_number_pool():
+    """Testing Card Number Pool: One Issued Check per Reserved Block."""
+
+    calls: list[list[str]] = []
+
+    def get_issued(card_hashes: list[str]) -> set[str]:
+        calls.append(card_hashes)
+        return set(card_hashes[:10])
+
+    pool = CardNumberPool(50, get_issued)
+    card_number, card_hash = pool.allocate(CardType.CHEQUE)
+    assert card_hash == get_card_number_hash(card_number)
+    assert card_hash not in calls[0][:10]
+    assert card_number.startswith(CardType.CHEQUE.value[1])
+
+    allocated = {card_number}
+    allocated.update(pool.allocate(CardType.CHEQUE)[0] for _ in range(39))
+    assert len(allocated) == 40
+    assert len(calls) == 1
+
+    pool.allocate(CardType.CHEQUE)
+    assert len(calls) == 2
+    assert pool.reserve(CardType.SAVINGS) == 40
+    assert len(calls) == 3
+
+    pool.clear()
+    pool.allocate(CardType.SAVINGS)
+    assert len(calls) == 4
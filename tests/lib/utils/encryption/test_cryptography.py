@@ -1,10 +1,15 @@
 """Encryption: Testing Cryptography Module."""
 
 from uuid import uuid4
+from cryptography.fernet import Fernet, InvalidToken
 from pytest import mark, raises
 from config import AppConfig
-from lib.interfaces.exceptions import UserError
-from lib.utils.encryption.cryptography import encrypt_data, decrypt_data
+from lib.interfaces.exceptions import FernetError, UserError
+from lib.utils.encryption.cryptography import (
+    CryptoProvider,
+    decrypt_data,
+    encrypt_data,
+)
 
 
 @mark.parametrize(
@@ -71,3 +76,46 @@ def test_invalid_decrypt_data(data):
         fernet = AppConfig().fernet
         encrypted_data = fernet.encrypt(data.encode()).decode()
         decrypt_data(encrypted_data.encode())
+
+
+def test_crypto_provider_cache():
+    """Test Crypto Provider Cipher is Built Once."""
+
+    assert CryptoProvider() is CryptoProvider()
+    assert CryptoProvider().cipher is CryptoProvider().cipher
+
+
+def test_crypto_provider_many():
+    """Test Crypto Provider Batch Encryption and Decryption."""
+
+    data = ["Testing Hash Value.", str(uuid4()), str(123456789)]
+    encrypted_data = CryptoProvider().encrypt_many([value.encode() for value in data])
+    assert len(encrypted_data) == len(data)
+    assert encrypted_data != data
+    assert CryptoProvider().decrypt_many(encrypted_data) == data
+    assert [decrypt_data(value) for value in encrypted_data] == data
+
+
+def test_crypto_provider_rotation(monkeypatch):
+    """Test Crypto Provider Key Rotation."""
+
+    previous_key = AppConfig().fernet_keys[0]
+    encrypted_data = encrypt_data(b"Testing Key Rotation.")
+
+    monkeypatch.setattr(AppConfig, "__FERNET_KEY__", Fernet.generate_key().decode())
+    monkeypatch.setattr(AppConfig, "__FERNET_PREVIOUS_KEYS__", previous_key)
+    CryptoProvider.reset()
+    try:
+        assert decrypt_data(encrypted_data) == "Testing Key Rotation."
+        rotated_data = CryptoProvider().rotate(encrypted_data)
+        assert decrypt_data(rotated_data) == "Testing Key Rotation."
+        with raises(InvalidToken):
+            Fernet(previous_key).decrypt(rotated_data.encode())
+
+        monkeypatch.setattr(AppConfig, "__FERNET_KEY__", "Invalid Fernet Key.")
+        CryptoProvider.reset()
+        with raises(FernetError):
+            encrypt_data(b"Testing Key Rotation.")
+    finally:
+        monkeypatch.undo()
+        CryptoProvider.reset()
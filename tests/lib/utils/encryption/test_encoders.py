@@ -2,7 +2,7 @@
 
 from uuid import uuid4
 from pytest import mark, raises
-from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.encoders import get_hash_value, get_hmac_value, get_merkle_root
 
 
 @mark.parametrize(
@@ -49,3 +49,54 @@ def test_get_hash_value_invalid_value(data):
 
     with raises(ValueError, match="Value must be a String."):
         get_hash_value(data[0], data[1])
+
+
+def test_get_hmac_value():
+    """Test Keyed Hash Value."""
+
+    key = str(uuid4())
+    assert len(get_hmac_value("Testing Hash Value.", key)) == 64
+    assert get_hmac_value("Testing Hash Value.", key) == get_hmac_value(
+        "Testing Hash Value.", key
+    )
+    assert get_hmac_value("Testing Hash Value.", key) != get_hmac_value(
+        "Testing Hash Value.", str(uuid4())
+    )
+    assert get_hmac_value("Testing Hash Value.", key) != get_hash_value(
+        "Testing Hash Value.", key
+    )
+
+
+@mark.parametrize("data", [(123456789, "key"), ("value", ""), ("value", None)])
+def test_get_hmac_value_invalid(data):
+    """Test Invalid Keyed Hash Value."""
+
+    with raises(ValueError):
+        get_hmac_value(data[0], data[1])
+
+
+@mark.parametrize(
+    "data",
+    [
+        [get_hash_value("Testing Hash Value.")],
+        [get_hash_value(str(uuid4())) for _ in range(2)],
+        [get_hash_value(str(uuid4())) for _ in range(5)],
+    ],
+)
+def test_get_merkle_root(data):
+    """Test Valid Merkle Root."""
+
+    merkle_root = get_merkle_root(data)
+
+    assert len(merkle_root) == 64
+    assert merkle_root == get_merkle_root(list(data))
+    assert merkle_root != get_merkle_root(list(reversed(data))) or len(set(data)) == 1
+
+
+def test_get_merkle_root_invalid():
+    """Test Invalid Merkle Root."""
+
+    with raises(ValueError, match="Hash Values must not be Empty."):
+        get_merkle_root([])
+    with raises(ValueError, match="Value must be a String."):
+        get_merkle_root([None])
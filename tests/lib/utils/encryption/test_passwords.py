@@ -0,0 +1,106 @@
+"""Encryption: Testing Password Hashing Module."""
+
+from asyncio import run
+from hashlib import scrypt
+from uuid import uuid4
+
+from pytest import fixture, mark, raises
+
+from config import AppConfig
+from lib.interfaces.exceptions import ApplicationError
+from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.passwords import PasswordHasher, derive_key
+
+
+@fixture(name="kdf_config")
+def fixture_kdf_config(monkeypatch):
+    """Configures a Cheap KDF, Restarting the Process Pool Around the Test."""
+
+    monkeypatch.setattr(AppConfig, "__KDF_COST__", "4")
+    monkeypatch.setattr(AppConfig, "__KDF_PREVIOUS_COSTS__", "3, 2")
+    PasswordHasher.reset()
+    yield
+    PasswordHasher.reset()
+
+
+def test_derive_key():
+    """Test Deriving a scrypt Key."""
+
+    key = scrypt(b"password123@", salt=b"salt", n=2**4, r=8, p=1, dklen=32)
+    assert derive_key("password123@", "salt", 4) == key.hex()
+
+
+@mark.usefixtures("kdf_config")
+def test_password_hasher_hash(monkeypatch):
+    """Test Hashing a Password at the Current Cost, in the Pool and in Thread."""
+
+    salt_value = str(uuid4())
+    hashed = PasswordHasher().hash_password("password123@", salt_value)
+
+    assert hashed == f"scrypt$4${derive_key('password123@', salt_value, 4)}"
+    assert hashed != PasswordHasher().hash_password("password123@", str(uuid4()))
+    assert not PasswordHasher().needs_rehash(hashed)
+
+    monkeypatch.setattr(AppConfig, "__KDF_WORKERS__", "0")
+    assert PasswordHasher().hash_password("password123@", salt_value) == hashed
+
+
+@mark.usefixtures("kdf_config")
+def test_password_hasher_hashes():
+    """Test Hashing a Password at Every Accepted Cost, Current Cost First."""
+
+    salt_value = str(uuid4())
+    hashes = PasswordHasher().get_password_hashes("password123@", salt_value)
+
+    assert hashes == [
+        f"scrypt${cost}${derive_key('password123@', salt_value, cost)}"
+        for cost in (4, 3, 2)
+    ] + [get_hash_value("password123@", salt_value)]
+    assert [PasswordHasher().needs_rehash(hashed) for hashed in hashes] == [
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert [PasswordHasher().is_legacy(hashed) for hashed in hashes] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+@mark.usefixtures("kdf_config")
+@mark.parametrize("workers", ["2", "0"])
+def test_password_hasher_async(monkeypatch, workers):
+    """Test Hashing a Password without Blocking the Event Loop."""
+
+    monkeypatch.setattr(AppConfig, "__KDF_WORKERS__", workers)
+    salt_value = str(uuid4())
+    hasher = PasswordHasher()
+
+    assert run(hasher.hash_password_async("password123@", salt_value)) == (
+        hasher.hash_password("password123@", salt_value)
+    )
+    assert run(hasher.get_password_hashes_async("password123@", salt_value)) == (
+        hasher.get_password_hashes("password123@", salt_value)
+    )
+
+
+@mark.usefixtures("kdf_config")
+def test_password_hasher_bounded(monkeypatch):
+    """Test Failing Fast once Too Many Callers Wait on the Pool."""
+
+    monkeypatch.setattr(AppConfig, "__KDF_MAX_PENDING__", "1")
+    PasswordHasher().hash_password("password123@", "salt")
+
+    pending = PasswordHasher.__pending__
+    assert pending.acquire(blocking=False)
+    try:
+        with raises(ApplicationError, match="Too Many Pending"):
+            PasswordHasher().hash_password("password123@", "salt")
+        with raises(ApplicationError, match="Too Many Pending"):
+            run(PasswordHasher().hash_password_async("password123@", "salt"))
+    finally:
+        pending.release()
+    assert PasswordHasher().hash_password("password123@", "salt")
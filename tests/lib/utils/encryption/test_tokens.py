@@ -0,0 +1,87 @@
+"""Encryption: Testing Authentication Tokens Module."""
+
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+from uuid import uuid4
+
+from cryptography.fernet import Fernet
+from pytest import mark, raises
+
+from config import AppConfig
+from lib.interfaces.exceptions import TokenError
+from lib.utils.encryption.cryptography import encrypt_data
+from lib.utils.encryption.tokens import TokenProvider
+
+
+def test_token_provider_sign():
+    """Test Signing and Verifying a Token."""
+
+    claims = {"user_id": str(uuid4()), "session_id": str(uuid4())}
+    token = TokenProvider().sign(claims, timedelta(days=30))
+
+    assert token.count(".") == 2
+    verified = TokenProvider().verify(token)
+    assert {key: verified[key] for key in claims} == claims
+    assert verified["exp"] - verified["iat"] == timedelta(days=30).total_seconds()
+
+
+def test_token_provider_expired():
+    """Test Verifying an Expired Token."""
+
+    token = TokenProvider().sign({}, timedelta(seconds=-1))
+    with raises(TokenError, match="Expired Token."):
+        TokenProvider().verify(token)
+
+
+def __tamper__(token: str, index: int) -> str:
+    """Replaces one Part of a Token with a Forged, Unsigned Part."""
+
+    parts = token.split(".")
+    forged = b'{"alg":"none","typ":"JWT","kid":"0"}' if index == 0 else b'{"exp":1e12}'
+    parts[index] = urlsafe_b64encode(forged).rstrip(b"=").decode()
+    return ".".join(parts)
+
+
+@mark.parametrize(
+    "data",
+    [
+        __tamper__(TokenProvider().sign({}, timedelta(days=1)), 0),
+        __tamper__(TokenProvider().sign({}, timedelta(days=1)), 1),
+        TokenProvider().sign({}, timedelta(days=1))[:-2],
+        TokenProvider().sign({}, timedelta(days=1)) + ".",
+        encrypt_data(b'{"user_id": "1"}'),
+        "Invalid Token.",
+        "a.b.c",
+        1,
+        None,
+    ],
+)
+def test_token_provider_invalid(data):
+    """Test Verifying Tampered or Malformed Tokens."""
+
+    with raises(TokenError):
+        TokenProvider().verify(data)
+
+
+def test_token_provider_rotation(monkeypatch):
+    """Test Verifying Tokens Signed with a Retired Key."""
+
+    previous_key = AppConfig().fernet_keys[0]
+    token = TokenProvider().sign({}, timedelta(days=1))
+
+    monkeypatch.setattr(AppConfig, "__FERNET_KEY__", Fernet.generate_key().decode())
+    monkeypatch.setattr(AppConfig, "__FERNET_PREVIOUS_KEYS__", previous_key)
+    TokenProvider.reset()
+    try:
+        assert TokenProvider().verify(token)["exp"]
+        rotated_token = TokenProvider().sign({}, timedelta(days=1))
+        assert rotated_token.split(".")[0] != token.split(".")[0]
+
+        monkeypatch.setattr(AppConfig, "__FERNET_PREVIOUS_KEYS__", "")
+        TokenProvider.reset()
+        assert TokenProvider().verify(rotated_token)["exp"]
+        with raises(TokenError):
+            TokenProvider().verify(token)
+    finally:
+        monkeypatch.undo()
+        TokenProvider.reset()
@@ -7,14 +7,27 @@ from pytest import mark, raises
 
 from lib.interfaces.exceptions import ApplicationError
 from lib.validators.config import (
+    validate_block_interval,
+    validate_block_size,
+    validate_cache_size,
+    validate_cache_ttl,
+    validate_card_hash_key,
     validate_cvv_length,
     validate_end_date,
     validate_salt_value,
     validate_fernet_key,
+    validate_fernet_keys,
+    validate_kdf_cost,
+    validate_kdf_costs,
+    validate_kdf_max_pending,
+    validate_kdf_workers,
     validate_session_id,
     validate_card_length,
     validate_start_date,
+    validate_validation_mode,
+    validate_validation_sample_rate,
 )
+from lib.utils.constants.validations import ValidationMode
 
 
 @mark.parametrize(
@@ -59,6 +72,48 @@ def test_invalidate_fernet_key(data):
         validate_fernet_key(data)
 
 
+@mark.parametrize(
+    "data",
+    ["card-hash-key", "Any Valid String."],
+)
+def test_validate_card_hash_key(data):
+    """Tests Validating Card Hash Key."""
+
+    assert validate_card_hash_key(data) == data
+
+
+@mark.parametrize(
+    "data",
+    [1, None, ""],
+)
+def test_invalidate_card_hash_key(data):
+    """Tests Invalidates Card Hash Key."""
+
+    with raises(ApplicationError):
+        validate_card_hash_key(data)
+
+
+@mark.parametrize(
+    "data",
+    [["fernet-key"], ["fernet-key", "Any Valid String."]],
+)
+def test_validate_fernet_keys(data):
+    """Tests Validating Fernet Keys."""
+
+    assert validate_fernet_keys(data) == data
+
+
+@mark.parametrize(
+    "data",
+    [[], "fernet-key", ["fernet-key", ""], ["fernet-key", None]],
+)
+def test_invalidate_fernet_keys(data):
+    """Tests Invalidates Fernet Keys."""
+
+    with raises(ApplicationError):
+        validate_fernet_keys(data)
+
+
 @mark.parametrize(
     "data",
     [datetime.now(), datetime(2010, 12, 31, 15, 1, 15), datetime(1972, 1, 15, 0, 0, 0)],
@@ -166,6 +221,48 @@ def test_invalidate_cvv_length(data):
         validate_cvv_length(data)
 
 
+@mark.parametrize(
+    "data",
+    [1, 100, 5000],
+)
+def test_validate_block_size(data):
+    """Tests Validating Block Size."""
+
+    assert validate_block_size(data) == data
+
+
+@mark.parametrize(
+    "data",
+    [-9, 0, "27", 27.0, None],
+)
+def test_invalidate_block_size(data):
+    """Tests Invalidates Block Size."""
+
+    with raises(ApplicationError):
+        validate_block_size(data)
+
+
+@mark.parametrize(
+    "data",
+    [0, 250, 60000],
+)
+def test_validate_block_interval(data):
+    """Tests Validating Block Interval."""
+
+    assert validate_block_interval(data) == data
+
+
+@mark.parametrize(
+    "data",
+    [-1, "27", 27.0, None],
+)
+def test_invalidate_block_interval(data):
+    """Tests Invalidates Block Interval."""
+
+    with raises(ApplicationError):
+        validate_block_interval(data)
+
+
 @mark.parametrize(
     "data",
     [uuid4(), uuid4()],
@@ -185,3 +282,176 @@ def test_invalidate_session_id(data):
 
     with raises(ApplicationError):
         validate_session_id(data)
+
+
+@mark.parametrize(
+    "data",
+    [
+        ("full", ValidationMode.FULL),
+        ("Sampled", ValidationMode.SAMPLED),
+        ("disabled", ValidationMode.DISABLED),
+    ],
+)
+def test_validate_validation_mode(data):
+    """Tests Validating Validation Mode."""
+
+    value, mode = data
+    assert validate_validation_mode(value) == mode
+
+
+@mark.parametrize(
+    "data",
+    [1, None, "partial", ValidationMode.FULL],
+)
+def test_invalidate_validation_mode(data):
+    """Tests Invalidates Validation Mode."""
+
+    with raises(ApplicationError):
+        validate_validation_mode(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0.1", "1", 0.5],
+)
+def test_validate_validation_sample_rate(data):
+    """Tests Validating Validation Sample Rate."""
+
+    assert validate_validation_sample_rate(data) == float(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0", "1.5", -0.1, "rate", None],
+)
+def test_invalidate_validation_sample_rate(data):
+    """Tests Invalidates Validation Sample Rate."""
+
+    with raises(ApplicationError):
+        validate_validation_sample_rate(data)
+
+
+@mark.parametrize(
+    "data",
+    ["1024", 1, "5"],
+)
+def test_validate_cache_size(data):
+    """Tests Validating Cache Size."""
+
+    assert validate_cache_size(data) == int(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0", -1, "size", None],
+)
+def test_invalidate_cache_size(data):
+    """Tests Invalidates Cache Size."""
+
+    with raises(ApplicationError):
+        validate_cache_size(data)
+
+
+@mark.parametrize(
+    "data",
+    ["300", 0.5, "60.0"],
+)
+def test_validate_cache_ttl(data):
+    """Tests Validating Cache TTL."""
+
+    assert validate_cache_ttl(data) == float(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0", -1.0, "ttl", None],
+)
+def test_invalidate_cache_ttl(data):
+    """Tests Invalidates Cache TTL."""
+
+    with raises(ApplicationError):
+        validate_cache_ttl(data)
+
+
+@mark.parametrize(
+    "data",
+    ["14", 1, "20"],
+)
+def test_validate_kdf_cost(data):
+    """Tests Validating Password KDF Cost."""
+
+    assert validate_kdf_cost(data) == int(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0", 21, "cost", None],
+)
+def test_invalidate_kdf_cost(data):
+    """Tests Invalidates Password KDF Cost."""
+
+    with raises(ApplicationError):
+        validate_kdf_cost(data)
+
+
+@mark.parametrize(
+    "data",
+    [[], ["14"], ["12", 10]],
+)
+def test_validate_kdf_costs(data):
+    """Tests Validating Password KDF Costs."""
+
+    assert validate_kdf_costs(data) == [int(cost) for cost in data]
+
+
+@mark.parametrize(
+    "data",
+    ["14", ["0"], ["14", "cost"], None],
+)
+def test_invalidate_kdf_costs(data):
+    """Tests Invalidates Password KDF Costs."""
+
+    with raises(ApplicationError):
+        validate_kdf_costs(data)
+
+
+@mark.parametrize(
+    "data",
+    ["2", 0, "8"],
+)
+def test_validate_kdf_workers(data):
+    """Tests Validating Password KDF Workers."""
+
+    assert validate_kdf_workers(data) == int(data)
+
+
+@mark.parametrize(
+    "data",
+    ["-1", -2, "workers", None],
+)
+def test_invalidate_kdf_workers(data):
+    """Tests Invalidates Password KDF Workers."""
+
+    with raises(ApplicationError):
+        validate_kdf_workers(data)
+
+
+@mark.parametrize(
+    "data",
+    ["32", 1, "128"],
+)
+def test_validate_kdf_max_pending(data):
+    """Tests Validating Password KDF Maximum Pending Callers."""
+
+    assert validate_kdf_max_pending(data) == int(data)
+
+
+@mark.parametrize(
+    "data",
+    ["0", -1, "pending", None],
+)
+def test_invalidate_kdf_max_pending(data):
+    """Tests Invalidates Password KDF Maximum Pending Callers."""
+
+    with raises(ApplicationError):
+        validate_kdf_max_pending(data)
@@ -0,0 +1,41 @@
+"""BlockChain: Testing Block Item Model."""
+
+from pytest import raises
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from models import ENGINE
+from models.blockchain.blocks import Block
+from models.blockchain.items import BlockItem
+from tests.conftest import run_test_teardown
+
+
+def test_block_item_invalid_no_args():
+    """Testing Block Item With Missing Attributes."""
+
+    with Session(ENGINE) as session:
+        with raises(IntegrityError):
+            block_item = BlockItem()
+            session.add(block_item)
+            session.commit()
+
+
+def test_block_item_valid(get_transactions):
+    """Testing a Valid Block Item Constructor, with Required Arguments."""
+
+    with Session(ENGINE) as session:
+        block = Block()
+        for position, transaction in enumerate(get_transactions):
+            block_item = BlockItem()
+            block_item.transaction_id = transaction.id
+            block_item.position = position
+            block.items.append(block_item)
+        session.add(block)
+        session.commit()
+
+        assert [item.position for item in block.items] == [0, 1, 2]
+        assert all(item.block_id == block.id for item in block.items)
+        assert isinstance(block.items[0].to_dict(), dict)
+
+        run_test_teardown([block], session)
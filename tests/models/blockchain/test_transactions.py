@@ -49,3 +49,16 @@ def test_transaction_valid(get_payments):
             assert isinstance(transaction.to_dict(), dict)
 
             run_test_teardown({transaction}, session)
+
+
+def test_transaction_hash(get_transactions):
+    """Testing a Transaction's Content Hash."""
+
+    for transaction in get_transactions:
+        transaction_hash = transaction.to_hash()
+
+        assert len(transaction_hash) == 64
+        assert transaction_hash == transaction.to_hash()
+
+        transaction.amount += 1
+        assert transaction_hash != transaction.to_hash()
@@ -0,0 +1,36 @@
+"""Models: Testing Engine Factory."""
+
+from sqlalchemy import text
+
+from models import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_STATEMENT_TIMEOUT,
+    ENGINE,
+    get_engine,
+)
+
+
+def test_engine_pool():
+    """Testing Engine: Pool Configuration."""
+
+    assert ENGINE.pool.size() == DB_POOL_SIZE
+    assert ENGINE.pool._max_overflow == DB_MAX_OVERFLOW  # pylint: disable=protected-access
+    assert ENGINE.pool._recycle == DB_POOL_RECYCLE  # pylint: disable=protected-access
+    assert ENGINE.pool._pre_ping  # pylint: disable=protected-access
+    assert ENGINE.dialect.executemany_mode is not None
+
+
+def test_engine_statement_timeout():
+    """Testing Engine: Server-Side Statement Timeout."""
+
+    with ENGINE.connect() as connection:
+        timeout = connection.execute(text("SHOW statement_timeout")).scalar_one()
+        assert timeout == f"{DB_STATEMENT_TIMEOUT // 1000}s"
+
+    engine = get_engine(pool_size=1, connect_args={})
+    assert engine.pool.size() == 1
+    with engine.connect() as connection:
+        assert connection.execute(text("SHOW statement_timeout")).scalar_one() == "0"
+    engine.dispose()
@@ -0,0 +1,61 @@
+"""Models: Testing Base Model."""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+from lib.utils.constants.users import DateFormat
+from models.warehouse.cards import Card
+
+
+def get_card(created_date: datetime) -> Card:
+    """Gets an Unsaved Card."""
+
+    card = Card()
+    card.salt_value = uuid4()
+    card.expiration_date = date(2028, 3, 1)
+    card.created_date = created_date
+    return card
+
+
+def test_model_to_dict():
+    """Testing Base Model: To Dict, by Column Type."""
+
+    card = get_card(datetime(2024, 3, 14, 20, 5, 12))
+    data = card.to_dict()
+
+    assert list(data) == [
+        column.name
+        for column in Card.__table__.columns
+        if column.name not in Card.__EXCLUDE_ATTRIBUTES__
+    ]
+    assert data["id"] == str(card.id)
+    assert data["salt_value"] == str(card.salt_value)
+    assert data["expiration_date"] == date(2028, 3, 1).strftime(DateFormat.SHORT.value)
+    assert data["created_date"] == "2024-03-14 20:05:12"
+    assert data["updated_date"] is None
+
+
+def test_model_to_dicts():
+    """Testing Base Model: To Dicts, with a Cached Converter."""
+
+    cards = [get_card(datetime(2024, 3, day)) for day in range(1, 4)]
+    data = Card.to_dicts(cards)
+
+    assert data == [card.to_dict() for card in cards]
+    assert [item["created_date"] for item in data] == [
+        f"2024-03-0{day} 00:00:00" for day in range(1, 4)
+    ]
+    assert Card.__get_converter__() is Card.__get_converter__()
+    assert Card.to_dicts([]) == []
+
+
+def test_model_to_dict_fields():
+    """Testing Base Model: To Dict, Projecting Fields."""
+
+    card = get_card(datetime(2024, 3, 14, 20, 5, 12))
+
+    assert card.to_dict(("id", "created_date")) == {
+        "id": str(card.id),
+        "created_date": "2024-03-14 20:05:12",
+    }
+    assert Card.to_dicts([card], ("salt_value",)) == [{"salt_value": str(card.salt_value)}]
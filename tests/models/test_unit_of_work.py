@@ -0,0 +1,118 @@
+"""Models: Testing Unit of Work."""
+
+from asyncio import gather, run
+from pytest import raises
+from sqlalchemy.orm import Session
+
+from lib.interfaces.exceptions import UserError
+from models import (
+    ASYNC_ENGINE,
+    ENGINE,
+    UNIT_OF_WORK,
+    get_session,
+    on_commit,
+    run_in_unit_of_work,
+    unit_of_work,
+)
+from models.user.users import User
+from serialisers.user.users import UserSerialiser
+from services.authentication import AbstractService
+from tests.conftest import run_test_teardown
+
+
+def test_unit_of_work_commit():
+    """Testing Unit of Work: Single Commit on Exit."""
+
+    with unit_of_work() as connection:
+        with unit_of_work() as nested_connection:
+            assert nested_connection is connection
+        assert UNIT_OF_WORK.get() is connection
+        assert get_session().get_bind() is connection
+
+        response = UserSerialiser().create_user("unit@work.com", "password@test1")
+        user_id = AbstractService.get_public_id(response)
+        assert UserSerialiser().get_user(user_id)
+
+        with Session(ENGINE) as session:
+            query = session.query(User).filter(User.user_id == user_id)
+            assert query.one_or_none() is None
+
+    assert UNIT_OF_WORK.get() is None
+    with Session(ENGINE) as session:
+        user = session.query(User).filter(User.user_id == user_id).one()
+        run_test_teardown([user], session)
+
+
+def test_unit_of_work_rollback():
+    """Testing Unit of Work: Rollback on Error."""
+
+    with raises(UserError):
+        with unit_of_work():
+            response = UserSerialiser().create_user("unit@work.com", "password@test1")
+            user_id = AbstractService.get_public_id(response)
+
+            with raises(UserError):
+                UserSerialiser().create_user("unit@work.com", "password@test1")
+            assert UserSerialiser().get_user(user_id)
+
+            raise UserError("Rollback.")
+
+    assert UNIT_OF_WORK.get() is None
+    with Session(ENGINE) as session:
+        assert session.query(User).filter(User.user_id == user_id).one_or_none() is None
+
+
+def test_unit_of_work_on_commit():
+    """Testing Unit of Work: Callbacks Run once the Outer Transaction Commits."""
+
+    calls = []
+    on_commit(lambda: calls.append("now"))
+    assert calls == ["now"]
+
+    with unit_of_work():
+        with unit_of_work():
+            on_commit(lambda: calls.append("nested"))
+        on_commit(lambda: calls.append("outer"))
+        assert calls == ["now"]
+    assert calls == ["now", "nested", "outer"]
+
+    with raises(UserError):
+        with unit_of_work():
+            on_commit(lambda: calls.append("rolled back"))
+            raise UserError("Rollback.")
+    assert calls == ["now", "nested", "outer"]
+
+    async def run_deferred() -> None:
+        try:
+            await run_in_unit_of_work(on_commit, lambda: calls.append("async"))
+        finally:
+            await ASYNC_ENGINE.dispose()
+
+    run(run_deferred())
+    assert calls == ["now", "nested", "outer", "async"]
+
+
+def test_run_in_unit_of_work():
+    """Testing Unit of Work: Concurrent Operations on the asyncio Engine."""
+
+    def create_user(email: str) -> str:
+        assert UNIT_OF_WORK.get() is not None
+        response = UserSerialiser().create_user(email, "password@test1")
+        user_id = AbstractService.get_public_id(response)
+        assert UserSerialiser().get_user(user_id)
+        return user_id
+
+    async def create_users() -> list[str]:
+        try:
+            return await gather(
+                *[run_in_unit_of_work(create_user, f"async{i}@work.com") for i in range(5)]
+            )
+        finally:
+            await ASYNC_ENGINE.dispose()
+
+    user_ids = run(create_users())
+    assert UNIT_OF_WORK.get() is None
+    with Session(ENGINE) as session:
+        users = session.query(User).filter(User.user_id.in_(user_ids)).all()
+        assert len(users) == 5
+        run_test_teardown(users, session)
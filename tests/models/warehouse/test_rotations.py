@@ -0,0 +1,36 @@
+"""Warehouse: Testing Key Rotation Model."""
+
+from pytest import raises
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+
+from models import ENGINE
+from models.warehouse.rotations import KeyRotation
+from tests.conftest import run_test_teardown
+
+
+def test_key_rotation_invalid_no_args():
+    """Testing Key Rotation With Missing Attributes."""
+
+    with Session(ENGINE) as session:
+        with raises(IntegrityError):
+            key_rotation = KeyRotation()
+            session.add(key_rotation)
+            session.commit()
+
+
+def test_key_rotation_valid():
+    """Testing a Valid Key Rotation Constructor, with Required Arguments."""
+
+    with Session(ENGINE) as session:
+        key_rotation = KeyRotation()
+        key_rotation.table_name = "test.key_rotations"
+        session.add(key_rotation)
+        session.commit()
+
+        assert key_rotation.id is not None
+        assert key_rotation.last_id is None
+        assert key_rotation.rotated_rows == 0
+
+        run_test_teardown([key_rotation], session)
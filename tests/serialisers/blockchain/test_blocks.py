@@ -1,23 +1,24 @@
 """BlockChain: Testing Block Serialiser."""
 
+from datetime import timedelta
+from time import monotonic
+from uuid import UUID
+
 from pytest import mark, raises
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, object_session
 from sqlalchemy.exc import DataError, ProgrammingError
 
-from config import AppConfig
 from lib.interfaces.exceptions import BlockError
 from lib.utils.constants.blocks import BlockType
-from lib.utils.constants.users import Status
-from lib.utils.encryption.cryptography import encrypt_data
-from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.constants.transactions import TransactionStatus
+from lib.utils.encryption.encoders import get_merkle_root
+from models import ENGINE, unit_of_work
 from models.blockchain.blocks import Block
-from models.user.payments import PaymentProfile
-from models.warehouse.cards import Card
 from serialisers.blockchain.blocks import BlockSerialiser
-from models import ENGINE
-from services.authentication import AbstractService
+from serialisers.blockchain.heads import ChainHeadSerialiser
+from services.blockchain import BlockChainService
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.utils import check_invalid_ids, count_queries
 
 
 def test_transaction_blockserialiser_create(get_transactions):
@@ -25,11 +26,15 @@ def test_transaction_blockserialiser_create(get_transactions):
 
     for transaction in get_transactions:
         with Session(ENGINE) as session:
-            block_id = BlockSerialiser().create_block(transaction.id, None)
-            block_id = AbstractService.get_public_id(block_id)
+            block = BlockSerialiser().create_block(transaction.id, None)
             block_data = (
-                session.query(Block).filter(Block.block_id == block_id).one_or_none()
+                session.query(Block)
+                .filter(Block.block_id == block["block_id"])
+                .one_or_none()
             )
+            assert block["block_type"] == block_data.block_type
+            assert block["merkle_root"] == block_data.merkle_root
+            assert len(block["items"]) == len(block_data.items)
             assert block_data.id is not None
             assert block_data.block_id is not None
             assert block_data.transaction_id is not None
@@ -37,6 +42,11 @@ def test_transaction_blockserialiser_create(get_transactions):
             assert block_data.previous_block_id is None
             assert block_data.next_block_id is None
             assert block_data.block_type == BlockType.TRANSACTION
+            assert block_data.merkle_root == transaction.to_hash()
+            assert block_data.block_hash is None
+            assert [item.transaction_id for item in block_data.items] == [
+                transaction.id
+            ]
 
             run_test_teardown([block_data], session)
 
@@ -45,11 +55,15 @@ def test_contract_blockserialiser_create(get_contracts):
 
     for contract in get_contracts:
         with Session(ENGINE) as session:
-            block_id = BlockSerialiser().create_block(None, contract.id)
-            block_id = AbstractService.get_public_id(block_id)
+            block = BlockSerialiser().create_block(None, contract.id)
             block_data = (
-                session.query(Block).filter(Block.block_id == block_id).one_or_none()
+                session.query(Block)
+                .filter(Block.block_id == block["block_id"])
+                .one_or_none()
             )
+            assert block["block_type"] == block_data.block_type
+            assert block["merkle_root"] == block_data.merkle_root
+            assert len(block["items"]) == len(block_data.items)
             assert block_data.id is not None
             assert block_data.block_id is not None
             assert block_data.transaction_id is None
@@ -57,19 +71,24 @@ def test_contract_blockserialiser_create(get_contracts):
             assert block_data.previous_block_id is None
             assert block_data.next_block_id is None
             assert block_data.block_type == BlockType.CONTRACT
+            assert block_data.merkle_root == contract.to_hash()
 
             run_test_teardown([block_data], session)
 
 def test_unit_blockserialiser_create(get_contracts):
     """Testing Block Serialiser: Create Block."""
 
-    for contract in get_contracts:
+    for _ in get_contracts:
         with Session(ENGINE) as session:
-            block_id = BlockSerialiser().create_block(None, None)
-            block_id = AbstractService.get_public_id(block_id)
+            block = BlockSerialiser().create_block(None, None)
             block_data = (
-                session.query(Block).filter(Block.block_id == block_id).one_or_none()
+                session.query(Block)
+                .filter(Block.block_id == block["block_id"])
+                .one_or_none()
             )
+            assert block["block_type"] == block_data.block_type
+            assert block["merkle_root"] == block_data.merkle_root
+            assert len(block["items"]) == len(block_data.items)
             assert block_data.id is not None
             assert block_data.block_id is not None
             assert block_data.contract_id is None
@@ -172,3 +191,172 @@ def test_block_update_valid_id(get_blocks):
         block_data = session.get(Block, get_blocks[0].id)
         assert block_data.id is not None
         assert block_data.block_type == BlockType.UNIT
+
+
+def test_block_append_blocks(get_chain_head, transaction_blocks):
+    """Testing Block Serialiser: Append Blocks, Linking and Hashing them."""
+
+    blocks = transaction_blocks
+    block_data, previous_block = BlockSerialiser().append_blocks([blocks[0].block_id])
+    assert block_data[0]["block_id"] == str(blocks[0].block_id)
+    assert previous_block is None or previous_block["id"] == str(
+        get_chain_head.block_id
+    )
+    assert BlockSerialiser().get_block(blocks[0].block_id)["next_block_id"] is None
+
+    block_data, previous_block = BlockSerialiser().append_blocks(
+        [block.block_id for block in blocks[1:]]
+    )
+    for block in blocks:
+        object_session(block).expire(block)
+
+    assert previous_block["id"] == str(blocks[0].id)
+    assert [block["block_id"] for block in block_data] == [
+        str(block.block_id) for block in blocks[1:]
+    ]
+    assert [block["block_height"] for block in block_data] == [
+        block.block_height for block in blocks[1:]
+    ]
+    assert blocks[0].next_block_id == blocks[1].id
+    assert blocks[1].previous_block_id == blocks[0].id
+    assert blocks[1].next_block_id == blocks[2].id
+    assert blocks[2].previous_block_id == blocks[1].id
+    assert blocks[2].next_block_id is None
+    for previous, block in zip(blocks, blocks[1:]):
+        assert block.block_height == previous.block_height + 1
+        assert block.previous_block_hash == previous.block_hash
+        assert block.block_hash == BlockSerialiser.get_block_hash(
+            block.block_id, block.merkle_root, previous.block_hash
+        )
+
+
+def test_block_append_blocks_tail(chained_blocks):
+    """Testing Block Serialiser: Append Blocks, Moving the Chain Tail."""
+
+    assert ChainHeadSerialiser().get_chain_tail()["id"] == str(chained_blocks[-1].id)
+    assert ChainHeadSerialiser().get_chain_tail(fields=["id"]) == {
+        "id": str(chained_blocks[-1].id)
+    }
+    with raises(BlockError):
+        BlockSerialiser().append_blocks([chained_blocks[-1].block_id])
+
+
+def test_block_append_blocks_tail_rollback(get_chain_head, transaction_blocks):
+    """Testing Block Serialiser: Rolled Back Appends Leave the Chain Tail."""
+
+    chain_tail = BlockChainService.get_chain_tail().data
+    with raises(BlockError):
+        with unit_of_work():
+            BlockChainService.append_block_chain_batch(
+                [block.block_id for block in transaction_blocks]
+            )
+            raise BlockError("Rolled Back.")
+    assert BlockChainService.get_chain_tail().data == chain_tail
+
+
+def test_block_get_chain_blocks(chained_blocks):
+    """Testing Block Serialiser: Get Chained Blocks after a Height."""
+
+    blocks = chained_blocks
+    chain_blocks = BlockSerialiser().get_chain_blocks(blocks[0].block_height, 5)
+    assert [block["id"] for block in chain_blocks] == [
+        str(block.id) for block in blocks[1:]
+    ]
+    assert BlockSerialiser().get_chain_blocks(blocks[2].block_height, 5) == []
+    assert BlockSerialiser().get_chain_blocks(
+        blocks[0].block_height, 5, fields=["block_height", "block_hash"]
+    ) == [
+        {"block_height": block.block_height, "block_hash": block.block_hash}
+        for block in blocks[1:]
+    ]
+    with raises(BlockError):
+        BlockSerialiser().get_chain_blocks(0, 5, fields=["items"])
+
+
+def test_block_get_item_hashes(get_transactions):
+    """Testing Block Serialiser: Get Blocks' Payload Hashes."""
+
+    blocks = [
+        BlockSerialiser().create_block(transaction.id, None)
+        for transaction in get_transactions
+    ]
+    blocks.append(BlockSerialiser().create_block())
+
+    item_hashes = BlockSerialiser().get_item_hashes(
+        [UUID(block["id"]) for block in blocks]
+    )
+    assert item_hashes == {
+        **{
+            block["id"]: [transaction.to_hash()]
+            for block, transaction in zip(blocks, get_transactions)
+        },
+        blocks[-1]["id"]: [],
+    }
+    for block in blocks[:-1]:
+        assert block["merkle_root"] == get_merkle_root(item_hashes[block["id"]])
+
+    with Session(ENGINE) as session:
+        run_test_teardown([session.get(Block, block["id"]) for block in blocks], session)
+
+
+def test_block_append_blocks_cache(chained_blocks, monkeypatch):
+    """Testing Block Serialiser: Finalised Blocks are Cached without Expiry."""
+
+    block_ids = [block.block_id for block in chained_blocks]
+    assert BlockSerialiser().get_block(block_ids[0])["next_block_id"] == str(
+        chained_blocks[1].id
+    )
+    for block_id in block_ids[1:]:
+        BlockSerialiser().get_block(block_id)
+
+    clock = monotonic() + BlockSerialiser.__CACHE__.get_backend().ttl * 2
+    monkeypatch.setattr("lib.utils.caching.cache.monotonic", lambda: clock)
+    with count_queries() as statements:
+        for block_id in block_ids:
+            BlockSerialiser().get_block(block_id)
+    assert len(statements) == 1
+
+
+def test_block_append_blocks_invalid(get_blocks):
+    """Testing Block Serialiser: Append Blocks."""
+
+    with raises(BlockError):
+        BlockSerialiser().append_blocks([])
+    with raises(BlockError):
+        BlockSerialiser().append_blocks([get_blocks[0].block_id] * 2)
+    with raises(BlockError):
+        BlockSerialiser().append_blocks([block.block_id for block in get_blocks])
+
+
+def test_block_pack_block(get_transactions):
+    """Testing Block Serialiser: Pack Block."""
+
+    approved = [
+        str(transaction.id)
+        for transaction in get_transactions
+        if transaction.transaction_status == TransactionStatus.APPROVED
+    ]
+    assert (
+        BlockSerialiser().pack_block(BlockType.TRANSACTION, 10**6, timedelta(weeks=10**4))
+        is None
+    )
+
+    block_data = BlockSerialiser().pack_block(BlockType.TRANSACTION, 10**6, timedelta(0))
+    assert block_data["block_type"] == BlockType.TRANSACTION
+    assert block_data["transaction_id"] is None
+    item_ids = [item["transaction_id"] for item in block_data["items"]]
+    assert [item_id for item_id in item_ids if item_id in approved] == approved
+    assert block_data["merkle_root"] == get_merkle_root(
+        BlockSerialiser().get_item_hashes([UUID(block_data["id"])])[block_data["id"]]
+    )
+    assert BlockSerialiser().pack_block(BlockType.TRANSACTION, 1, timedelta(0)) is None
+
+    with Session(ENGINE) as session:
+        run_test_teardown([session.get(Block, block_data["id"])], session)
+
+
+def test_block_pack_block_invalid():
+    """Testing Block Serialiser: Pack Block."""
+
+    with raises(BlockError):
+        BlockSerialiser().pack_block(BlockType.UNIT, 100, timedelta(0))
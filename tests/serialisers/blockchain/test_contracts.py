@@ -8,10 +8,9 @@ from sqlalchemy.exc import DataError, ProgrammingError
 from lib.interfaces.exceptions import ContractError
 from lib.utils.constants.contracts import ContractStatus
 from lib.utils.encryption.cryptography import encrypt_data
+from models import ENGINE
 from models.blockchain.contracts import Contract
 from serialisers.blockchain.contracts import ContractSerialiser
-from models import ENGINE
-from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
 from tests.test_utils.utils import check_invalid_ids
 
@@ -38,13 +37,15 @@ def test_contractserialiser_create(get_payments, data):
             contract = ContractSerialiser().create_contract(
                 payment.id, payment1.id, data
             )
-            contract_id = AbstractService.get_public_id(contract)
+            contract_data = contract
             contract = (
                 session.query(Contract)
-                .filter(Contract.contract_id == contract_id)
+                .filter(Contract.contract_id == contract_data["contract_id"])
                 .one_or_none()
             )
             assert contract.id is not None
+            assert contract_data["id"] == str(contract.id)
+            assert contract_data["created_date"] is not None
             assert contract.contract == data
 
             run_test_teardown([contract], session)
@@ -0,0 +1,53 @@
+"""BlockChain: Testing Chain Head Serialiser."""
+
+from pytest import mark
+from sqlalchemy.orm import Session
+
+from models import ENGINE
+from models.blockchain.heads import ChainHead
+from serialisers.blockchain.heads import ChainHeadSerialiser
+
+
+def test_chainheadserialiser_get(get_chain_head):
+    """Testing Chain Head Serialiser: Get Chain Head."""
+
+    chain_head = ChainHeadSerialiser().get_chain_head()
+
+    assert isinstance(chain_head, dict)
+    assert chain_head["id"] == str(get_chain_head.id)
+    assert chain_head["chain_id"] == "main"
+
+
+def test_chainheadserialiser_lock(get_chain_head):
+    """Testing Chain Head Serialiser: Lock Chain Head."""
+
+    with Session(ENGINE) as session:
+        chain_head = ChainHeadSerialiser.lock_chain_head(session)
+
+        assert isinstance(chain_head, ChainHead)
+        assert chain_head.id == get_chain_head.id
+        assert session.query(ChainHead).count() == 1
+        session.rollback()
+
+
+def test_chainheadserialiser_get_tail(get_chain_head):
+    """Testing Chain Head Serialiser: Get Chain Tail."""
+
+    chain_tail = ChainHeadSerialiser().get_chain_tail()
+
+    if get_chain_head.block_id is None:
+        assert chain_tail is None
+    else:
+        assert chain_tail["id"] == str(get_chain_head.block_id)
+
+
+@mark.usefixtures("get_chain_head")
+def test_chainheadserialiser_update_checkpoint(get_blocks):
+    """Testing Chain Head Serialiser: Update Chain Checkpoint."""
+
+    response = ChainHeadSerialiser().update_chain_checkpoint(get_blocks[0].id, 5)
+    chain_head = ChainHeadSerialiser().get_chain_head()
+
+    assert response == "Chain ID: main"
+    assert chain_head["verified_block_id"] == str(get_blocks[0].id)
+    assert chain_head["verified_height"] == 5
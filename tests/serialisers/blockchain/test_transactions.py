@@ -6,12 +6,11 @@ from sqlalchemy.exc import DataError, ProgrammingError
 
 from lib.interfaces.exceptions import TransactionError
 from lib.utils.constants.transactions import TransactionStatus
+from models import ENGINE, unit_of_work
 from models.blockchain.transactions import Transaction
 from serialisers.blockchain.transactions import TransactionSerialiser
-from models import ENGINE
-from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.utils import check_invalid_ids, count_queries
 
 
 @mark.parametrize("data", [50.0, 55.5, 1234656.02])
@@ -23,13 +22,15 @@ def test_transactionserialiser_create(get_payments, data):
             transaction = TransactionSerialiser().create_transaction(
                 payment.id, payment1.id, data
             )
-            transaction_id = AbstractService.get_public_id(transaction)
+            transaction_data = transaction
             transaction = (
                 session.query(Transaction)
-                .filter(Transaction.transaction_id == transaction_id)
+                .filter(Transaction.transaction_id == transaction_data["transaction_id"])
                 .one_or_none()
             )
             assert transaction.id is not None
+            assert transaction_data["id"] == str(transaction.id)
+            assert transaction_data["created_date"] is not None
             assert transaction.amount == data
 
             run_test_teardown([transaction], session)
@@ -46,6 +47,47 @@ def test_transactioner_create_invalid(data):
         TransactionSerialiser().create_transaction(data[0], data[1], data[1])
 
 
+def test_transactionserialiser_create_bulk(get_payments):
+    """Testing transaction Serialiser: Create transactions (Bulk)."""
+
+    data = [
+        (payment.id, payment1.id, amount)
+        for payment, payment1 in zip(get_payments, list(reversed(get_payments)))
+        for amount in (50.0, 55.5)
+    ]
+    transactions_data = TransactionSerialiser().create_transactions_bulk(data)
+    assert len(transactions_data) == len(data)
+
+    with Session(ENGINE) as session:
+        transactions = []
+        for transaction_data, (sender, receiver, amount) in zip(transactions_data, data):
+            transaction = session.get(Transaction, transaction_data["id"])
+            assert transaction.sender == sender
+            assert transaction.receiver == receiver
+            assert transaction.amount == amount
+            assert transaction.transaction_status == TransactionStatus.DRAFT
+            assert transaction_data["created_date"] is not None
+            transactions.append(transaction)
+        assert len({transaction.salt_value for transaction in transactions}) == len(data)
+
+        run_test_teardown(transactions, session)
+
+
+def test_transactionserialiser_create_bulk_invalid(get_payments):
+    """Testing transaction Serialiser: Create transactions (Bulk)."""
+
+    with raises(TransactionError):
+        TransactionSerialiser().create_transactions_bulk([])
+    with raises(TransactionError):
+        TransactionSerialiser().create_transactions_bulk(
+            [(get_payments[0].id, get_payments[1].id, -50.0)]
+        )
+    with raises(TransactionError):
+        TransactionSerialiser().create_transactions_bulk(
+            [(get_payments[0].id, get_payments[0].card_id, 50.0)]
+        )
+
+
 def test_transactionileserialiser_get(get_transactions):
     """Testing transaction Serialiser: Get transaction."""
 
@@ -59,6 +101,61 @@ def test_transactionileserialiser_get(get_transactions):
             assert key not in transaction.__EXCLUDE_ATTRIBUTES__
 
 
+def test_transactionserialiser_get_cached(get_transactions):
+    """Testing transaction Serialiser: Get transaction, Read Through the Cache."""
+
+    cache = TransactionSerialiser.__CACHE__
+    for transaction in get_transactions:
+        transaction_id, private_id = transaction.transaction_id, transaction.id
+        signitures = (transaction.sender_signiture, transaction.receiver_signiture)
+        cache.invalidate(str(transaction_id))
+        cache.reset_stats()
+
+        with count_queries() as statements:
+            transaction_data = TransactionSerialiser().get_transaction(transaction_id)
+            assert TransactionSerialiser().get_transaction(transaction_id) == transaction_data
+            assert TransactionSerialiser().get_transaction(
+                transaction_id, fields=["amount"]
+            ) == {"amount": transaction_data["amount"]}
+        assert len(statements) == 1
+        assert cache.stats == {"hits": 2, "misses": 1}
+
+        if transaction.transaction_status == TransactionStatus.DRAFT:
+            TransactionSerialiser().update_transaction(private_id, *signitures, amount=7.5)
+            assert TransactionSerialiser().get_transaction(transaction_id)["amount"] == 7.5
+        TransactionSerialiser().delete_transaction(private_id)
+        with raises(TransactionError):
+            TransactionSerialiser().get_transaction(transaction_id)
+
+
+def test_transactionserialiser_update_unit_of_work(get_transactions):
+    """Testing transaction Serialiser: Invalidate the Cache once Committed."""
+
+    cache = TransactionSerialiser.__CACHE__
+    for transaction in get_transactions:
+        if transaction.transaction_status != TransactionStatus.DRAFT:
+            continue
+        transaction_id = str(transaction.transaction_id)
+        signitures = (transaction.sender_signiture, transaction.receiver_signiture)
+        amount = TransactionSerialiser().get_transaction(transaction_id)["amount"]
+
+        with raises(TransactionError):
+            with unit_of_work():
+                TransactionSerialiser().update_transaction(
+                    transaction.id, *signitures, amount=7.5
+                )
+                raise TransactionError("Rollback.")
+        assert cache.get(transaction_id)["amount"] == amount
+
+        with unit_of_work():
+            TransactionSerialiser().update_transaction(
+                transaction.id, *signitures, amount=7.5
+            )
+            assert cache.get(transaction_id)["amount"] == amount
+        assert cache.get(transaction_id) is None
+        assert TransactionSerialiser().get_transaction(transaction_id)["amount"] == 7.5
+
+
 @mark.parametrize(
     "data",
     check_invalid_ids(),
@@ -0,0 +1,109 @@
+"""Serialisers: Testing Base Serialiser."""
+
+from uuid import UUID, uuid4
+
+from pytest import mark, raises
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from lib.interfaces.exceptions import AccountError, TransactionError
+from lib.utils.constants.users import Status
+from lib.validators.users import validate_status
+from models import ENGINE
+from models.blockchain.blocks import Block
+from models.blockchain.contracts import Contract
+from models.blockchain.transactions import Transaction
+from models.user.payments import PaymentProfile
+from models.user.profiles import UserProfile
+from models.user.settings import SettingsProfile
+from models.user.users import User
+from models.warehouse.cards import Card
+from models.warehouse.logins import LoginHistory
+from serialisers.serialiser import BaseSerialiser
+from serialisers.user.accounts import AccountSerialiser
+from serialisers.blockchain.transactions import TransactionSerialiser
+
+
+def test_serialiser_column_metadata():
+    """Testing Base Serialiser: Column Meta-Data Registry."""
+
+    columns = AccountSerialiser.__COLUMN_METADATA__
+    assert set(columns) == {column.name for column in AccountSerialiser.__table__.columns}
+    assert columns["status"].python_type is Status
+    assert columns["status"].validator is validate_status
+    assert columns["user_id"].python_type is UUID
+    assert AccountSerialiser().__get_column_data__("status") is columns["status"]
+    with raises(AccountError):
+        AccountSerialiser().__get_column_data__("invalid")
+
+
+def test_serialiser_mutable_kwargs():
+    """Testing Base Serialiser: Mutable Kwargs are Frozen Sets."""
+
+    assert AccountSerialiser.__MUTABLE_KWARGS__ == frozenset({"status"})
+    assert isinstance(TransactionSerialiser.__MUTABLE_KWARGS__, frozenset)
+
+
+def test_serialiser_validate_many():
+    """Testing Base Serialiser: Validate Many."""
+
+    assert AccountSerialiser().validate_many({"status": Status.ACTIVE}) == {
+        "status": Status.ACTIVE
+    }
+    assert AccountSerialiser().validate_many({}) == {}
+
+
+def test_serialiser_validate_many_invalid():
+    """Testing Base Serialiser: Validate Many, Invalid Kwargs."""
+
+    with raises(AccountError, match="Invalid Account."):
+        AccountSerialiser().validate_many({"user_id": None})
+    with raises(AccountError, match="Invalid Type for this Attribute."):
+        AccountSerialiser().validate_many({"status": "ACTIVE"})
+    with raises(AccountError, match="Non-Nullable Attribute."):
+        AccountSerialiser().validate_many({"status": None})
+    with raises(TransactionError, match="Invalid Transaction."):
+        TransactionSerialiser().validate_many({"sender_id": None})
+
+
+@mark.parametrize(
+    "column",
+    [
+        Block.block_id,
+        Block.transaction_id,
+        Block.contract_id,
+        Transaction.transaction_id,
+        Contract.contract_id,
+        PaymentProfile.payment_id,
+        UserProfile.profile_id,
+        SettingsProfile.settings_id,
+        LoginHistory.login_id,
+        Card.card_id,
+        User.user_id,
+    ],
+)
+def test_serialiser_match_id_index_scan(column):
+    """Testing Base Serialiser: Public ID Lookups use an Index Scan."""
+
+    query = select(column.class_).filter(
+        BaseSerialiser.__match_id__(column, str(uuid4()))
+    )
+    statement = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with Session(ENGINE) as session:
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = session.execute(text(f"EXPLAIN {statement}")).scalars().all()
+
+    assert "Index" in plan[0]
+    assert "Seq Scan" not in " ".join(plan)
+
+
+@mark.parametrize("data", ["Invalid ID String.", 1, None])
+def test_serialiser_match_id_invalid(data):
+    """Testing Base Serialiser: Uncoercible IDs Match no Rows."""
+
+    with Session(ENGINE) as session:
+        query = select(Block).filter(BaseSerialiser.__match_id__(Block.block_id, data))
+        assert session.execute(query).scalar_one_or_none() is None
@@ -1,18 +1,24 @@
 """User: Testing Accounts Serialiser."""
 
-from uuid import uuid4
 from pytest import mark, raises
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import DataError, ProgrammingError
 
 from lib.interfaces.exceptions import AccountError, UserError
+from lib.utils.constants.serialisers import LoadStrategy
 from lib.utils.constants.users import Status
+from models import ENGINE
 from models.user.accounts import Account
 from serialisers.user.accounts import AccountSerialiser
-from models import ENGINE
 from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.users import (
+    create_cards,
+    create_payment_profiles,
+    create_settings,
+    create_user_profiles,
+)
+from tests.test_utils.utils import check_invalid_ids, count_queries, setup_test_commit
 
 
 def test_accountprofileserialiser_create(get_users):
@@ -54,6 +60,78 @@ def test_accountprofileserialiser_get(get_accounts):
             assert key not in Account.__EXCLUDE_ATTRIBUTES__
 
 
+def test_accountprofileserialiser_get_include(get_payments):
+    """Testing Account Serialiser: Get Account, Eager-Loading Relationships."""
+
+    with Session(ENGINE) as session:
+        for payment in get_payments:
+            account = session.get(Account, payment.account_id)
+            with count_queries() as statements:
+                account_data = AccountSerialiser().get_account(account.account_id)
+            assert len(statements) == 1
+            assert [item["id"] for item in account_data["payment_profiles"]] == [
+                str(payment.id)
+            ]
+            assert account_data["user_profiles"] == []
+            assert account_data["settings_profile"] == []
+
+            include = {"payment_profiles": LoadStrategy.SELECTIN}
+            with count_queries() as statements:
+                account_data = AccountSerialiser().get_account(
+                    account.account_id, include=include
+                )
+            assert len(statements) == 2
+            assert len(account_data["payment_profiles"]) == 1
+            assert "user_profiles" not in account_data
+
+            with count_queries() as statements:
+                account_data = AccountSerialiser().get_account(
+                    account.account_id, include=()
+                )
+            assert len(statements) == 1
+            assert "payment_profiles" not in account_data
+
+
+def test_accountprofileserialiser_get_include_many(get_accounts):
+    """Testing Account Serialiser: Get Account, with Several Related Rows."""
+
+    account = get_accounts[0]
+    with Session(ENGINE) as session:
+        cards = create_cards()
+        setup_test_commit(cards, session)
+        payments = create_payment_profiles(
+            [account.id] * len(cards), [card.id for card in cards]
+        )
+        profiles = create_user_profiles([account.id] * 3)
+        settings = create_settings([account.id] * 2)
+        setup_test_commit([*payments, *profiles, *settings], session)
+
+        with count_queries() as statements:
+            account_data = AccountSerialiser().get_account(account.account_id)
+        assert len(statements) == 1
+        for name, models in [
+            ("payment_profiles", payments),
+            ("user_profiles", profiles),
+            ("settings_profile", settings),
+        ]:
+            assert sorted(item["id"] for item in account_data[name]) == sorted(
+                str(model.id) for model in models
+            )
+
+        run_test_teardown([*payments, *profiles, *settings, *cards], session)
+
+
+@mark.parametrize(
+    "data", [["profiles"], {"user_profiles": "joined"}, {"status": LoadStrategy.JOINED}]
+)
+def test_accountprofileserialiser_get_include_invalid(get_accounts, data):
+    """Testing Account Serialiser: Get Account, Invalid Include Spec."""
+
+    for account in get_accounts:
+        with raises(AccountError):
+            AccountSerialiser().get_account(account.account_id, include=data)
+
+
 @mark.parametrize("data", check_invalid_ids())
 def test_accountprofileserialiser_get_invalid(data):
     """Testing Account Serialiser: Get Account."""
@@ -1,16 +1,15 @@
 """User: Testing Payments Profile Serialiser."""
 
-from uuid import uuid4
 from pytest import mark, raises
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import DataError, ProgrammingError
 
+from lib.interfaces.exceptions import PaymentProfileError
 from lib.utils.constants.users import Status
+from models import ENGINE
 from models.user.accounts import Account
 from models.user.payments import PaymentProfile
 from serialisers.user.payments import PaymentProfileSerialiser
-from lib.interfaces.exceptions import PaymentProfileError
-from models import ENGINE
 from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
 from tests.test_utils.utils import check_invalid_ids
@@ -2,12 +2,8 @@
 
 from base64 import b64encode
 from datetime import date
-from re import compile as regex_compile
-from uuid import uuid4
 
 from pytest import mark, raises
-from services.authentication import AbstractService
-from tests.test_utils.utils import generate_socials, check_invalid_ids
 from sqlalchemy import cast, String
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import DataError, ProgrammingError
@@ -22,10 +18,12 @@ from lib.utils.constants.users import (
     SocialMediaLink,
     Status,
 )
+from models import ENGINE
 from models.user.profiles import UserProfile
 from serialisers.user.profiles import UserProfileSerialiser
-from models import ENGINE
+from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
+from tests.test_utils.utils import generate_socials, check_invalid_ids, count_queries
 
 
 def __read_file__():
@@ -69,6 +67,31 @@ def test_userprofileserialiser_get(get_profiles):
             assert key not in UserProfile.__EXCLUDE_ATTRIBUTES__
 
 
+def test_userprofileserialiser_get_fields(get_profiles):
+    """Testing UserProfile Serialiser: Get UserProfile, Projecting Fields."""
+
+    for profile in get_profiles:
+        profile_id = profile.profile_id
+        with count_queries() as statements:
+            user_profile_data = UserProfileSerialiser().get_user_profile(
+                profile_id, fields=["username"]
+            )
+
+        assert user_profile_data == {"username": profile.username}
+        assert len(statements) == 1
+        assert "profile_picture" not in statements[0]
+        assert "social_media_links" not in statements[0]
+
+
+@mark.parametrize("data", [[], ["password"], ["username", "account"]])
+def test_userprofileserialiser_get_fields_invalid(get_profiles, data):
+    """Testing UserProfile Serialiser: Get UserProfile, Invalid Fields."""
+
+    for profile in get_profiles:
+        with raises(UserProfileError):
+            UserProfileSerialiser().get_user_profile(profile.profile_id, fields=data)
+
+
 @mark.parametrize("data", check_invalid_ids())
 def test_userprofileserialiser_get_kwargs_invalid(data):
     """Testing UserProfile Serialiser: Create UserProfile."""
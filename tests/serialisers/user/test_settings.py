@@ -10,13 +10,12 @@ from lib.utils.constants.users import (
     Communication,
     DataSharingPreference,
     ProfileVisibility,
-    Status,
     Theme,
     Verification,
 )
+from models import ENGINE
 from models.user.settings import SettingsProfile
 from serialisers.user.settings import SettingsProfileSerialiser
-from models import ENGINE
 from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
 from tests.test_utils.utils import check_invalid_ids
@@ -1,6 +1,7 @@
 """User: Testing User Serialiser."""
 
 import json
+from asyncio import run
 from uuid import uuid4
 
 from pytest import mark, raises
@@ -8,16 +9,27 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import ProgrammingError, DataError
 
 from config import AppConfig
+from lib.interfaces.data_classes import UserData
 from lib.interfaces.exceptions import UserError
-from lib.utils.constants.users import Status
-from lib.utils.encryption.cryptography import encrypt_data
+from lib.utils.constants.users import Country, LoginMethod, Status
 from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.passwords import PasswordHasher
 from serialisers.user.users import UserSerialiser
-from models import ENGINE
+from models import ENGINE, run_in_unit_of_work
 from models.user.users import User
-from services.authentication import AbstractService
+from services.authentication import (
+    AbstractService,
+    AsyncAuthenticationService,
+    AuthenticationService,
+)
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.utils import check_invalid_ids, count_queries
+
+LOGINS = [
+    ("testc3@test.com", "password123@"),
+    ("test13c@test.com", "password123@1"),
+    ("test23c@test.com", "password123@2"),
+]
 
 
 @mark.parametrize(
@@ -76,6 +88,234 @@ def test_userserialiser_get(get_users):
             assert key not in User.__EXCLUDE_ATTRIBUTES__
 
 
+def test_userserialiser_get_include(get_users):
+    """Testing User Serialiser: Get User, with an Include Spec."""
+
+    for user in get_users:
+        encrypted_user = UserSerialiser().get_user(user.user_id)
+        user_data = json.loads(AppConfig().fernet.decrypt(encrypted_user.encode()))
+        assert user_data["login_history"] == []
+
+        encrypted_user = UserSerialiser().get_user(user.user_id, include=())
+        user_data = json.loads(AppConfig().fernet.decrypt(encrypted_user.encode()))
+        assert "login_history" not in user_data
+
+        with raises(UserError):
+            UserSerialiser().get_user(user.user_id, include=["accounts"])
+
+
+def test_userserialiser_get_by_login(get_users):
+    """Testing User Serialiser: Get User by Login, Keeping Legacy User IDs."""
+
+    for user, (email, password) in zip(get_users, LOGINS):
+        assert user.user_id == get_hash_value(
+            email + password, str(AppConfig().salt_value)
+        )
+        with count_queries() as statements:
+            encrypted_user = UserSerialiser().get_user_by_login(
+                email, password, include=()
+            )
+        user_data = json.loads(AppConfig().fernet.decrypt(encrypted_user.encode()))
+        assert len(statements) == 1
+        assert user_data["user_id"] == user.user_id
+        assert user_data["password"] == user.password
+
+        user_ids = PasswordHasher().get_password_hashes(
+            email + password, str(AppConfig().salt_value)
+        )
+        assert UserSerialiser().get_user_by_login(
+            email, password, include=(), user_ids=user_ids
+        )
+
+
+def test_userserialiser_get_by_login_previous_cost(get_users, monkeypatch):
+    """Testing User Serialiser: Get User by Login, after Raising the KDF Cost."""
+
+    email, password = LOGINS[0]
+    cost = AppConfig().kdf_cost
+    user_id = PasswordHasher().hash_password(
+        email + password, str(AppConfig().salt_value)
+    )
+    with Session(ENGINE) as session:
+        session.get(User, get_users[0].id).user_id = user_id
+        session.commit()
+
+    monkeypatch.setattr(AppConfig, "__KDF_COST__", str(cost - 1))
+    monkeypatch.setattr(AppConfig, "__KDF_PREVIOUS_COSTS__", str(cost))
+    encrypted_user = UserSerialiser().get_user_by_login(email, password, include=())
+    user_data = json.loads(AppConfig().fernet.decrypt(encrypted_user.encode()))
+    assert user_data["user_id"] == user_id
+
+
+@mark.usefixtures("get_users")
+@mark.parametrize(
+    "data",
+    [
+        ("testc3@test.com", "password123@1"),
+        ("test13c@test.com", "password123@"),
+        ("unknown@test.com", "password123@"),
+        ("testc3#test.com", "password123@"),
+        ("testc3@test.com", None),
+    ],
+)
+def test_userserialiser_get_by_login_invalid(data):
+    """Testing User Serialiser: Invalid Get User by Login."""
+
+    with raises(UserError):
+        UserSerialiser().get_user_by_login(data[0], data[1])
+
+
+def test_userserialiser_update_password(get_users):
+    """Testing User Serialiser: Update User, Re-Hashing an Outdated Password."""
+
+    for user, (_, password) in zip(get_users, LOGINS):
+        UserSerialiser().update_password(user.id, password)
+        with Session(ENGINE) as session:
+            upgraded_user = session.get(User, user.id)
+            assert upgraded_user.user_id == user.user_id
+            assert upgraded_user.password == PasswordHasher().hash_password(
+                password, str(user.salt_value)
+            )
+
+        with count_queries() as statements:
+            UserSerialiser().update_password(user.id, password, "scrypt$1$invalid")
+        assert len(statements) == 1
+
+    with raises(UserError):
+        UserSerialiser().update_password(uuid4(), "password123@")
+
+
+def test_userserialiser_update_user_id(get_users):
+    """Testing User Serialiser: Update User, Replacing only a Legacy User ID."""
+
+    for user, (email, password) in zip(get_users, LOGINS):
+        user_id = PasswordHasher().hash_password(
+            email + password, str(AppConfig().salt_value)
+        )
+        UserSerialiser().update_user_id(user.id, user_id)
+        UserSerialiser().update_user_id(user.id, "scrypt$1$invalid")
+        with Session(ENGINE) as session:
+            assert session.get(User, user.id).user_id == user_id
+        assert json.loads(
+            AppConfig().fernet.decrypt(
+                UserSerialiser().get_user_by_login(email, password, include=()).encode()
+            )
+        )["user_id"] == user_id
+
+    with raises(UserError):
+        UserSerialiser().update_user_id(uuid4(), "scrypt$1$invalid")
+
+
+def test_userserialiser_login(get_users, monkeypatch):
+    """Testing User Serialiser: Login, Deriving Hashes without a Connection."""
+
+    checked_out = []
+    derive = PasswordHasher.__derive__
+
+    def record_derive(hasher, jobs):
+        checked_out.append(ENGINE.pool.checkedout())
+        return derive(hasher, jobs)
+
+    monkeypatch.setattr(PasswordHasher, "__derive__", record_derive)
+    user, (email, password) = get_users[0], LOGINS[0]
+    idle = ENGINE.pool.checkedout()
+    response = AuthenticationService().login_user(
+        email,
+        password,
+        UserData(
+            login={
+                "email": None,
+                "password": None,
+                "login_location": Country.ALBANIA,
+                "login_device": "Test Device",
+                "login_method": LoginMethod.EMAIL,
+            }
+        ),
+    )
+    user_id = PasswordHasher().hash_password(
+        email + password, str(AppConfig().salt_value)
+    )
+    assert response.data["id"] == user_id
+    assert checked_out == [idle, idle]
+
+    with Session(ENGINE) as session:
+        upgraded_user = session.get(User, user.id)
+        assert upgraded_user.user_id == user_id
+        assert upgraded_user.password == PasswordHasher().hash_password(
+            password, str(user.salt_value)
+        )
+
+
+def test_userserialiser_login_async(get_users):
+    """Testing User Serialiser: Async Login, Upgrading the Password and User ID."""
+
+    user, (email, password) = get_users[0], LOGINS[0]
+    response = run(
+        AsyncAuthenticationService().login_user(
+            email,
+            password,
+            UserData(
+                login={
+                    "email": None,
+                    "password": None,
+                    "login_location": Country.ALBANIA,
+                    "login_device": "Test Device",
+                    "login_method": LoginMethod.EMAIL,
+                }
+            ),
+        )
+    )
+    user_id = PasswordHasher().hash_password(
+        email + password, str(AppConfig().salt_value)
+    )
+    assert response.data["id"] == user_id
+
+    with Session(ENGINE) as session:
+        upgraded_user = session.get(User, user.id)
+        assert upgraded_user.user_id == user_id
+        assert upgraded_user.password == PasswordHasher().hash_password(
+            password, str(user.salt_value)
+        )
+
+
+def test_userserialiser_verify_token_async(get_users, monkeypatch):
+    """Testing User Serialiser: Async Token Verification, from the Session Store."""
+
+    _, (email, password) = get_users[0], LOGINS[0]
+    token = run(
+        AsyncAuthenticationService().login_user(
+            email,
+            password,
+            UserData(
+                login={
+                    "email": None,
+                    "password": None,
+                    "login_location": Country.ALBANIA,
+                    "login_device": "Test Device",
+                    "login_method": LoginMethod.EMAIL,
+                }
+            ),
+        )
+    ).data["token"]
+
+    units_of_work = []
+    async def record_unit_of_work(function, *args, **kwargs):
+        units_of_work.append(function)
+        return await run_in_unit_of_work(function, *args, **kwargs)
+
+    monkeypatch.setattr(
+        "services.authentication.run_in_unit_of_work", record_unit_of_work
+    )
+    claims = run(AsyncAuthenticationService().verify_token(token)).data
+    assert not units_of_work
+
+    AuthenticationService.__SESSIONS__.clear()
+    assert run(AsyncAuthenticationService().verify_token(token)).data == claims
+    assert len(units_of_work) == 1
+    assert run(AsyncAuthenticationService().verify_token(token)).data == claims
+    assert len(units_of_work) == 1
+
+
 @mark.parametrize("data", check_invalid_ids())
 def test_userserialiser_get_invalid(data):
     """Testing User Serialiser: Invalid Get User."""
@@ -116,7 +356,9 @@ def test_userserialiser_update_valid(get_users, data):
             user = session.get(User, user.id)
 
             assert user.id is not None
-            assert user.password == str(get_hash_value(data[0], str(user.salt_value)))
+            assert user.password == PasswordHasher().hash_password(
+                data[0], str(user.salt_value)
+            )
             assert user.status == data[1]
 
 
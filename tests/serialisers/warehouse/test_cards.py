@@ -1,24 +1,23 @@
 """Warehouse: Testing Card Serialiser."""
 
-from datetime import date
 import json
-from re import compile as regex_regex_compile
-import sys
 
 from pytest import mark, raises
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import DataError, ProgrammingError
 
 from config import AppConfig
-from lib.utils.encryption.encoders import get_hash_value
-from serialisers.warehouse.cards import CardSerialiser
 from lib.interfaces.exceptions import CardValidationError, UserError
+from lib.utils.cards.numbers import get_card_number_hash, is_luhn_valid
+from lib.utils.encryption.cryptography import decrypt_data
+from lib.utils.encryption.encoders import get_hash_value
 from lib.utils.constants.users import Status, CardType
 from models import ENGINE
 from models.warehouse.cards import Card
+from serialisers.warehouse.cards import CardSerialiser
 from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.utils import check_invalid_ids, count_queries
 
 
 @mark.parametrize("data", ["199715", "546789", "235968"])
@@ -36,6 +35,89 @@ def test_cardserialiser_create(data):
             run_test_teardown([card_data], session)
 
 
+def test_cardserialiser_create_pooled():
+    """Testing Card Serialiser: Create Card, from the Card Number Pool."""
+
+    CardSerialiser.generate_card(CardType.CREDIT)
+    with count_queries() as statements:
+        card = CardSerialiser().create_card(CardType.CREDIT, "199715")
+    assert statements[0].startswith("INSERT INTO warehouse.cards")
+
+    with Session(ENGINE) as session:
+        card_id = AbstractService.get_public_id(card)
+        card_data = session.query(Card).filter(Card.card_id == card_id).one()
+        card_number = decrypt_data(card_data.card_number)
+        assert is_luhn_valid(card_number)
+        assert card_data.card_number_hash == get_card_number_hash(card_number)
+        run_test_teardown([card_data], session)
+
+
+def test_cardserialiser_create_conflict(monkeypatch):
+    """Testing Card Serialiser: Create Card, Redrawing a Number Issued Elsewhere."""
+
+    card = CardSerialiser().create_card(CardType.CREDIT, "199715")
+    with Session(ENGINE) as session:
+        issued = session.query(Card).filter(
+            Card.card_id == AbstractService.get_public_id(card)
+        ).one()
+        issued_number = (decrypt_data(issued.card_number), issued.card_number_hash)
+
+        generate_card = CardSerialiser.generate_card
+        draws = [issued_number]
+        monkeypatch.setattr(
+            CardSerialiser,
+            "generate_card",
+            staticmethod(lambda card_type: draws.pop() if draws else generate_card(card_type)),
+        )
+        card = CardSerialiser().create_card(CardType.CREDIT, "546789")
+        assert not draws
+        card_data = session.query(Card).filter(
+            Card.card_id == AbstractService.get_public_id(card)
+        ).one()
+        assert card_data.card_number_hash != issued.card_number_hash
+
+        monkeypatch.setattr(
+            CardSerialiser, "generate_card", staticmethod(lambda card_type: issued_number)
+        )
+        with raises(CardValidationError):
+            CardSerialiser().create_card(CardType.CREDIT, "235968")
+        run_test_teardown([issued, card_data], session)
+
+
+def test_cardserialiser_create_bulk():
+    """Testing Card Serialiser: Create Cards in Bulk."""
+
+    pins = ["199715", "546789", "235968"] * 20
+    with count_queries() as statements:
+        card_ids = CardSerialiser().create_cards_bulk(CardType.SAVINGS, len(pins), pins)
+    assert len([item for item in statements if item.startswith("INSERT")]) == 1
+
+    with Session(ENGINE) as session:
+        cards = session.query(Card).filter(Card.card_id.in_(card_ids)).all()
+        assert len(cards) == len(pins)
+        for card in cards:
+            card_number = decrypt_data(card.card_number)
+            cvv_number = decrypt_data(card.cvv_number)
+            assert card.card_type == CardType.SAVINGS
+            assert card.status == Status.NEW
+            assert card.card_number_hash == get_card_number_hash(card_number)
+            assert card.card_id == CardSerialiser.get_card_id(
+                cvv_number, card_number, card.expiration_date
+            )
+        run_test_teardown(cards, session)
+
+
+@mark.parametrize(
+    "data",
+    [(0, []), (2, ["199715"]), ("1", ["199715"]), (1, "199715"), (1, ["1991"])],
+)
+def test_cardserialiser_create_bulk_invalid(data):
+    """Testing Card Serialiser: Create Cards in Bulk."""
+
+    with raises(CardValidationError):
+        CardSerialiser().create_cards_bulk(CardType.SAVINGS, *data)
+
+
 @mark.parametrize("data", [199715, "def1223", "1991"])
 def test_cardserialiser_create_invalid_card_type(data):
     """Testing Card Serialiser: Create Card."""
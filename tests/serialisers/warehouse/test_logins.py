@@ -9,12 +9,12 @@ from sqlalchemy.exc import DataError, ProgrammingError
 
 from lib.interfaces.exceptions import LoginHistoryError
 from lib.utils.constants.users import Country, LoginMethod
+from models import ENGINE
 from models.warehouse.logins import LoginHistory
 from serialisers.warehouse.logins import LoginHistorySerialiser
-from models import ENGINE
 from services.authentication import AbstractService
 from tests.conftest import run_test_teardown
-from tests.test_utils.utils import check_invalid_ids
+from tests.test_utils.utils import check_invalid_ids, count_queries
 
 
 def test_loginhistoryserialiser_create(get_users):
@@ -71,6 +71,51 @@ def test_loginhistoryserialiser_delete(get_logins):
         )
 
 
+def test_loginhistoryserialiser_logout(get_logins):
+    """Testing Login History Serialiser: Log Out a User's Active Logins."""
+
+    for login in get_logins:
+        user_id = login.user_id
+        with count_queries() as statements:
+            assert LoginHistorySerialiser().logout_login_history(user_id) == 1
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE warehouse.login_history")
+
+        with Session(ENGINE) as session:
+            login = session.get(LoginHistory, login.id)
+            assert login.logged_in is False
+            assert login.logout_date is not None
+        assert LoginHistorySerialiser().logout_login_history(user_id) == 0
+
+
+@mark.parametrize("data", check_invalid_ids())
+def test_loginhistoryserialiser_logout_invalid(data):
+    """Testing Login History Serialiser: Log Out Unknown Users."""
+
+    assert LoginHistorySerialiser().logout_login_history(data) == 0
+
+
+def test_loginhistoryserialiser_is_logged_in(get_logins):
+    """Testing Login History Serialiser: Check a Session is Logged In."""
+
+    for login in get_logins:
+        user_id, session_id = login.user_id, uuid4()
+        LoginHistorySerialiser().update_login_history(login.id, session_id=session_id)
+        with count_queries() as statements:
+            assert LoginHistorySerialiser().is_logged_in(session_id) is True
+        assert len(statements) == 1
+
+        LoginHistorySerialiser().logout_login_history(user_id)
+        assert LoginHistorySerialiser().is_logged_in(session_id) is False
+
+
+@mark.parametrize("data", check_invalid_ids())
+def test_loginhistoryserialiser_is_logged_in_invalid(data):
+    """Testing Login History Serialiser: Check Unknown Sessions."""
+
+    assert LoginHistorySerialiser().is_logged_in(data) is False
+
+
 @mark.parametrize("data", check_invalid_ids())
 def test_loginhistoryserialiser_delete_invalid(data):
     """Testing User Serialiser: Invalid Delete User."""
@@ -136,4 +181,4 @@ def test_loginhistoryserialiser_update_invalid(get_logins, data):
 
     for login in get_logins:
         with raises((LoginHistoryError, DataError, ProgrammingError)):
-            LoginHistorySerialiser().update_login_history("login.id", **data)
+            LoginHistorySerialiser().update_login_history(login.id, **data)
@@ -0,0 +1,123 @@
+"""Warehouse: Testing Key Rotation Serialiser."""
+
+from cryptography.fernet import Fernet, InvalidToken
+from pytest import fixture, mark, raises
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from config import AppConfig
+from lib.interfaces.data_classes import UserData
+from lib.interfaces.exceptions import FernetError
+from lib.utils.constants.users import Country, LoginMethod
+from lib.utils.encryption.cryptography import CryptoProvider
+from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.tokens import TokenProvider
+from models import ENGINE
+from models.user.users import User
+from models.warehouse.logins import LoginHistory
+from models.warehouse.rotations import KeyRotation
+from serialisers.warehouse.rotations import KeyRotationSerialiser
+from services.authentication import AuthenticationService
+from services.rotation import KeyRotationService
+from tests.conftest import run_test_teardown
+
+
+@fixture(name="rotate_fernet_key")
+def fixture_rotate_fernet_key(monkeypatch):
+    """Makes a New Fernet Key Current, Retiring the Test Key."""
+
+    previous_key = AppConfig().fernet_keys[0]
+    fernet_key = Fernet.generate_key().decode()
+    monkeypatch.setattr(AppConfig, "__FERNET_KEY__", fernet_key)
+    monkeypatch.setattr(AppConfig, "__FERNET_PREVIOUS_KEYS__", previous_key)
+    CryptoProvider.reset()
+    TokenProvider.reset()
+
+    yield Fernet(fernet_key), Fernet(previous_key)
+
+    monkeypatch.undo()
+    CryptoProvider.reset()
+    TokenProvider.reset()
+    with Session(ENGINE) as session:
+        session.execute(delete(KeyRotation))
+        session.commit()
+
+
+def test_key_rotation_rotate_batch(get_logins, rotate_fernet_key):
+    """Testing Key Rotation Serialiser: Rotate Batch."""
+
+    fernet, previous_fernet = rotate_fernet_key
+    assert KeyRotationSerialiser().rotate_batch("users.users", 2) == 2
+    assert KeyRotationSerialiser().rotate_batch("users.users", 2) == 1
+    assert KeyRotationSerialiser().rotate_batch("users.users", 2) == 0
+    assert KeyRotationSerialiser().rotate_batch("warehouse.cards", 5) == 0
+
+    key_rotation = KeyRotationSerialiser().get_key_rotation("users.users")
+    assert key_rotation["rotated_rows"] == 3
+    assert key_rotation["key_hash"] == get_hash_value(AppConfig().fernet_keys[0])
+
+    with Session(ENGINE) as session:
+        for login in get_logins:
+            user = session.get(User, login.user_id)
+            assert fernet.decrypt(user.email.encode())
+            with raises(InvalidToken):
+                previous_fernet.decrypt(user.email.encode())
+
+
+@mark.usefixtures("rotate_fernet_key")
+def test_key_rotation_rotate_batch_invalid(get_logins):
+    """Testing Key Rotation Serialiser: Rotate Batch."""
+
+    with raises(FernetError):
+        KeyRotationSerialiser().rotate_batch("users.user_profiles", 5)
+    with raises(FernetError):
+        KeyRotationSerialiser().rotate_batch("warehouse.login_history", 5)
+    with raises(FernetError):
+        KeyRotationSerialiser().rotate_batch("users.users", 0)
+    with raises(FernetError):
+        KeyRotationSerialiser().get_key_rotation("users.user_profiles")
+
+    with Session(ENGINE) as session:
+        user = session.get(User, get_logins[0].user_id)
+        user.email = Fernet(Fernet.generate_key()).encrypt(b"Email").decode()
+        session.commit()
+
+    with raises(FernetError):
+        KeyRotationSerialiser().rotate_batch("users.users", 5)
+
+
+def test_key_rotation_after_login(request):
+    """Testing Key Rotation: Rotate every Table after a Login, Keeping its Token."""
+
+    AuthenticationService().register_user("rotate@login.com", "password123@")
+    response = AuthenticationService().login_user(
+        "rotate@login.com",
+        "password123@",
+        UserData(
+            login={
+                "email": None,
+                "password": None,
+                "login_location": Country.ALBANIA,
+                "login_device": "Test Device",
+                "login_method": LoginMethod.EMAIL,
+            }
+        ),
+    )
+    token = response.data["token"]
+
+    fernet, _ = request.getfixturevalue("rotate_fernet_key")
+    rotated_rows = KeyRotationService().rotate_keys().data["rotated_rows"]
+    assert set(rotated_rows) == {"warehouse.cards", "users.users"}
+    assert rotated_rows["users.users"] >= 1
+
+    with Session(ENGINE) as session:
+        login = (
+            session.query(LoginHistory)
+            .filter(LoginHistory.authentication_token == token)
+            .one()
+        )
+        user = session.get(User, login.user_id)
+        assert fernet.decrypt(user.email.encode()) == b"rotate@login.com"
+        claims = AuthenticationService().verify_token(token).data
+        assert claims["session_id"] == str(login.session_id)
+        run_test_teardown([login, user], session)
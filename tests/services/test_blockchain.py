@@ -0,0 +1,96 @@
+"""Services: Testing BlockChain Service."""
+
+from pytest import raises
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from lib.interfaces.exceptions import BlockError
+from lib.utils.encryption.encoders import get_hash_value
+from models import ENGINE
+from models.blockchain.blocks import Block
+from models.blockchain.transactions import Transaction
+from serialisers.blockchain.heads import ChainHeadSerialiser
+from services.blockchain import BlockChainService
+from services.cli import Cli
+
+
+def test_blockchainservice_verify_chain(chained_blocks):
+    """Testing BlockChain Service: Verify Chain, Checkpointing the Tail."""
+
+    checkpoint = chained_blocks[0].block_height
+    response = BlockChainService.verify_chain(checkpoint)
+    assert response.data == {
+        "verified_blocks": 2,
+        "verified_height": chained_blocks[-1].block_height,
+    }
+
+    chain_head = ChainHeadSerialiser().get_chain_head()
+    assert chain_head["verified_block_id"] == str(chained_blocks[-1].id)
+    assert chain_head["verified_height"] == chained_blocks[-1].block_height
+    assert BlockChainService.verify_chain().data == {
+        "verified_blocks": 0,
+        "verified_height": chained_blocks[-1].block_height,
+    }
+
+
+def test_blockchainservice_verify_chain_resume(chained_blocks):
+    """Testing BlockChain Service: Verify Chain from the Verified Height."""
+
+    ChainHeadSerialiser().update_chain_checkpoint(
+        chained_blocks[1].id, chained_blocks[1].block_height
+    )
+    assert BlockChainService.verify_chain().data == {
+        "verified_blocks": 1,
+        "verified_height": chained_blocks[-1].block_height,
+    }
+
+    ChainHeadSerialiser().update_chain_checkpoint(
+        chained_blocks[0].id, chained_blocks[0].block_height
+    )
+    Cli()
+    response = Cli.args_parser(Cli.parser.parse_args(["verify", "-B"]))
+    assert response["data"] == {
+        "verified_blocks": 2,
+        "verified_height": chained_blocks[-1].block_height,
+    }
+
+
+def test_blockchainservice_verify_chain_amount(chained_blocks):
+    """Testing BlockChain Service: Verify Chain, with a Tampered Transaction."""
+
+    with Session(ENGINE) as session:
+        session.execute(
+            update(Transaction)
+            .filter(Transaction.id == chained_blocks[1].transaction_id)
+            .values(amount=Transaction.amount + 1)
+        )
+        session.commit()
+
+    with raises(BlockError):
+        BlockChainService.verify_chain(chained_blocks[0].block_height)
+    chain_head = ChainHeadSerialiser().get_chain_head()
+    assert chain_head["verified_height"] != chained_blocks[-1].block_height
+
+
+def test_blockchainservice_verify_chain_hash(chained_blocks):
+    """Testing BlockChain Service: Verify Chain, with a Tampered Block Hash."""
+
+    with Session(ENGINE) as session:
+        session.execute(
+            update(Block)
+            .filter(Block.id == chained_blocks[-1].id)
+            .values(block_hash=get_hash_value("Tampered Block"))
+        )
+        session.commit()
+
+    with raises(BlockError):
+        BlockChainService.verify_chain(chained_blocks[0].block_height)
+
+
+def test_blockchainservice_verify_chain_invalid(chained_blocks):
+    """Testing BlockChain Service: Verify Chain, from an Invalid Checkpoint."""
+
+    with raises(BlockError):
+        BlockChainService.verify_chain(-1)
+    with raises(BlockError):
+        BlockChainService.verify_chain(chained_blocks[-1].block_height + 1)
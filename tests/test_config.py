@@ -2,9 +2,12 @@
 
 from datetime import datetime, timedelta
 
+from cryptography.fernet import Fernet
 from pytest import raises
 from config import AppConfig
+from lib.interfaces.exceptions import ApplicationError
 from lib.utils.constants.users import DateFormat
+from lib.utils.constants.validations import ValidationMode
 
 
 def test_app_config_str_repr():
@@ -89,3 +92,101 @@ def test_app_config_cvv_length_setter():
 
     with raises(AttributeError):
         AppConfig().cvv_length = 5
+
+
+def test_app_config_fernet_keys():
+    """Test AppConfig Init - Fernet Keys."""
+
+    assert AppConfig().fernet_keys[0] == str(AppConfig.__FERNET_KEY__)
+    assert AppConfig().multi_fernet.decrypt(AppConfig().fernet.encrypt(b"Test")) == b"Test"
+
+
+def test_app_config_fernet_keys_setter():
+    """Test AppConfig Fernet Keys Setter."""
+
+    with raises(AttributeError):
+        AppConfig().fernet_keys = []
+
+
+def test_app_config_card_hash_key(monkeypatch):
+    """Test AppConfig Init - Card Hash Key, Required and Unrelated to Fernet Keys."""
+
+    card_hash_key = AppConfig().card_hash_key
+    assert card_hash_key == str(AppConfig.__CARD_HASH_KEY__)
+    assert card_hash_key not in AppConfig().fernet_keys
+
+    retired_key = str(AppConfig.__FERNET_KEY__)
+    monkeypatch.setattr(AppConfig, "__FERNET_KEY__", Fernet.generate_key().decode())
+    monkeypatch.setattr(AppConfig, "__FERNET_PREVIOUS_KEYS__", retired_key)
+    assert AppConfig().card_hash_key == card_hash_key
+
+    for invalid_key in [None, ""]:
+        monkeypatch.setattr(AppConfig, "__CARD_HASH_KEY__", invalid_key)
+        with raises(ApplicationError):
+            assert AppConfig().card_hash_key
+
+
+def test_app_config_block_size():
+    """Test AppConfig Init - Block Size."""
+
+    assert AppConfig().block_size > 0
+
+
+def test_app_config_block_size_setter():
+    """Test AppConfig Block Size Setter."""
+
+    with raises(AttributeError):
+        AppConfig().block_size = 5
+
+
+def test_app_config_block_interval():
+    """Test AppConfig Init - Block Interval."""
+
+    assert AppConfig().block_interval >= 0
+
+
+def test_app_config_block_interval_setter():
+    """Test AppConfig Block Interval Setter."""
+
+    with raises(AttributeError):
+        AppConfig().block_interval = 5
+
+
+def test_app_config_validation_mode():
+    """Test AppConfig Init - Validation Mode."""
+
+    assert isinstance(AppConfig().validation_mode, ValidationMode)
+
+
+def test_app_config_validation_sample_rate():
+    """Test AppConfig Init - Validation Sample Rate."""
+
+    assert 0 < AppConfig().validation_sample_rate <= 1
+
+
+def test_app_config_validation_mode_setter():
+    """Test AppConfig Validation Mode Setter."""
+
+    with raises(AttributeError):
+        AppConfig().validation_mode = ValidationMode.DISABLED
+
+
+def test_app_config_cache_size():
+    """Test AppConfig Init - Cache Size."""
+
+    assert AppConfig().cache_size > 0
+
+
+def test_app_config_cache_ttl():
+    """Test AppConfig Init - Cache TTL."""
+
+    assert AppConfig().cache_ttl > 0
+
+
+def test_app_config_kdf():
+    """Test AppConfig Init - Password KDF."""
+
+    assert AppConfig().kdf_cost > 0
+    assert isinstance(AppConfig().kdf_previous_costs, list)
+    assert AppConfig().kdf_workers >= 0
+    assert AppConfig().kdf_max_pending > 0
@@ -3,9 +3,10 @@
 from uuid import UUID
 from lib.utils.constants.contracts import ContractStatus
 from lib.utils.constants.transactions import TransactionStatus
-from lib.utils.encryption.encoders import get_hash_value
+from lib.utils.encryption.encoders import get_hash_value, get_merkle_root
 from models.blockchain.blocks import Block
 from models.blockchain.contracts import Contract
+from models.blockchain.items import BlockItem
 from models.blockchain.transactions import Transaction
 
 
@@ -129,3 +130,19 @@ def create_blocks() -> list[Block]:
     for _ in range(3):
         blocks.append(Block())
     return blocks
+
+
+def create_transaction_blocks(transactions: list[Transaction]) -> list[Block]:
+    """Creates Test Blocks, one per Transaction, Sealed as the Block's Item."""
+
+    blocks = []
+    for transaction in transactions:
+        block = Block()
+        item = BlockItem()
+        item.transaction_id = transaction.id
+        item.position = 0
+        block.items.append(item)
+        block.transaction_id = transaction.id
+        block.merkle_root = get_merkle_root([transaction.to_hash()])
+        blocks.append(block)
+    return blocks
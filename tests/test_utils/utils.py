@@ -1,9 +1,13 @@
 """Test-Utils: Configure Utils Module."""
 
+from contextlib import contextmanager
 from uuid import uuid4
-from typing import Any
+from typing import Any, Iterator
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from models import ENGINE
+
 DATA = {
     "GITHUB": "https://github.com/example_username",
     "FACEBOOK": "https://www.facebook.com/example.username",
@@ -50,3 +54,19 @@ def check_invalid_ids() -> list[Any]:
     """Returns a list of invalid ID to Test."""
 
     return [uuid4(), "Invalid ID String.", 1, None]
+
+
+@contextmanager
+def count_queries() -> Iterator[list[str]]:
+    """Records the SQL Statements Executed on the Engine."""
+
+    statements: list[str] = []
+
+    def record(*args) -> None:
+        statements.append(args[2])
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", record)